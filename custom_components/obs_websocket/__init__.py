@@ -3,17 +3,93 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from contextlib import contextmanager
+import copy
 from dataclasses import dataclass
 import logging
 from datetime import timedelta
-from typing import Any
+from functools import partial
+import itertools
+import json
+from pathlib import Path
+import threading
+import time
+from typing import TYPE_CHECKING, Any
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady, HomeAssistantError
+from homeassistant.helpers import config_validation as cv, device_registry as dr
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.helpers.typing import ConfigType
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .const import DOMAIN, HEARTBEAT_INTERVAL, PLATFORMS
+from homeassistant.util import dt as dt_util
+
+from .cache import CLEARING_EVENTS, INVALIDATING_EVENTS, OBSResponseCache
+from .capture import (
+    KIND_BATCH,
+    KIND_EVENT,
+    KIND_REFRESH,
+    KIND_RESPONSE,
+    OBSCapture,
+    response_fields,
+)
+from .clock import OBSStreamClock
+from .const import (
+    BASE_PLATFORMS,
+    CONF_ACTIVE_INTERVAL,
+    CONF_CAPABILITIES,
+    CONF_EVENT_COALESCE_INTERVAL,
+    CONF_EVENT_SUBSCRIPTIONS,
+    CONF_FEATURES,
+    CONF_FORWARD_EVENTS,
+    CONF_HEALTH_BITRATE_DROP,
+    CONF_HEALTH_CONGESTION,
+    CONF_HEALTH_HYSTERESIS,
+    CONF_HEALTH_SKIPPED_RATIO,
+    CONF_IDLE_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    CONF_STATE_THROTTLE,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_EVENT_COALESCE_INTERVAL,
+    DEFAULT_EVENT_SUBSCRIPTIONS,
+    DEFAULT_FEATURES,
+    DEFAULT_FORWARD_EVENTS,
+    DEFAULT_HEALTH_BITRATE_DROP,
+    DEFAULT_HEALTH_CONGESTION,
+    DEFAULT_HEALTH_HYSTERESIS,
+    DEFAULT_HEALTH_SKIPPED_RATIO,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_STATE_THROTTLE,
+    DOMAIN,
+    EVENT_SUBSCRIPTIONS,
+    FEATURE_EVENT_FORWARDING,
+    FEATURE_HOTKEYS,
+    FEATURE_LIVE_STATS,
+    FEATURE_PLATFORMS,
+    FEATURE_STUDIO_MODE,
+    REQUIRED_EVENT_SUBSCRIPTIONS,
+    RESPONSE_CACHE_SIZE,
+)
+from .device_trigger import TRIGGER_EVENTS, async_get_trigger_registry
+from .health import OBSStreamHealth
+from .profiler import async_get_profiler
+from .services import EXECUTION_TYPES, async_setup_services
+from .session import OBSValidatedSession, async_take_session
+from .telemetry import OBSTelemetry
+from .websocket_api import async_setup_websocket_api
+
+if TYPE_CHECKING:
+    from .camera import OBSScreenshotFetcher
+    from .forwarder import OBSEventForwarder
+    from .hotkeys import OBSHotkeyIndex
+    from .statistics import OBSStreamStatistics
+    from .stats import OBSStatsSampler
+    from .studio import OBSStudioState
+
+CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
 
 @dataclass
@@ -22,57 +98,275 @@ class OBSRuntimeData:
 
     connection: OBSConnection
     coordinator: OBSCoordinator
+    forwarder: OBSEventForwarder | None
+    studio: OBSStudioState | None
+    hotkeys: OBSHotkeyIndex | None
+    stats: OBSStatsSampler | None
+    features: frozenset[str]
+    platforms: list[str]
+    # Set up by the camera platform
+    screenshots: OBSScreenshotFetcher | None = None
 
 
 type OBSConfigEntry = ConfigEntry[OBSRuntimeData]
 
 _LOGGER = logging.getLogger(__name__)
 
+# OBS events that change the data fetched by the coordinator; each of
+# them starts or stops an output, so they also mark the output list stale
+REFRESH_EVENTS: set[str] = {
+    "StreamStateChanged",
+    "RecordStateChanged",
+    "ReplayBufferStateChanged",
+    "VirtualcamStateChanged",
+}
+
+# Lowest frame rate assumed when waiting for the sleepFrames of a batch
+SLEEP_MIN_FPS = 10
+
+
+def batch_sleep(requests: Iterable[Mapping[str, Any]]) -> float:
+    """Return how many seconds the Sleep requests of a batch may take."""
+    seconds = 0.0
+    for request in requests:
+        if request.get("requestType") != "Sleep":
+            continue
+        data = request.get("requestData") or {}
+        seconds += data.get("sleepMillis", 0) / 1000
+        seconds += data.get("sleepFrames", 0) / SLEEP_MIN_FPS
+    return seconds
+
+
+def subscription_mask(categories: Iterable[str]) -> int:
+    """Return the eventSubscriptions bit mask of event categories.
+
+    The categories the integration needs itself are always included.
+    """
+    mask = 0
+    for category in (*REQUIRED_EVENT_SUBSCRIPTIONS, *categories):
+        mask |= EVENT_SUBSCRIPTIONS[category]
+    return mask
+
+
+DEFAULT_SUBSCRIPTION_MASK = subscription_mask(DEFAULT_EVENT_SUBSCRIPTIONS)
+TRANSFORM_SUBSCRIPTION = EVENT_SUBSCRIPTIONS["scene_item_transform_changed"]
+
 
 class OBSConnection:
     """Persistent OBS WebSocket connection with event-driven updates."""
 
     def __init__(
-        self, hass: HomeAssistant, host: str, port: int, password: str
+        self,
+        hass: HomeAssistant,
+        host: str,
+        port: int,
+        password: str,
+        capabilities: dict[str, Any] | None = None,
+        *,
+        timeout: float = DEFAULT_REQUEST_TIMEOUT,
+        subscriptions: int = DEFAULT_SUBSCRIPTION_MASK,
     ) -> None:
         self.hass = hass
         self.host = host
         self._port = port
         self._password = password
+        self.timeout = timeout
+        self.subscriptions = subscriptions
         self._req_client: Any | None = None
         self._event_client: Any | None = None
+        self._lock = threading.Lock()
+        self._batch_ids = itertools.count(1)
+        self._listeners: dict[str, list[Callable[[dict[str, Any]], None]]] = {}
+        self._replay_listeners: set[Callable[[dict[str, Any]], None]] = set()
+        self._connect_listeners: list[CALLBACK_TYPE] = []
+        self.cache = OBSResponseCache(RESPONSE_CACHE_SIZE)
+        self.cache.follow_transforms(bool(subscriptions & TRANSFORM_SUBSCRIPTION))
+        self.telemetry = OBSTelemetry()
+        self.capture: OBSCapture | None = None
+        self.profiler = async_get_profiler(hass)
+        # GetVersion result, kept with the entry and refreshed only when the
+        # Hello of a new session reports a different obs-websocket version
+        self.capabilities = capabilities
+        # GetOutputList entries by output name, listed again after output
+        # events, on new sessions and otherwise once per list interval
+        self.outputs: dict[str, dict[str, Any]] = {}
+        self.output_list_interval = float(DEFAULT_IDLE_INTERVAL)
+        self._outputs_listed: float | None = None
+        for event_type in (*INVALIDATING_EVENTS, *CLEARING_EVENTS):
+            self.async_add_listener(
+                event_type, self._async_invalidate(event_type), replay=True
+            )
         self.coordinator: DataUpdateCoordinator[dict[str, Any]] | None = None
 
     @property
     def connected(self) -> bool:
         return self._req_client is not None
 
+    def supports(self, request_type: str) -> bool:
+        """Return whether OBS offers a request, assuming so while unknown."""
+        if not (available := (self.capabilities or {}).get("available_requests")):
+            return True
+        return request_type in available
+
     def _get_kwargs(self) -> dict[str, Any]:
         kwargs: dict[str, Any] = {
             "host": self.host,
             "port": self._port,
-            "timeout": 10,
+            "timeout": self.timeout,
         }
         if self._password:
             kwargs["password"] = self._password
         return kwargs
 
-    async def async_connect(self) -> None:
-        """Create persistent ReqClient and EventClient connections."""
+    async def async_connect(self, session: OBSValidatedSession | None = None) -> None:
+        """Create persistent ReqClient and EventClient connections.
+
+        A session validated by the config flow is adopted as the ReqClient
+        instead of authenticating a new one.
+        """
         conn = self
+        # Imported once per instance in the import executor, so neither
+        # startup nor reconnects import it on the event loop
+        obs = await async_import_module(self.hass, "obsws_python")
 
         def _connect() -> None:
-            import obsws_python as obs
-
-            conn._req_client = obs.ReqClient(**conn._get_kwargs())
+            if session is not None:
+                conn._req_client = session.req_client
+                conn._req_client.base_client.ws.settimeout(conn.timeout)
+            else:
+                conn._req_client = obs.ReqClient(**conn._get_kwargs())
+
+            if session is not None:
+                conn.capabilities = session.version
+            else:
+                hello = conn._req_client.base_client.server_hello["d"]
+                cached = conn.capabilities or {}
+                if cached.get("obs_web_socket_version") != hello.get(
+                    "obsWebSocketVersion"
+                ):
+                    conn.capabilities = response_fields(
+                        conn._req_client.get_version()
+                    )
+
+            class _Router:
+                def trigger(self_: Any, event_type: str, data: dict[str, Any]) -> None:
+                    # Reidentified replies arrive on the event socket too
+                    if event_type is not None:
+                        conn._on_obs_event(event_type, data)
 
             class _Events(obs.EventClient):
-                def on_stream_state_changed(self_: Any, data: Any) -> None:
-                    conn._on_event()
+                def subscribe(self_: Any) -> None:
+                    self_.callback = _Router()
+                    super().subscribe()
 
-            conn._event_client = _Events(**conn._get_kwargs())
+            conn._event_client = _Events(**conn._get_kwargs(), subs=conn.subscriptions)
 
+        start = time.perf_counter()
         await self.hass.async_add_executor_job(_connect)
+        self.telemetry.record_connect(time.perf_counter() - start)
+        # Events may have been missed while disconnected
+        self.cache.clear()
+        self._outputs_listed = None
+        for listener in list(self._connect_listeners):
+            listener()
+
+    async def async_set_timeout(self, timeout: float) -> None:
+        """Change the request timeout, including of the open session."""
+        self.timeout = timeout
+
+        def _set_timeout() -> None:
+            with self._lock:
+                if self._req_client is not None:
+                    self._req_client.base_client.ws.settimeout(timeout)
+
+        await self.hass.async_add_executor_job(_set_timeout)
+
+    async def async_set_subscriptions(self, subscriptions: int) -> None:
+        """Change the event subscriptions, sending Reidentify if connected."""
+        if subscriptions == self.subscriptions:
+            return
+        self.subscriptions = subscriptions
+        self.cache.follow_transforms(bool(subscriptions & TRANSFORM_SUBSCRIPTION))
+        if (event_client := self._event_client) is None:
+            return
+        payload = json.dumps({"op": 3, "d": {"eventSubscriptions": subscriptions}})
+        # The EventClient thread reads the Reidentified reply and skips it
+        await self.hass.async_add_executor_job(
+            event_client.base_client.ws.send, payload
+        )
+
+    @callback
+    def async_add_listener(
+        self,
+        event_type: str,
+        listener: Callable[[dict[str, Any]], None],
+        *,
+        replay: bool = False,
+    ) -> CALLBACK_TYPE:
+        """Listen for an OBS event type; the listener runs in the event loop.
+
+        Replayed captures only reach listeners that pass ``replay=True``.
+        Those must only update state that the replay restores or that is
+        harmless to change, such as entity states and the response cache;
+        listeners that send requests to OBS, edit the entity registry or
+        act outside the integration must not opt in.
+        """
+        self._listeners.setdefault(event_type, []).append(listener)
+        if replay:
+            self._replay_listeners.add(listener)
+
+        @callback
+        def _remove() -> None:
+            listeners = self._listeners[event_type]
+            listeners.remove(listener)
+            if not listeners:
+                del self._listeners[event_type]
+            self._replay_listeners.discard(listener)
+
+        return _remove
+
+    def _async_invalidate(self, event_type: str) -> Callable[[dict[str, Any]], None]:
+        @callback
+        def _invalidate(data: dict[str, Any]) -> None:
+            self.cache.invalidate_for_event(event_type)
+
+        return _invalidate
+
+    @callback
+    def async_add_connect_listener(self, listener: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call listener each time a new session to OBS is established."""
+        self._connect_listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._connect_listeners.remove(listener)
+
+        return _remove
+
+    def _on_obs_event(self, event_type: str, data: dict[str, Any]) -> None:
+        """Route an OBS event from the EventClient thread."""
+        with self.profiler.span("connection.event"):
+            self.telemetry.record_event(event_type)
+            if (capture := self.capture) is not None:
+                capture.write(KIND_EVENT, event_type, data)
+            if event_type in REFRESH_EVENTS:
+                self._outputs_listed = None
+                self._on_event()
+            if event_type in self._listeners:
+                self.hass.loop.call_soon_threadsafe(
+                    self._async_dispatch, event_type, data
+                )
+
+    @callback
+    def _async_dispatch(
+        self, event_type: str, data: dict[str, Any], replayed: bool = False
+    ) -> None:
+        """Dispatch an OBS event to the listeners for its type."""
+        with self.profiler.span("connection.dispatch"):
+            for listener in list(self._listeners.get(event_type, ())):
+                if replayed and listener not in self._replay_listeners:
+                    continue
+                listener(data)
 
     def _on_event(self) -> None:
         """Handle OBS event from EventClient thread."""
@@ -87,26 +381,259 @@ class OBSConnection:
         """Fetch current state using the persistent ReqClient."""
 
         def _fetch() -> dict[str, Any]:
-            status = self._req_client.get_stream_status()
-            service = self._req_client.get_stream_service_settings()
-            return {"stream_status": status, "service_settings": service}
+            record = self.telemetry.record_request
+            with self.profiler.span("connection.fetch"), self._lock:
+                sent = time.monotonic()
+                start = time.perf_counter()
+                status = self._req_client.get_stream_status()
+                record("GetStreamStatus", time.perf_counter() - start)
+                # OBS read the duration about halfway through the round trip
+                status_time = (sent + time.monotonic()) / 2
+                start = time.perf_counter()
+                service = self._req_client.get_stream_service_settings()
+                record("GetStreamServiceSettings", time.perf_counter() - start)
+            try:
+                output_list, outputs = self._fetch_outputs()
+            except Exception as err:
+                # The stream and record state do not depend on the outputs
+                _LOGGER.debug("Cannot fetch the output statuses: %s", err)
+                self.telemetry.record_error("outputs", err)
+                self._outputs_listed = None
+                output_list, outputs = None, None
+            if (capture := self.capture) is not None:
+                refresh = {
+                    "stream_status": response_fields(status),
+                    "service_settings": response_fields(service),
+                }
+                if outputs is not None:
+                    refresh["outputs"] = outputs
+                capture.write(KIND_REFRESH, None, refresh)
+            return {
+                "stream_status": status,
+                "stream_status_time": status_time,
+                "service_settings": service,
+                "output_list": output_list,
+                "outputs": outputs,
+            }
+
+        data = await self.hass.async_add_executor_job(_fetch)
+        # The output list is read by entities, so it only changes here
+        if (output_list := data.pop("output_list")) is not None:
+            self.outputs = output_list
+        if data["outputs"] is None:
+            previous = self.coordinator.data if self.coordinator else None
+            data["outputs"] = (previous or {}).get("outputs", {})
+        return data
 
-        return await self.hass.async_add_executor_job(_fetch)
+    def _fetch_outputs(
+        self,
+    ) -> tuple[dict[str, dict[str, Any]] | None, dict[str, dict[str, Any]]]:
+        """Fetch the status of every active output in one RequestBatch.
+
+        Inactive outputs are skipped until an output event or the next
+        GetOutputList reports them active, so the cost of a poll grows with
+        the active outputs only. Runs in a worker thread, so a changed
+        output list is returned for the event loop to publish rather than
+        stored; it is None when the list did not change.
+        """
+        if not self.supports("GetOutputList"):
+            return None, {}
+        outputs = self.outputs
+        output_list: dict[str, dict[str, Any]] | None = None
+        listed = self._outputs_listed
+        if listed is None or time.monotonic() - listed >= self.output_list_interval:
+            # Set first, so an event arriving meanwhile lists them again
+            self._outputs_listed = time.monotonic()
+            response = self.send("GetOutputList")
+            outputs = output_list = {
+                output["outputName"]: output
+                for output in response.get("outputs", [])
+            }
+        active = [
+            name for name, output in outputs.items() if output.get("outputActive")
+        ]
+        if not active:
+            return output_list, {}
+        results = self.send_batch(
+            [
+                {"requestType": "GetOutputStatus", "requestData": {"outputName": name}}
+                for name in active
+            ],
+            EXECUTION_TYPES["serial_realtime"],
+            False,
+        )
+        statuses: dict[str, dict[str, Any]] = {}
+        for name, result in zip(active, results, strict=False):
+            if not result.get("requestStatus", {}).get("result"):
+                continue
+            status = statuses[name] = result.get("responseData") or {}
+            if not status.get("outputActive"):
+                # Stopped without an event, e.g. by a plugin
+                if output_list is None:
+                    output_list = dict(outputs)
+                output_list[name] = {**outputs[name], "outputActive": False}
+        return output_list, statuses
+
+    def send(
+        self, request_type: str, data: dict[str, Any] | None = None
+    ) -> dict[str, Any]:
+        """Send a raw v5 request from a worker thread."""
+        if self._req_client is None:
+            raise ConnectionError("Not connected")
+        with self.profiler.span("connection.send"), self._lock:
+            start = time.perf_counter()
+            response = self._req_client.send(request_type, data, raw=True)
+            self.telemetry.record_request(request_type, time.perf_counter() - start)
+        if (capture := self.capture) is not None:
+            capture.write(KIND_RESPONSE, request_type, response, data)
+        return response or {}
+
+    def send_batch(
+        self,
+        requests: list[dict[str, Any]],
+        execution_type: int,
+        halt_on_failure: bool,
+    ) -> list[dict[str, Any]]:
+        """Send a RequestBatch from a worker thread and return its results.
+
+        obsws-python has no batch support, so the batch is written to the
+        ReqClient socket directly while holding the request lock. The
+        socket waits the request timeout plus the batch's sleeps. A response
+        that does not arrive in time, or does not match, would be read as
+        the answer to the next request, so the session is dropped instead
+        and the coordinator reconnects.
+        """
+        if self._req_client is None:
+            raise ConnectionError("Not connected")
+        batch_id = f"batch-{next(self._batch_ids)}"
+        payload = {
+            "op": 8,
+            "d": {
+                "requestId": batch_id,
+                "haltOnFailure": halt_on_failure,
+                "executionType": execution_type,
+                "requests": requests,
+            },
+        }
+        ws = self._req_client.base_client.ws
+        with self.profiler.span("connection.send_batch"), self._lock:
+            start = time.perf_counter()
+            if sleep := batch_sleep(requests):
+                ws.settimeout(self.timeout + sleep)
+            try:
+                ws.send(json.dumps(payload))
+                message = ws.recv()
+            except Exception:
+                self._drop_session()
+                raise
+            finally:
+                if sleep and self._req_client is not None:
+                    ws.settimeout(self.timeout)
+            response = json.loads(message)
+            if response.get("op") != 9 or response["d"].get("requestId") != batch_id:
+                self._drop_session()
+                raise ConnectionError("Unexpected response to RequestBatch")
+            self.telemetry.record_request("RequestBatch", time.perf_counter() - start)
+        if (capture := self.capture) is not None:
+            capture.write(
+                KIND_BATCH, "RequestBatch", response["d"]["results"], payload["d"]
+            )
+        return response["d"]["results"]
+
+    def _drop_session(self) -> None:
+        """Close a session whose responses are out of step and reconnect."""
+        self._disconnect()
+        self._on_event()
+
+    async def async_request_batch(
+        self,
+        requests: list[dict[str, Any]],
+        execution_type: int,
+        halt_on_failure: bool = False,
+    ) -> list[dict[str, Any]]:
+        """Send a RequestBatch and return the per-request results."""
+        try:
+            return await self.hass.async_add_executor_job(
+                self.send_batch, requests, execution_type, halt_on_failure
+            )
+        except Exception as err:
+            self.telemetry.record_error("request", err)
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="request_failed",
+                translation_placeholders={
+                    "request": "RequestBatch",
+                    "host": self.host,
+                    "error": str(err),
+                },
+            ) from err
+
+    async def async_request(
+        self,
+        request_type: str,
+        data: dict[str, Any] | None = None,
+        *,
+        use_cache: bool = False,
+    ) -> dict[str, Any]:
+        """Send a raw v5 request and return its response data.
+
+        With ``use_cache``, responses to requests whose results are kept
+        current by OBS events are served from and stored in the cache.
+        """
+        use_cache = use_cache and self.cache.cacheable(request_type)
+        if use_cache and (response := self.cache.get(request_type, data)) is not None:
+            return response
+        generation = self.cache.generation
+        try:
+            response = await self.hass.async_add_executor_job(
+                self.send, request_type, data
+            )
+        except Exception as err:
+            self.telemetry.record_error("request", err)
+            raise HomeAssistantError(
+                translation_domain=DOMAIN,
+                translation_key="request_failed",
+                translation_placeholders={
+                    "request": request_type,
+                    "host": self.host,
+                    "error": str(err),
+                },
+            ) from err
+        if use_cache:
+            self.cache.set(request_type, data, response, generation)
+        return response
+
+    async def async_start_capture(
+        self, path: Path, max_bytes: int, backups: int
+    ) -> OBSCapture:
+        """Start writing received events and responses to a capture file."""
+        capture = OBSCapture(path, max_bytes, backups)
+        await self.hass.async_add_executor_job(capture.open, self.host)
+        self.capture = capture
+        return capture
+
+    async def async_stop_capture(self) -> OBSCapture | None:
+        """Stop capturing and return the finished capture, if any."""
+        if (capture := self.capture) is None:
+            return None
+        self.capture = None
+        await self.hass.async_add_executor_job(capture.close)
+        return capture
 
     async def async_disconnect(self) -> None:
         """Disconnect both clients."""
+        await self.hass.async_add_executor_job(self._disconnect)
 
-        def _disconnect() -> None:
-            for client in (self._event_client, self._req_client):
-                if client:
-                    try:
-                        client.disconnect()
-                    except Exception:
-                        pass
-            self._event_client = None
-            self._req_client = None
-
-        await self.hass.async_add_executor_job(_disconnect)
+    def _disconnect(self) -> None:
+        """Disconnect both clients from a worker thread."""
+        for client in (self._event_client, self._req_client):
+            if client:
+                try:
+                    client.disconnect()
+                except Exception:
+                    pass
+        self._event_client = None
+        self._req_client = None
 
 
 class OBSCoordinator(DataUpdateCoordinator[dict[str, Any]]):
@@ -119,17 +646,56 @@ class OBSCoordinator(DataUpdateCoordinator[dict[str, Any]]):
             hass,
             _LOGGER,
             name=f"OBS WebSocket ({connection.host})",
-            update_interval=timedelta(seconds=HEARTBEAT_INTERVAL),
+            update_interval=timedelta(seconds=DEFAULT_IDLE_INTERVAL),
         )
         self.connection = connection
         self._was_available = True
+        self.idle_interval = timedelta(seconds=DEFAULT_IDLE_INTERVAL)
+        self.active_interval = timedelta(seconds=DEFAULT_ACTIVE_INTERVAL)
+        # Minimum seconds between state writes of an entity, 0 for none
+        self.state_throttle = DEFAULT_STATE_THROTTLE
+        self.health = OBSStreamHealth(
+            DEFAULT_HEALTH_CONGESTION,
+            DEFAULT_HEALTH_SKIPPED_RATIO,
+            DEFAULT_HEALTH_BITRATE_DROP,
+            DEFAULT_HEALTH_HYSTERESIS,
+        )
+        self.clock = OBSStreamClock()
+        self.statistics: OBSStreamStatistics | None = None
+
+    @callback
+    def async_set_intervals(self, idle: float, active: float) -> None:
+        """Set the poll intervals and reschedule the pending poll."""
+        self.idle_interval = timedelta(seconds=idle)
+        self.active_interval = timedelta(seconds=active)
+        self.connection.output_list_interval = idle
+        previous = self.update_interval
+        self._async_select_interval(self.data)
+        if self.update_interval != previous and self._listeners:
+            self._schedule_refresh()
+
+    @callback
+    def _async_select_interval(self, data: dict[str, Any] | None) -> None:
+        """Poll at the active interval while the stream is up."""
+        status = (data or {}).get("stream_status")
+        active = getattr(status, "output_active", False) or getattr(
+            status, "output_reconnecting", False
+        )
+        self.update_interval = self.active_interval if active else self.idle_interval
 
     async def _async_update_data(self) -> dict[str, Any]:
+        with self.connection.profiler.span("coordinator.update"):
+            return await self._async_fetch()
+
+    async def _async_fetch(self) -> dict[str, Any]:
+        telemetry = self.connection.telemetry
+        start = time.perf_counter()
         try:
             if not self.connection.connected:
                 await self.connection.async_connect()
             data = await self.connection.async_fetch_data()
         except Exception as err:
+            telemetry.record_error("refresh", err)
             await self.connection.async_disconnect()
             if self._was_available:
                 _LOGGER.warning(
@@ -152,8 +718,57 @@ class OBSCoordinator(DataUpdateCoordinator[dict[str, Any]]):
                 "OBS WebSocket (%s) is available again", self.connection.host
             )
             self._was_available = True
+        telemetry.record_refresh(time.perf_counter() - start)
+        self._async_process(data)
         return data
 
+    @callback
+    def _async_process(self, data: dict[str, Any]) -> None:
+        """Feed fetched data to the health score, statistics and clock."""
+        self.health.add(data["stream_status"])
+        if self.statistics is not None:
+            self.statistics.add(data["stream_status"], dt_util.utcnow())
+        self.clock.sync(data["stream_status"], data["stream_status_time"])
+        self._async_select_interval(data)
+
+    @callback
+    def async_handle_stream_state_changed(self, data: dict[str, Any]) -> None:
+        """Pass a StreamStateChanged event to the current clock."""
+        self.clock.async_handle_state_changed(data)
+
+    @contextmanager
+    def async_replaying(self) -> Iterator[None]:
+        """Replay into copies of the live state, restored afterwards.
+
+        The health score and clock are replaced by copies for the replay,
+        replayed streams are kept out of the long-term statistics, and the
+        live data and poll interval are written back when it ends.
+        """
+        live = (self.data, self.health, self.clock, self.statistics)
+        self.health = copy.deepcopy(self.health)
+        self.clock = copy.deepcopy(self.clock)
+        self.statistics = None
+        try:
+            yield
+        finally:
+            data, self.health, self.clock, self.statistics = live
+            self._async_select_interval(data)
+            if data is not None:
+                self.async_set_updated_data(data)
+
+    @callback
+    def async_set_replayed_data(self, data: dict[str, Any]) -> None:
+        """Process a replayed refresh as if it had just been fetched."""
+        self._async_process(data)
+        self.async_set_updated_data(data)
+
+
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Set up the OBS WebSocket services and websocket commands."""
+    async_setup_services(hass)
+    async_setup_websocket_api(hass)
+    return True
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: OBSConfigEntry) -> bool:
     """Set up OBS WebSocket from a config entry."""
@@ -162,33 +777,205 @@ async def async_setup_entry(hass: HomeAssistant, entry: OBSConfigEntry) -> bool:
         host=entry.data["host"],
         port=entry.data["port"],
         password=entry.data.get("password", ""),
+        capabilities=entry.data.get(CONF_CAPABILITIES),
+        timeout=entry.options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+        subscriptions=subscription_mask(
+            entry.options.get(CONF_EVENT_SUBSCRIPTIONS, DEFAULT_EVENT_SUBSCRIPTIONS)
+        ),
     )
 
+    session = async_take_session(
+        hass, connection.host, entry.data["port"], entry.data.get("password", "")
+    )
     try:
-        await connection.async_connect()
+        await connection.async_connect(session)
     except Exception as err:
+        await connection.async_disconnect()
         raise ConfigEntryNotReady(
             translation_domain=DOMAIN,
             translation_key="connection_failed",
             translation_placeholders={"host": entry.data["host"], "error": str(err)},
         ) from err
 
+    _async_store_capabilities(hass, entry, connection)
+    entry.async_on_unload(
+        connection.async_add_connect_listener(
+            partial(_async_store_capabilities, hass, entry, connection)
+        )
+    )
+
     coordinator = OBSCoordinator(hass, connection)
     connection.coordinator = coordinator
+    coordinator.async_set_intervals(
+        entry.options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+        entry.options.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL),
+    )
+    coordinator.state_throttle = entry.options.get(
+        CONF_STATE_THROTTLE, DEFAULT_STATE_THROTTLE
+    )
+    _async_configure_health(coordinator.health, entry.options)
+    if "recorder" in hass.config.components:
+        # The statistics pull in the recorder's models, so they are only
+        # imported where the recorder runs
+        statistics = await async_import_module(hass, f"{__name__}.statistics")
+        coordinator.statistics = statistics.OBSStreamStatistics(hass, entry)
+        entry.async_on_unload(coordinator.statistics.async_flush)
     await coordinator.async_config_entry_first_refresh()
 
+    features = frozenset(entry.options.get(CONF_FEATURES, DEFAULT_FEATURES))
+    # The subsystems of disabled features are never imported
+    forwarder: OBSEventForwarder | None = None
+    if FEATURE_EVENT_FORWARDING in features:
+        module = await async_import_module(hass, f"{__name__}.forwarder")
+        forwarder = module.OBSEventForwarder(
+            hass,
+            connection,
+            entry.entry_id,
+            entry.options.get(
+                CONF_EVENT_COALESCE_INTERVAL, DEFAULT_EVENT_COALESCE_INTERVAL
+            ),
+        )
+        forwarder.async_set_allowlist(
+            entry.options.get(CONF_FORWARD_EVENTS, DEFAULT_FORWARD_EVENTS)
+        )
+        entry.async_on_unload(forwarder.async_stop)
+
+    entry.async_on_unload(
+        connection.async_add_listener(
+            "StreamStateChanged",
+            coordinator.async_handle_stream_state_changed,
+            replay=True,
+        )
+    )
+
+    triggers = async_get_trigger_registry(hass)
+    for event_type in TRIGGER_EVENTS:
+        entry.async_on_unload(
+            connection.async_add_listener(
+                event_type,
+                partial(triggers.async_dispatch, entry.entry_id, event_type),
+            )
+        )
+
+    studio: OBSStudioState | None = None
+    if FEATURE_STUDIO_MODE in features:
+        module = await async_import_module(hass, f"{__name__}.studio")
+        studio = module.OBSStudioState(entry, connection)
+    hotkeys: OBSHotkeyIndex | None = None
+    if FEATURE_HOTKEYS in features:
+        module = await async_import_module(hass, f"{__name__}.hotkeys")
+        hotkeys = module.OBSHotkeyIndex(entry, connection)
+    stats: OBSStatsSampler | None = None
+    if FEATURE_LIVE_STATS in features:
+        module = await async_import_module(hass, f"{__name__}.stats")
+        stats = module.OBSStatsSampler(entry)
     entry.runtime_data = OBSRuntimeData(
         connection=connection,
         coordinator=coordinator,
+        forwarder=forwarder,
+        studio=studio,
+        hotkeys=hotkeys,
+        stats=stats,
+        features=features,
+        platforms=feature_platforms(features),
     )
+    if stats is not None:
+        entry.async_on_unload(stats.async_stop)
+    if studio is not None:
+        await studio.async_start()
+    if hotkeys is not None:
+        await hotkeys.async_start()
+
+    entry.async_on_unload(entry.add_update_listener(_async_update_options))
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    await hass.config_entries.async_forward_entry_setups(
+        entry, entry.runtime_data.platforms
+    )
     return True
 
 
+def feature_platforms(features: Iterable[str]) -> list[str]:
+    """Return the platforms to load for the enabled features."""
+    platforms = list(BASE_PLATFORMS)
+    for feature, extra in FEATURE_PLATFORMS.items():
+        if feature in features:
+            platforms.extend(p for p in extra if p not in platforms)
+    return platforms
+
+
+async def _async_update_options(hass: HomeAssistant, entry: OBSConfigEntry) -> None:
+    """Apply changed options to the running connection without reloading."""
+    options = entry.options
+    runtime = entry.runtime_data
+    if frozenset(options.get(CONF_FEATURES, DEFAULT_FEATURES)) != runtime.features:
+        # Platforms and the subsystems behind them are only set up at load
+        hass.config_entries.async_schedule_reload(entry.entry_id)
+        return
+    await runtime.connection.async_set_timeout(
+        options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT)
+    )
+    await runtime.connection.async_set_subscriptions(
+        subscription_mask(
+            options.get(CONF_EVENT_SUBSCRIPTIONS, DEFAULT_EVENT_SUBSCRIPTIONS)
+        )
+    )
+    runtime.coordinator.async_set_intervals(
+        options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+        options.get(CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL),
+    )
+    runtime.coordinator.state_throttle = options.get(
+        CONF_STATE_THROTTLE, DEFAULT_STATE_THROTTLE
+    )
+    _async_configure_health(runtime.coordinator.health, options)
+    if (screenshots := runtime.screenshots) is not None:
+        screenshots.configure(options)
+    if (forwarder := runtime.forwarder) is None:
+        return
+    forwarder.coalesce_interval = options.get(
+        CONF_EVENT_COALESCE_INTERVAL, DEFAULT_EVENT_COALESCE_INTERVAL
+    )
+    forwarder.async_set_allowlist(
+        options.get(CONF_FORWARD_EVENTS, DEFAULT_FORWARD_EVENTS)
+    )
+
+
+@callback
+def _async_configure_health(health: OBSStreamHealth, options: Mapping[str, Any]) -> None:
+    """Apply the stream health thresholds of the options."""
+    health.configure(
+        options.get(CONF_HEALTH_CONGESTION, DEFAULT_HEALTH_CONGESTION),
+        options.get(CONF_HEALTH_SKIPPED_RATIO, DEFAULT_HEALTH_SKIPPED_RATIO),
+        options.get(CONF_HEALTH_BITRATE_DROP, DEFAULT_HEALTH_BITRATE_DROP),
+        options.get(CONF_HEALTH_HYSTERESIS, DEFAULT_HEALTH_HYSTERESIS),
+    )
+
+
+@callback
+def _async_store_capabilities(
+    hass: HomeAssistant, entry: OBSConfigEntry, connection: OBSConnection
+) -> None:
+    """Keep the capabilities of a new session with the entry and device."""
+    capabilities = connection.capabilities
+    if capabilities is None or capabilities == entry.data.get(CONF_CAPABILITIES):
+        return
+    hass.config_entries.async_update_entry(
+        entry, data={**entry.data, CONF_CAPABILITIES: capabilities}
+    )
+    device_registry = dr.async_get(hass)
+    if device := device_registry.async_get_device(
+        identifiers={(DOMAIN, entry.entry_id)}
+    ):
+        device_registry.async_update_device(
+            device.id, sw_version=capabilities.get("obs_version")
+        )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: OBSConfigEntry) -> bool:
     """Unload a config entry."""
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    unload_ok = await hass.config_entries.async_unload_platforms(
+        entry, entry.runtime_data.platforms
+    )
     if unload_ok:
+        await entry.runtime_data.connection.async_stop_capture()
         await entry.runtime_data.connection.async_disconnect()
     return unload_ok
@@ -0,0 +1,70 @@
+"""Binary sensor platform for OBS WebSocket."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from . import OBSConfigEntry, OBSCoordinator
+from .entity import OBSStudioEntity, obs_device_info
+
+PARALLEL_UPDATES = 1
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: OBSConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up OBS WebSocket binary sensors from a config entry."""
+    entities: list[BinarySensorEntity] = [
+        OBSStreamDegradedSensor(entry.runtime_data.coordinator, entry)
+    ]
+    if entry.runtime_data.studio is not None:
+        entities.append(OBSTransitioningSensor(entry))
+    async_add_entities(entities)
+
+
+class OBSStreamDegradedSensor(CoordinatorEntity[OBSCoordinator], BinarySensorEntity):
+    """Binary sensor that is on while the stream health score is degraded."""
+
+    _attr_has_entity_name = True
+    _attr_device_class = BinarySensorDeviceClass.PROBLEM
+    _attr_translation_key = "stream_degraded"
+
+    def __init__(self, coordinator: OBSCoordinator, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(coordinator)
+        self._attr_device_info = obs_device_info(entry)
+        self._attr_unique_id = f"{entry.entry_id}_stream_degraded"
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether the stream is degraded."""
+        return self.coordinator.health.degraded
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the metrics behind the health score."""
+        return self.coordinator.health.as_dict()
+
+
+class OBSTransitioningSensor(OBSStudioEntity, BinarySensorEntity):
+    """Binary sensor that is on while a scene transition runs."""
+
+    _attr_device_class = BinarySensorDeviceClass.RUNNING
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(entry, "transitioning")
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether a transition is running."""
+        return self._studio.transitioning
+
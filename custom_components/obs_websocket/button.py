@@ -0,0 +1,36 @@
+"""Button platform for OBS WebSocket studio mode transitions."""
+
+from __future__ import annotations
+
+from homeassistant.components.button import ButtonEntity
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import OBSConfigEntry
+from .entity import OBSStudioEntity
+
+PARALLEL_UPDATES = 1
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: OBSConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up OBS WebSocket buttons from a config entry."""
+    async_add_entities([OBSTriggerTransitionButton(entry)])
+
+
+class OBSTriggerTransitionButton(OBSStudioEntity, ButtonEntity):
+    """Button transitioning the preview scene to program in studio mode."""
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(entry, "trigger_transition")
+
+    @property
+    def available(self) -> bool:
+        """Return if studio mode is enabled."""
+        return super().available and self._studio.studio_mode
+
+    async def async_press(self) -> None:
+        """Trigger the studio mode transition."""
+        await self._studio.connection.async_request("TriggerStudioModeTransition")
@@ -0,0 +1,184 @@
+"""Response cache for idempotent OBS WebSocket requests."""
+
+from __future__ import annotations
+
+from collections import OrderedDict
+import copy
+import json
+from typing import Any
+
+_SCENE_ITEM_REQUESTS = (
+    "GetSceneItemList",
+    "GetGroupSceneItemList",
+    "GetSceneItemId",
+    "GetSceneItemEnabled",
+    "GetSceneItemLocked",
+    "GetSceneItemIndex",
+)
+
+# Requests whose responses hold scene item transforms. Only the opt-in,
+# high-volume SceneItemTransformChanged event reports those, so they are
+# only cached while that category is subscribed.
+TRANSFORM_REQUESTS: tuple[str, ...] = (
+    "GetSceneItemList",
+    "GetGroupSceneItemList",
+    "GetSceneItemTransform",
+)
+
+# Requests whose responses only change when one of these events is emitted.
+# Only these request types are cached; anything else always goes to OBS.
+INVALIDATING_EVENTS: dict[str, tuple[str, ...]] = {
+    "SceneCreated": ("GetSceneList", "GetGroupList"),
+    "SceneRemoved": ("GetSceneList", "GetGroupList", *_SCENE_ITEM_REQUESTS),
+    "SceneNameChanged": (
+        "GetSceneList",
+        "GetGroupList",
+        "GetCurrentProgramScene",
+        "GetCurrentPreviewScene",
+        *_SCENE_ITEM_REQUESTS,
+    ),
+    "SceneListChanged": ("GetSceneList",),
+    "CurrentProgramSceneChanged": ("GetSceneList", "GetCurrentProgramScene"),
+    "CurrentPreviewSceneChanged": ("GetSceneList", "GetCurrentPreviewScene"),
+    "SceneItemCreated": _SCENE_ITEM_REQUESTS,
+    "SceneItemRemoved": _SCENE_ITEM_REQUESTS,
+    "SceneItemListReindexed": _SCENE_ITEM_REQUESTS,
+    "SceneItemEnableStateChanged": (
+        "GetSceneItemList",
+        "GetGroupSceneItemList",
+        "GetSceneItemEnabled",
+    ),
+    "SceneItemLockStateChanged": (
+        "GetSceneItemList",
+        "GetGroupSceneItemList",
+        "GetSceneItemLocked",
+    ),
+    "SceneItemTransformChanged": TRANSFORM_REQUESTS,
+    "InputCreated": ("GetInputList",),
+    "InputRemoved": ("GetInputList", *_SCENE_ITEM_REQUESTS),
+    "InputNameChanged": ("GetInputList", *_SCENE_ITEM_REQUESTS),
+    "InputSettingsChanged": ("GetInputSettings",),
+    "InputMuteStateChanged": ("GetInputMute",),
+    "InputVolumeChanged": ("GetInputVolume",),
+    "CurrentSceneTransitionChanged": (
+        "GetCurrentSceneTransition",
+        "GetSceneTransitionList",
+    ),
+    "CurrentSceneTransitionDurationChanged": ("GetCurrentSceneTransition",),
+    "StudioModeStateChanged": ("GetStudioModeEnabled",),
+    "CurrentProfileChanged": ("GetProfileList",),
+    "ProfileListChanged": ("GetProfileList",),
+    "CurrentSceneCollectionChanged": ("GetSceneCollectionList",),
+    "SceneCollectionListChanged": ("GetSceneCollectionList",),
+}
+
+# Events after which nothing cached can be trusted
+CLEARING_EVENTS: tuple[str, ...] = (
+    "CurrentSceneCollectionChanging",
+    "CurrentProfileChanging",
+)
+
+CACHEABLE_REQUESTS: frozenset[str] = frozenset(
+    request_type
+    for request_types in INVALIDATING_EVENTS.values()
+    for request_type in request_types
+)
+
+
+class OBSResponseCache:
+    """Bounded LRU cache of response data keyed by request type and parameters.
+
+    Entries are grouped by request type so that an event drops exactly the
+    request types it affects, whatever parameters they were cached with.
+    ``generation`` changes on every invalidation; a response is only stored
+    if no invalidation happened while it was being fetched.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        """Initialize."""
+        self.maxsize = maxsize
+        # Whether SceneItemTransformChanged events are subscribed
+        self.transforms_followed = False
+        self.hits = 0
+        self.misses = 0
+        self.generation = 0
+        self._entries: OrderedDict[tuple[str, str], dict[str, Any]] = OrderedDict()
+        self._by_type: dict[str, set[tuple[str, str]]] = {}
+
+    def __len__(self) -> int:
+        """Return the number of cached responses."""
+        return len(self._entries)
+
+    def cacheable(self, request_type: str) -> bool:
+        """Return if responses to this request type can be cached."""
+        if request_type in TRANSFORM_REQUESTS:
+            return self.transforms_followed
+        return request_type in CACHEABLE_REQUESTS
+
+    def follow_transforms(self, followed: bool) -> None:
+        """Set whether transform events arrive, dropping transforms if not."""
+        self.transforms_followed = followed
+        if not followed:
+            self.generation += 1
+            for request_type in TRANSFORM_REQUESTS:
+                self.invalidate(request_type)
+
+    @staticmethod
+    def _key(request_type: str, data: dict[str, Any] | None) -> tuple[str, str]:
+        return (request_type, json.dumps(data, sort_keys=True) if data else "")
+
+    def get(
+        self, request_type: str, data: dict[str, Any] | None
+    ) -> dict[str, Any] | None:
+        """Return a copy of the cached response, or None."""
+        key = self._key(request_type, data)
+        if (response := self._entries.get(key)) is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return copy.deepcopy(response)
+
+    def set(
+        self,
+        request_type: str,
+        data: dict[str, Any] | None,
+        response: dict[str, Any],
+        generation: int,
+    ) -> None:
+        """Store a response, evicting the least recently used one if full."""
+        if generation != self.generation:
+            return
+        key = self._key(request_type, data)
+        self._entries[key] = copy.deepcopy(response)
+        self._entries.move_to_end(key)
+        self._by_type.setdefault(request_type, set()).add(key)
+        while len(self._entries) > self.maxsize:
+            evicted, _ = self._entries.popitem(last=False)
+            self._discard_key(evicted)
+
+    def _discard_key(self, key: tuple[str, str]) -> None:
+        keys = self._by_type[key[0]]
+        keys.discard(key)
+        if not keys:
+            del self._by_type[key[0]]
+
+    def invalidate(self, request_type: str) -> None:
+        """Drop every cached response of a request type."""
+        for key in self._by_type.pop(request_type, ()):
+            del self._entries[key]
+
+    def invalidate_for_event(self, event_type: str) -> None:
+        """Drop the responses an OBS event makes stale."""
+        self.generation += 1
+        if event_type in CLEARING_EVENTS:
+            self.clear()
+            return
+        for request_type in INVALIDATING_EVENTS.get(event_type, ()):
+            self.invalidate(request_type)
+
+    def clear(self) -> None:
+        """Drop everything."""
+        self.generation += 1
+        self._entries.clear()
+        self._by_type.clear()
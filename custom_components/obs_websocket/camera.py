@@ -0,0 +1,253 @@
+"""Camera platform for OBS WebSocket program output screenshots."""
+
+from __future__ import annotations
+
+import asyncio
+import binascii
+from collections.abc import Mapping
+import logging
+import time
+from typing import Any
+
+from homeassistant.components.camera import Camera
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import (
+    CONF_SCREENSHOT_FORMAT,
+    CONF_SCREENSHOT_HEIGHT,
+    CONF_SCREENSHOT_MAX_RATE,
+    CONF_SCREENSHOT_QUALITY,
+    CONF_SCREENSHOT_TTL,
+    CONF_SCREENSHOT_WIDTH,
+    DEFAULT_SCREENSHOT_FORMAT,
+    DEFAULT_SCREENSHOT_HEIGHT,
+    DEFAULT_SCREENSHOT_MAX_RATE,
+    DEFAULT_SCREENSHOT_QUALITY,
+    DEFAULT_SCREENSHOT_TTL,
+    DEFAULT_SCREENSHOT_WIDTH,
+    DOMAIN,
+)
+from . import OBSConfigEntry, OBSConnection
+from .entity import obs_device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+PARALLEL_UPDATES = 1
+
+CONTENT_TYPES: dict[str, str] = {
+    "jpg": "image/jpeg",
+    "jpeg": "image/jpeg",
+    "png": "image/png",
+    "webp": "image/webp",
+    "bmp": "image/bmp",
+}
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: OBSConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up the OBS WebSocket program camera from a config entry."""
+    fetcher = OBSScreenshotFetcher(hass, entry.runtime_data.connection)
+    fetcher.configure(entry.options)
+    # Changed options are applied by the entry's update listener
+    entry.runtime_data.screenshots = fetcher
+    async_add_entities([OBSProgramCamera(entry, fetcher)])
+
+
+def _decode_image(image_data: str) -> bytes:
+    """Decode a base64 data URI."""
+    return binascii.a2b_base64(image_data[image_data.index(",") + 1 :])
+
+
+class OBSScreenshotFetcher:
+    """Shared, rate limited GetSourceScreenshot cache for one OBS host.
+
+    Every viewer of the host's cameras reads the same cached image. At most
+    one request is in flight, images younger than ``ttl`` are reused, and no
+    more than ``max_rate`` screenshots per minute are requested, whether or
+    not they succeed; callers arriving while the limit applies get the
+    previous image, or None while there is none.
+    """
+
+    def __init__(self, hass: HomeAssistant, connection: OBSConnection) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.connection = connection
+        self.image_format = DEFAULT_SCREENSHOT_FORMAT
+        self.width = DEFAULT_SCREENSHOT_WIDTH
+        self.height = DEFAULT_SCREENSHOT_HEIGHT
+        self.quality = DEFAULT_SCREENSHOT_QUALITY
+        self.ttl = DEFAULT_SCREENSHOT_TTL
+        self.min_interval = 60 / DEFAULT_SCREENSHOT_MAX_RATE
+        self._key: tuple[Any, ...] | None = None
+        self._image: bytes | None = None
+        self._fetched_at: float | None = None
+        self._task: asyncio.Task[bytes | None] | None = None
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @callback
+    def async_add_listener(self, listener: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call listener whenever the options change."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def configure(self, options: Mapping[str, Any]) -> None:
+        """Apply the screenshot options of an entry.
+
+        A changed format, size or quality makes the next viewer fetch a
+        new image, as it no longer matches the key of the cached one.
+        """
+        self.image_format = options.get(
+            CONF_SCREENSHOT_FORMAT, DEFAULT_SCREENSHOT_FORMAT
+        )
+        self.width = options.get(CONF_SCREENSHOT_WIDTH, DEFAULT_SCREENSHOT_WIDTH)
+        self.height = options.get(CONF_SCREENSHOT_HEIGHT, DEFAULT_SCREENSHOT_HEIGHT)
+        self.quality = options.get(
+            CONF_SCREENSHOT_QUALITY, DEFAULT_SCREENSHOT_QUALITY
+        )
+        self.ttl = options.get(CONF_SCREENSHOT_TTL, DEFAULT_SCREENSHOT_TTL)
+        max_rate = options.get(CONF_SCREENSHOT_MAX_RATE, DEFAULT_SCREENSHOT_MAX_RATE)
+        self.min_interval = 60 / max_rate if max_rate else 0.0
+        for listener in list(self._listeners):
+            listener()
+
+    @property
+    def content_type(self) -> str:
+        """Return the MIME type of the images."""
+        return CONTENT_TYPES.get(self.image_format, "image/jpeg")
+
+    async def async_get(self, source: str) -> bytes | None:
+        """Return a screenshot of the source, fetching at most once per interval."""
+        key = (source, self.image_format, self.width, self.height, self.quality)
+        if self._fetched_at is not None:
+            age = time.monotonic() - self._fetched_at
+            # Failed requests count too, so a missing source or a lost
+            # connection is not asked for a screenshot by every viewer
+            if age < self.min_interval or (
+                self._image is not None and key == self._key and age < self.ttl
+            ):
+                return self._image
+        if self._task is None:
+            self._task = self.hass.async_create_task(
+                self._async_fetch(key, source), f"{DOMAIN} screenshot"
+            )
+        return await asyncio.shield(self._task)
+
+    async def _async_fetch(self, key: tuple[Any, ...], source: str) -> bytes | None:
+        request: dict[str, Any] = {
+            "sourceName": source,
+            "imageFormat": self.image_format,
+            "imageCompressionQuality": self.quality,
+        }
+        if self.width:
+            request["imageWidth"] = self.width
+        if self.height:
+            request["imageHeight"] = self.height
+
+        def _fetch() -> bytes:
+            response = self.connection.send("GetSourceScreenshot", request)
+            return _decode_image(response["imageData"])
+
+        try:
+            self._image = await self.hass.async_add_executor_job(_fetch)
+        except Exception as err:
+            _LOGGER.debug("Screenshot of %s failed: %s", source, err)
+        else:
+            self._key = key
+        finally:
+            self._fetched_at = time.monotonic()
+            self._task = None
+        return self._image
+
+
+class OBSProgramCamera(Camera):
+    """Camera showing the OBS program output."""
+
+    _attr_has_entity_name = True
+    _attr_translation_key = "program"
+
+    def __init__(self, entry: OBSConfigEntry, fetcher: OBSScreenshotFetcher) -> None:
+        """Initialize."""
+        super().__init__()
+        self._entry = entry
+        self._fetcher = fetcher
+        self._scene: str | None = None
+        self._attr_unique_id = f"{entry.entry_id}_program"
+        self._attr_device_info = obs_device_info(entry)
+        self.async_update_from_fetcher()
+
+    @callback
+    def async_update_from_fetcher(self) -> None:
+        """Follow the image format and intervals of the fetcher."""
+        self.content_type = self._fetcher.content_type
+        self._attr_frame_interval = max(self._fetcher.ttl, self._fetcher.min_interval)
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if OBS is reachable."""
+        return self._entry.runtime_data.coordinator.last_update_success
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the scene currently on program."""
+        return {"scene_name": self._scene}
+
+    async def async_added_to_hass(self) -> None:
+        """Track the program scene from events."""
+        await super().async_added_to_hass()
+        connection = self._fetcher.connection
+        self.async_on_remove(
+            self._fetcher.async_add_listener(self.async_update_from_fetcher)
+        )
+        self.async_on_remove(
+            connection.async_add_listener(
+                "CurrentProgramSceneChanged", self._async_on_scene_changed, replay=True
+            )
+        )
+        self.async_on_remove(
+            connection.async_add_connect_listener(self._async_on_connect)
+        )
+        await self._async_fetch_scene()
+
+    async def _async_fetch_scene(self) -> None:
+        try:
+            response = await self._fetcher.connection.async_request(
+                "GetCurrentProgramScene"
+            )
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot fetch current program scene: %s", err)
+            return
+        self._scene = response["currentProgramSceneName"]
+        self.async_write_ha_state()
+
+    @callback
+    def _async_on_scene_changed(self, data: dict[str, Any]) -> None:
+        self._scene = data["sceneName"]
+        self.async_write_ha_state()
+
+    @callback
+    def _async_on_connect(self) -> None:
+        self._entry.async_create_background_task(
+            self.hass, self._async_fetch_scene(), f"{DOMAIN} program scene"
+        )
+
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return the cached program screenshot.
+
+        The requested size is ignored so that every viewer shares one image.
+        """
+        if self._scene is None:
+            return None
+        return await self._fetcher.async_get(self._scene)
@@ -0,0 +1,217 @@
+"""Record OBS session traffic and replay it through the coordinator."""
+
+from __future__ import annotations
+
+import asyncio
+from collections import Counter
+import json
+import os
+from pathlib import Path
+import threading
+import time
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.util import dt as dt_util
+
+if TYPE_CHECKING:
+    from . import OBSConnection, OBSCoordinator
+
+KIND_START = "start"
+KIND_EVENT = "event"
+KIND_RESPONSE = "response"
+KIND_BATCH = "batch"
+KIND_REFRESH = "refresh"
+
+
+class OBSCapture:
+    """Append-only JSON lines file of the traffic of one connection.
+
+    Each line holds the seconds since the capture started (``t``), the
+    record kind, the event or request type and its data. Records are
+    written from the client threads; when the file reaches ``max_bytes``
+    it is rotated to ``.1`` and older files shift up to ``backups``.
+    """
+
+    def __init__(self, path: Path, max_bytes: int, backups: int) -> None:
+        """Initialize."""
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.records = 0
+        self._lock = threading.Lock()
+        self._file: Any = None
+        self._start = 0.0
+
+    def open(self, host: str) -> None:
+        """Create the file and write the start record; runs in the executor."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = self.path.open("a", encoding="utf-8")
+        self._start = time.monotonic()
+        self._write_line(
+            {
+                "t": 0,
+                "kind": KIND_START,
+                "type": None,
+                "data": {"time": dt_util.utcnow().isoformat(), "host": host},
+            }
+        )
+
+    def close(self) -> None:
+        """Close the file; runs in the executor."""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def write(
+        self,
+        kind: str,
+        record_type: str | None,
+        data: Any,
+        request: dict[str, Any] | None = None,
+    ) -> None:
+        """Append a record from a client thread."""
+        record: dict[str, Any] = {
+            "t": round(time.monotonic() - self._start, 4),
+            "kind": kind,
+            "type": record_type,
+            "data": data,
+        }
+        if request:
+            record["request"] = request
+        with self._lock:
+            if self._file is not None:
+                self._write_line(record)
+
+    def _write_line(self, record: dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, separators=(",", ":"), default=str))
+        self._file.write("\n")
+        self.records += 1
+        if self._file.tell() >= self.max_bytes:
+            self._rotate()
+
+    def _rotate(self) -> None:
+        self._file.close()
+        for index in range(self.backups - 1, 0, -1):
+            source = self.path.with_name(f"{self.path.name}.{index}")
+            if source.exists():
+                os.replace(source, self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backups:
+            os.replace(self.path, self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+        self._file = self.path.open("a", encoding="utf-8")
+
+    def size(self) -> int:
+        """Return the bytes captured, including rotated files."""
+        return sum(path.stat().st_size for path in capture_files(self.path))
+
+
+def response_fields(response: Any) -> dict[str, Any]:
+    """Return the fields of a typed obsws-python response."""
+    # obsws-python builds a dataclass type per response, listing its fields
+    if callable(attrs := getattr(response, "attrs", None)):
+        return {name: getattr(response, name) for name in attrs()}
+    return dict(vars(response))
+
+
+def capture_files(path: Path) -> list[Path]:
+    """Return a capture and its rotated files, oldest first."""
+    rotated = sorted(
+        (
+            candidate
+            for candidate in path.parent.glob(f"{path.name}.*")
+            if candidate.suffix[1:].isdigit()
+        ),
+        key=lambda candidate: int(candidate.suffix[1:]),
+        reverse=True,
+    )
+    return [*rotated, path] if path.exists() else rotated
+
+
+def read_capture(path: Path) -> list[dict[str, Any]]:
+    """Read the records of a capture, oldest rotated file first.
+
+    Runs in the executor.
+    """
+    records = []
+    for file_path in capture_files(path):
+        with file_path.open(encoding="utf-8") as file:
+            records.extend(json.loads(line) for line in file if line.strip())
+    return records
+
+
+def _namespace(data: dict[str, Any]) -> SimpleNamespace:
+    return SimpleNamespace(**data)
+
+
+async def async_replay(
+    connection: OBSConnection,
+    coordinator: OBSCoordinator,
+    path: Path,
+    speed: float = 1.0,
+) -> dict[str, Any]:
+    """Feed a capture back through the connection listeners and coordinator.
+
+    Events are dispatched to the listeners of the connection and refresh
+    records become coordinator data, with the recorded spacing divided by
+    ``speed``; a speed of 0 replays as fast as possible. Responses to other
+    requests are kept in the capture for analysis only.
+
+    Events only reach the listeners that opt in to replays: the response
+    cache, the stream clock and entity states. Scene item, media player,
+    studio and hotkey indexes, device triggers and event forwarding are not
+    fed, so a replay sends no requests to OBS, leaves the entity registry
+    alone and runs no automations. Refreshes update a copy of the health score and clock,
+    not the statistics, and the live data is restored when the replay ends.
+    """
+    hass = connection.hass
+    records = await hass.async_add_executor_job(read_capture, path)
+    counts: Counter[str] = Counter()
+    start = hass.loop.time()
+    with coordinator.async_replaying():
+        await _async_feed(connection, coordinator, records, speed, counts, start)
+    return {
+        "events": counts[KIND_EVENT],
+        "refreshes": counts[KIND_REFRESH],
+        "duration": round(hass.loop.time() - start, 3),
+    }
+
+
+async def _async_feed(
+    connection: OBSConnection,
+    coordinator: OBSCoordinator,
+    records: list[dict[str, Any]],
+    speed: float,
+    counts: Counter[str],
+    start: float,
+) -> None:
+    hass = connection.hass
+    offset = 0.0
+    for record in records:
+        kind = record["kind"]
+        if kind == KIND_START:
+            # Later captures appended to the same file restart the clock
+            offset = hass.loop.time() - start
+            continue
+        if speed > 0:
+            delay = start + offset + record["t"] / speed - hass.loop.time()
+            await asyncio.sleep(max(delay, 0))
+        else:
+            await asyncio.sleep(0)
+        if kind == KIND_EVENT:
+            connection._async_dispatch(record["type"], record["data"], replayed=True)
+        elif kind == KIND_REFRESH:
+            data: dict[str, Any] = {
+                # Output statuses are raw response data, the rest typed
+                key: value if key == "outputs" else _namespace(value)
+                for key, value in record["data"].items()
+            }
+            # Refreshes whose outputs failed keep the previous statuses
+            data.setdefault("outputs", (coordinator.data or {}).get("outputs", {}))
+            data["stream_status_time"] = time.monotonic()
+            coordinator.async_set_replayed_data(data)
+        else:
+            continue
+        counts[kind] += 1
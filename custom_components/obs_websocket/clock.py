@@ -0,0 +1,103 @@
+"""Local stream clock for OBS WebSocket."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+import time
+from typing import Any
+
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    OUTPUT_RECONNECTED,
+    OUTPUT_RECONNECTING,
+    OUTPUT_STARTED,
+    OUTPUT_STOPPED,
+)
+
+# Seconds the estimated start may move before it is updated, so that
+# polling jitter does not write a new timestamp on every poll
+STARTED_TOLERANCE = 1.0
+
+
+class OBSStreamClock:
+    """Interpolate the stream duration between GetStreamStatus polls.
+
+    OBS derives ``output_duration`` from the frames sent, so it advances
+    with wall time while the stream is up and stands still while it
+    reconnects. The clock keeps the last known duration and the monotonic
+    time it was valid at, and computes the current duration on read. Polls
+    and ``StreamStateChanged`` events move the anchor.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.started: datetime | None = None
+        self._duration: float | None = None
+        self._anchor = 0.0
+        self._running = False
+
+    def sync(self, status: Any, at: float) -> None:
+        """Anchor on a GetStreamStatus response valid at monotonic time ``at``."""
+        if not getattr(status, "output_active", False):
+            self._clear()
+            return
+        self._set(
+            getattr(status, "output_duration", None) or 0,
+            at,
+            not getattr(status, "output_reconnecting", False),
+        )
+
+    @callback
+    def async_handle_state_changed(self, data: dict[str, Any]) -> None:
+        """Anchor on a StreamStateChanged event as it arrives."""
+        state = data.get("outputState")
+        now = time.monotonic()
+        if state == OUTPUT_STARTED:
+            self._set(0, now, True)
+        elif state == OUTPUT_STOPPED:
+            self._clear()
+        elif self._duration is None:
+            return
+        elif state == OUTPUT_RECONNECTING:
+            self._set(self.duration_ms(now) or 0, now, False)
+        elif state == OUTPUT_RECONNECTED:
+            self._set(self._duration, now, True)
+
+    def duration_ms(self, now: float | None = None) -> int | None:
+        """Return the stream duration in milliseconds, None while idle."""
+        if self._duration is None:
+            return None
+        if not self._running:
+            return int(self._duration)
+        if now is None:
+            now = time.monotonic()
+        return int(self._duration + max(now - self._anchor, 0.0) * 1000)
+
+    def timecode(self, now: float | None = None) -> str | None:
+        """Return the stream duration formatted like ``output_timecode``."""
+        if (duration := self.duration_ms(now)) is None:
+            return None
+        seconds, millis = divmod(duration, 1000)
+        minutes, seconds = divmod(seconds, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours:02d}:{minutes:02d}:{seconds:02d}.{millis:03d}"
+
+    def _set(self, duration: float, at: float, running: bool) -> None:
+        self._duration = duration
+        self._anchor = at
+        self._running = running
+        # Wall time the stream would have started at without reconnects
+        elapsed = duration + max(time.monotonic() - at, 0.0) * 1000 * running
+        started = dt_util.utcnow() - timedelta(milliseconds=elapsed)
+        if (
+            self.started is None
+            or abs((started - self.started).total_seconds()) > STARTED_TOLERANCE
+        ):
+            self.started = started
+
+    def _clear(self) -> None:
+        self.started = None
+        self._duration = None
+        self._running = False
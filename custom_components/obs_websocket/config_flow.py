@@ -7,25 +7,73 @@ from typing import Any
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.config_entries import ConfigFlowResult
-from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import (
+    SOURCE_INTEGRATION_DISCOVERY,
+    ConfigEntry,
+    ConfigFlowResult,
+    OptionsFlow,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import discovery_flow
+from homeassistant.helpers.selector import SelectSelector, SelectSelectorConfig
 
-from .const import DEFAULT_HOST, DEFAULT_PORT, DOMAIN
+from .const import (
+    CONF_ACTIVE_INTERVAL,
+    CONF_EVENT_COALESCE_INTERVAL,
+    CONF_EVENT_SUBSCRIPTIONS,
+    CONF_FEATURES,
+    CONF_FORWARD_EVENTS,
+    CONF_HEALTH_BITRATE_DROP,
+    CONF_HEALTH_CONGESTION,
+    CONF_HEALTH_HYSTERESIS,
+    CONF_HEALTH_SKIPPED_RATIO,
+    CONF_IDLE_INTERVAL,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SCREENSHOT_FORMAT,
+    CONF_SCREENSHOT_HEIGHT,
+    CONF_SCREENSHOT_MAX_RATE,
+    CONF_SCREENSHOT_QUALITY,
+    CONF_SCREENSHOT_TTL,
+    CONF_SCREENSHOT_WIDTH,
+    CONF_STATE_THROTTLE,
+    DEFAULT_ACTIVE_INTERVAL,
+    DEFAULT_DISCOVERY_NETWORK,
+    DEFAULT_EVENT_COALESCE_INTERVAL,
+    DEFAULT_EVENT_SUBSCRIPTIONS,
+    DEFAULT_FEATURES,
+    DEFAULT_FORWARD_EVENTS,
+    DEFAULT_HEALTH_BITRATE_DROP,
+    DEFAULT_HEALTH_CONGESTION,
+    DEFAULT_HEALTH_HYSTERESIS,
+    DEFAULT_HEALTH_SKIPPED_RATIO,
+    DEFAULT_HOST,
+    DEFAULT_IDLE_INTERVAL,
+    DEFAULT_PORT,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_SCREENSHOT_FORMAT,
+    DEFAULT_SCREENSHOT_HEIGHT,
+    DEFAULT_SCREENSHOT_MAX_RATE,
+    DEFAULT_SCREENSHOT_QUALITY,
+    DEFAULT_SCREENSHOT_TTL,
+    DEFAULT_SCREENSHOT_WIDTH,
+    DEFAULT_STATE_THROTTLE,
+    DOMAIN,
+    FEATURE_PLATFORMS,
+    OPTIONAL_EVENT_SUBSCRIPTIONS,
+    SCREENSHOT_FORMATS,
+)
+from .discovery import OBSServer, async_discover, parse_targets
+from .session import async_validate_session
 
 
-async def _test_connection(hass: HomeAssistant, host: str, port: int, password: str) -> None:
-    """Test that we can connect to OBS WebSocket. Raises on failure."""
-    import obsws_python as obs
+async def _test_connection(
+    hass: HomeAssistant, host: str, port: int, password: str
+) -> dict[str, Any]:
+    """Test that we can connect to OBS WebSocket. Raises on failure.
 
-    def _connect() -> None:
-        kwargs: dict[str, Any] = {"host": host, "port": port, "timeout": 5}
-        if password:
-            kwargs["password"] = password
-        client = obs.ReqClient(**kwargs)
-        client.get_version()
-        client.disconnect()
-
-    await hass.async_add_executor_job(_connect)
+    The authenticated session is kept for the entry setup that follows.
+    """
+    return await async_validate_session(hass, host, port, password)
 
 
 class OBSWebSocketConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -33,31 +81,47 @@ class OBSWebSocketConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    _discovered: dict[str, OBSServer]
+    _discovered_host: str
+    _discovered_port: int
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(config_entry: ConfigEntry) -> OBSWebSocketOptionsFlow:
+        """Return the options flow."""
+        return OBSWebSocketOptionsFlow()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         """Handle the initial step."""
+        return self.async_show_menu(step_id="user", menu_options=["manual", "discover"])
+
+    async def async_step_manual(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Handle a server entered by hand."""
         errors: dict[str, str] = {}
 
         if user_input is not None:
             host = user_input["host"]
             port = user_input["port"]
             password = user_input.get("password", "")
+            await self.async_set_unique_id(f"{host}:{port}")
+            self._abort_if_unique_id_configured()
 
             try:
                 await _test_connection(self.hass, host, port, password)
             except Exception:
                 errors["base"] = "cannot_connect"
             else:
-                await self.async_set_unique_id(f"{host}:{port}")
-                self._abort_if_unique_id_configured()
                 return self.async_create_entry(
                     title=host,
                     data={"host": host, "port": port, "password": password},
                 )
 
         return self.async_show_form(
-            step_id="user",
+            step_id="manual",
             data_schema=vol.Schema(
                 {
                     vol.Required("host", default=DEFAULT_HOST): str,
@@ -68,6 +132,148 @@ class OBSWebSocketConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_discover(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Scan a network and port range for OBS WebSocket servers."""
+        errors: dict[str, str] = {}
+        user_input = user_input or {}
+
+        if user_input:
+            try:
+                targets = parse_targets(user_input["network"], user_input["ports"])
+            except OverflowError:
+                errors["base"] = "too_many_hosts"
+            except ValueError:
+                errors["base"] = "invalid_network"
+            else:
+                configured = self._async_current_ids()
+                self._discovered = {
+                    key: server
+                    for server in await async_discover(self.hass, targets)
+                    if (key := f"{server.host}:{server.port}") not in configured
+                }
+                if self._discovered:
+                    return await self.async_step_discover_select()
+                errors["base"] = "no_servers_found"
+
+        return self.async_show_form(
+            step_id="discover",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        "network",
+                        default=user_input.get("network", DEFAULT_DISCOVERY_NETWORK),
+                    ): str,
+                    vol.Required(
+                        "ports", default=user_input.get("ports", str(DEFAULT_PORT))
+                    ): str,
+                }
+            ),
+            errors=errors,
+        )
+
+    async def async_step_discover_select(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Let the user pick the discovered servers to add.
+
+        Each selected server gets a discovery flow of its own, which adds it
+        right away when it connects with the given password.
+        """
+        if user_input is not None:
+            for key in user_input["servers"]:
+                server = self._discovered[key]
+                discovery_flow.async_create_flow(
+                    self.hass,
+                    DOMAIN,
+                    context={"source": SOURCE_INTEGRATION_DISCOVERY},
+                    data={
+                        "host": server.host,
+                        "port": server.port,
+                        "password": (
+                            user_input.get("password", "")
+                            if server.auth_required
+                            else ""
+                        ),
+                    },
+                )
+            return self.async_abort(
+                reason="discovery_started",
+                description_placeholders={"count": str(len(user_input["servers"]))},
+            )
+
+        options = [
+            {
+                "value": key,
+                "label": (
+                    f"{key} (obs-websocket {server.websocket_version}"
+                    f"{', password required' if server.auth_required else ''})"
+                ),
+            }
+            for key, server in self._discovered.items()
+        ]
+        return self.async_show_form(
+            step_id="discover_select",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        "servers", default=list(self._discovered)
+                    ): SelectSelector(
+                        SelectSelectorConfig(options=options, multiple=True)
+                    ),
+                    vol.Optional("password", default=""): str,
+                }
+            ),
+            description_placeholders={"count": str(len(options))},
+        )
+
+    async def async_step_integration_discovery(
+        self, discovery_info: dict[str, Any]
+    ) -> ConfigFlowResult:
+        """Handle a server selected in the discover step."""
+        self._discovered_host = discovery_info["host"]
+        self._discovered_port = discovery_info["port"]
+        await self.async_set_unique_id(
+            f"{self._discovered_host}:{self._discovered_port}"
+        )
+        self._abort_if_unique_id_configured()
+        self.context["title_placeholders"] = {"host": self._discovered_host}
+        return await self.async_step_discovery_confirm(
+            {"password": discovery_info["password"]}
+        )
+
+    async def async_step_discovery_confirm(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Add a discovered server, asking for the password if it fails."""
+        errors: dict[str, str] = {}
+        host = self._discovered_host
+        port = self._discovered_port
+
+        if user_input is not None:
+            password = user_input.get("password", "")
+            try:
+                await _test_connection(self.hass, host, port, password)
+            except Exception:
+                errors["base"] = "cannot_connect"
+            else:
+                return self.async_create_entry(
+                    title=host,
+                    data={"host": host, "port": port, "password": password},
+                )
+
+        return self.async_show_form(
+            step_id="discovery_confirm",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional("password", default=""): str,
+                }
+            ),
+            errors=errors,
+            description_placeholders={"host": host, "port": str(port)},
+        )
+
     async def async_step_reauth(
         self, entry_data: dict[str, Any]
     ) -> ConfigFlowResult:
@@ -119,14 +325,14 @@ class OBSWebSocketConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             host = user_input["host"]
             port = user_input["port"]
             password = user_input.get("password", "")
+            await self.async_set_unique_id(f"{host}:{port}")
+            self._abort_if_unique_id_configured()
 
             try:
                 await _test_connection(self.hass, host, port, password)
             except Exception:
                 errors["base"] = "cannot_connect"
             else:
-                await self.async_set_unique_id(f"{host}:{port}")
-                self._abort_if_unique_id_configured()
                 return self.async_update_reload_and_abort(
                     reconfigure_entry,
                     data={"host": host, "port": port, "password": password},
@@ -149,3 +355,142 @@ class OBSWebSocketConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class OBSWebSocketOptionsFlow(OptionsFlow):
+    """Tune polling, timeouts, subscriptions and throttling of an entry.
+
+    Changed options are applied to the running connection by the update
+    listener of the entry, without reconnecting. Only changed features
+    reload the entry, as they decide which platforms are set up.
+    """
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> ConfigFlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            # Keep options without a field here
+            return self.async_create_entry(
+                data={**self.config_entry.options, **user_input}
+            )
+
+        options = self.config_entry.options
+        forward_events = options.get(CONF_FORWARD_EVENTS, DEFAULT_FORWARD_EVENTS)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_FEATURES,
+                        default=options.get(CONF_FEATURES, DEFAULT_FEATURES),
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=list(FEATURE_PLATFORMS),
+                            multiple=True,
+                            translation_key=CONF_FEATURES,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_IDLE_INTERVAL,
+                        default=options.get(CONF_IDLE_INTERVAL, DEFAULT_IDLE_INTERVAL),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=5, max=3600)),
+                    vol.Required(
+                        CONF_ACTIVE_INTERVAL,
+                        default=options.get(
+                            CONF_ACTIVE_INTERVAL, DEFAULT_ACTIVE_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+                    vol.Required(
+                        CONF_REQUEST_TIMEOUT,
+                        default=options.get(
+                            CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=1, max=60)),
+                    vol.Required(
+                        CONF_EVENT_SUBSCRIPTIONS,
+                        # Entries saved before the required categories were
+                        # left out of the choice may still list them
+                        default=[
+                            category
+                            for category in options.get(
+                                CONF_EVENT_SUBSCRIPTIONS, DEFAULT_EVENT_SUBSCRIPTIONS
+                            )
+                            if category in OPTIONAL_EVENT_SUBSCRIPTIONS
+                        ],
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=OPTIONAL_EVENT_SUBSCRIPTIONS,
+                            multiple=True,
+                            translation_key=CONF_EVENT_SUBSCRIPTIONS,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_STATE_THROTTLE,
+                        default=options.get(
+                            CONF_STATE_THROTTLE, DEFAULT_STATE_THROTTLE
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+                    vol.Required(
+                        CONF_FORWARD_EVENTS, default=forward_events
+                    ): SelectSelector(
+                        SelectSelectorConfig(
+                            options=sorted({*DEFAULT_FORWARD_EVENTS, *forward_events}),
+                            multiple=True,
+                            custom_value=True,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_EVENT_COALESCE_INTERVAL,
+                        default=options.get(
+                            CONF_EVENT_COALESCE_INTERVAL,
+                            DEFAULT_EVENT_COALESCE_INTERVAL,
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+                    **{
+                        vol.Required(key, default=options.get(key, default)): vol.All(
+                            vol.Coerce(float), vol.Range(min=0, max=1)
+                        )
+                        for key, default in (
+                            (CONF_HEALTH_CONGESTION, DEFAULT_HEALTH_CONGESTION),
+                            (CONF_HEALTH_SKIPPED_RATIO, DEFAULT_HEALTH_SKIPPED_RATIO),
+                            (CONF_HEALTH_BITRATE_DROP, DEFAULT_HEALTH_BITRATE_DROP),
+                            (CONF_HEALTH_HYSTERESIS, DEFAULT_HEALTH_HYSTERESIS),
+                        )
+                    },
+                    **{
+                        vol.Required(key, default=options.get(key, default)): vol.All(
+                            vol.Coerce(int), vol.Range(min=0, max=4096)
+                        )
+                        for key, default in (
+                            (CONF_SCREENSHOT_WIDTH, DEFAULT_SCREENSHOT_WIDTH),
+                            (CONF_SCREENSHOT_HEIGHT, DEFAULT_SCREENSHOT_HEIGHT),
+                        )
+                    },
+                    vol.Required(
+                        CONF_SCREENSHOT_FORMAT,
+                        default=options.get(
+                            CONF_SCREENSHOT_FORMAT, DEFAULT_SCREENSHOT_FORMAT
+                        ),
+                    ): SelectSelector(
+                        SelectSelectorConfig(options=SCREENSHOT_FORMATS)
+                    ),
+                    vol.Required(
+                        CONF_SCREENSHOT_QUALITY,
+                        default=options.get(
+                            CONF_SCREENSHOT_QUALITY, DEFAULT_SCREENSHOT_QUALITY
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=-1, max=100)),
+                    vol.Required(
+                        CONF_SCREENSHOT_TTL,
+                        default=options.get(CONF_SCREENSHOT_TTL, DEFAULT_SCREENSHOT_TTL),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=300)),
+                    vol.Required(
+                        CONF_SCREENSHOT_MAX_RATE,
+                        default=options.get(
+                            CONF_SCREENSHOT_MAX_RATE, DEFAULT_SCREENSHOT_MAX_RATE
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=600)),
+                }
+            ),
+        )
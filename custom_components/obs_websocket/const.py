@@ -9,6 +9,160 @@ DOMAIN: Final = "obs_websocket"
 DEFAULT_HOST: Final = "localhost"
 DEFAULT_PORT: Final = 4455
 
+# Entry data key holding the GetVersion result of the last session
+CONF_CAPABILITIES: Final = "capabilities"
+
 HEARTBEAT_INTERVAL: Final = 60
 
-PLATFORMS: Final[list[str]] = ["sensor"]
+# Options tuning the connection of an entry. Polls run every idle interval,
+# or every active interval while streaming; state writes of the sensors are
+# at most one per throttle interval (0 writes every update).
+CONF_IDLE_INTERVAL: Final = "idle_interval"
+CONF_ACTIVE_INTERVAL: Final = "active_interval"
+CONF_REQUEST_TIMEOUT: Final = "request_timeout"
+CONF_EVENT_SUBSCRIPTIONS: Final = "event_subscriptions"
+CONF_STATE_THROTTLE: Final = "state_throttle"
+
+DEFAULT_IDLE_INTERVAL: Final = HEARTBEAT_INTERVAL
+DEFAULT_ACTIVE_INTERVAL: Final = HEARTBEAT_INTERVAL
+DEFAULT_REQUEST_TIMEOUT: Final = 10
+DEFAULT_STATE_THROTTLE: Final = 0.0
+
+# Stream health thresholds: congestion average, skipped frame ratio and
+# bitrate drop below baseline each mark the stream degraded at their
+# threshold; it recovers when the score falls below 1 - hysteresis
+CONF_HEALTH_CONGESTION: Final = "health_congestion"
+CONF_HEALTH_SKIPPED_RATIO: Final = "health_skipped_ratio"
+CONF_HEALTH_BITRATE_DROP: Final = "health_bitrate_drop"
+CONF_HEALTH_HYSTERESIS: Final = "health_hysteresis"
+
+DEFAULT_HEALTH_CONGESTION: Final = 0.3
+DEFAULT_HEALTH_SKIPPED_RATIO: Final = 0.02
+DEFAULT_HEALTH_BITRATE_DROP: Final = 0.5
+DEFAULT_HEALTH_HYSTERESIS: Final = 0.2
+
+# obs-websocket event subscription bits by category
+EVENT_SUBSCRIPTIONS: Final[dict[str, int]] = {
+    "general": 1 << 0,
+    "config": 1 << 1,
+    "scenes": 1 << 2,
+    "inputs": 1 << 3,
+    "transitions": 1 << 4,
+    "filters": 1 << 5,
+    "outputs": 1 << 6,
+    "scene_items": 1 << 7,
+    "media_inputs": 1 << 8,
+    "vendors": 1 << 9,
+    "ui": 1 << 10,
+    "input_volume_meters": 1 << 16,
+    "input_active_state_changed": 1 << 17,
+    "input_show_state_changed": 1 << 18,
+    "scene_item_transform_changed": 1 << 19,
+}
+# Categories the integration follows itself: the response cache, scene
+# item switches, studio state, media players, recording files, device
+# triggers and the stream clock all go stale without them, so they are
+# always subscribed whatever the options say
+REQUIRED_EVENT_SUBSCRIPTIONS: Final[list[str]] = [
+    "config",
+    "scenes",
+    "inputs",
+    "transitions",
+    "outputs",
+    "scene_items",
+    "media_inputs",
+    "ui",
+]
+# Categories the options may add on top of the required ones
+OPTIONAL_EVENT_SUBSCRIPTIONS: Final[list[str]] = [
+    category
+    for category in EVENT_SUBSCRIPTIONS
+    if category not in REQUIRED_EVENT_SUBSCRIPTIONS
+]
+# The optional low volume categories; with the required ones these are the
+# categories obsws-python subscribes to by default
+DEFAULT_EVENT_SUBSCRIPTIONS: Final[list[str]] = [
+    category
+    for category in OPTIONAL_EVENT_SUBSCRIPTIONS
+    if EVENT_SUBSCRIPTIONS[category] < 1 << 16
+]
+
+# Seconds a connection validated by the config flow waits for entry setup
+SESSION_HANDOFF_TIMEOUT: Final = 60
+
+RESPONSE_CACHE_SIZE: Final = 128
+
+# Network discovery: probes open at once across all scans, seconds per
+# probe, and the largest scan (hosts times ports) the config flow accepts
+DISCOVERY_CONCURRENCY: Final = 64
+DISCOVERY_TIMEOUT: Final = 1.0
+DISCOVERY_MAX_PROBES: Final = 4096
+DEFAULT_DISCOVERY_NETWORK: Final = "192.168.1.0/24"
+
+CAPTURE_DIR: Final = "obs_websocket_captures"
+DEFAULT_CAPTURE_MAX_SIZE: Final = 10  # MiB
+DEFAULT_CAPTURE_BACKUPS: Final = 5
+
+PROFILE_DIR: Final = "obs_websocket_profiles"
+
+EVENT_OBS: Final = "obs_websocket_event"
+
+# outputState values of the StreamStateChanged and RecordStateChanged events
+OUTPUT_STARTED: Final = "OBS_WEBSOCKET_OUTPUT_STARTED"
+OUTPUT_STOPPED: Final = "OBS_WEBSOCKET_OUTPUT_STOPPED"
+OUTPUT_RECONNECTING: Final = "OBS_WEBSOCKET_OUTPUT_RECONNECTING"
+OUTPUT_RECONNECTED: Final = "OBS_WEBSOCKET_OUTPUT_RECONNECTED"
+
+CONF_FORWARD_EVENTS: Final = "forward_events"
+CONF_EVENT_COALESCE_INTERVAL: Final = "event_coalesce_interval"
+
+DEFAULT_FORWARD_EVENTS: Final[list[str]] = [
+    "StreamStateChanged",
+    "RecordStateChanged",
+    "CurrentProgramSceneChanged",
+]
+DEFAULT_EVENT_COALESCE_INTERVAL: Final = 1.0
+
+# Optional features of an entry. Only the platforms, and the subsystems
+# behind them, of the enabled features are loaded; the stream status
+# sensors and the binary sensors are always loaded.
+CONF_FEATURES: Final = "features"
+FEATURE_CAMERA: Final = "camera"
+FEATURE_MEDIA_INPUTS: Final = "media_inputs"
+FEATURE_SCENE_ITEMS: Final = "scene_items"
+FEATURE_STUDIO_MODE: Final = "studio_mode"
+FEATURE_HOTKEYS: Final = "hotkeys"
+FEATURE_LIVE_STATS: Final = "live_stats"
+FEATURE_EVENT_FORWARDING: Final = "event_forwarding"
+
+BASE_PLATFORMS: Final[list[str]] = ["binary_sensor", "sensor"]
+FEATURE_PLATFORMS: Final[dict[str, list[str]]] = {
+    FEATURE_CAMERA: ["camera"],
+    FEATURE_MEDIA_INPUTS: ["media_player"],
+    FEATURE_SCENE_ITEMS: ["switch"],
+    FEATURE_STUDIO_MODE: ["button", "number", "select", "switch"],
+    # Subsystems without entities of their own
+    FEATURE_HOTKEYS: [],
+    FEATURE_LIVE_STATS: [],
+    FEATURE_EVENT_FORWARDING: [],
+}
+DEFAULT_FEATURES: Final[list[str]] = list(FEATURE_PLATFORMS)
+
+# Seconds between live stats samples a subscriber may ask for
+MIN_STATS_INTERVAL: Final = 0.25
+MAX_STATS_INTERVAL: Final = 60.0
+
+CONF_SCREENSHOT_WIDTH: Final = "screenshot_width"
+CONF_SCREENSHOT_HEIGHT: Final = "screenshot_height"
+CONF_SCREENSHOT_FORMAT: Final = "screenshot_format"
+CONF_SCREENSHOT_QUALITY: Final = "screenshot_quality"
+CONF_SCREENSHOT_TTL: Final = "screenshot_ttl"
+CONF_SCREENSHOT_MAX_RATE: Final = "screenshot_max_rate"
+
+DEFAULT_SCREENSHOT_WIDTH: Final = 1280
+DEFAULT_SCREENSHOT_HEIGHT: Final = 0
+DEFAULT_SCREENSHOT_FORMAT: Final = "jpg"
+DEFAULT_SCREENSHOT_QUALITY: Final = 80
+DEFAULT_SCREENSHOT_TTL: Final = 2.0
+DEFAULT_SCREENSHOT_MAX_RATE: Final = 30
+SCREENSHOT_FORMATS: Final[list[str]] = ["jpg", "png", "webp", "bmp"]
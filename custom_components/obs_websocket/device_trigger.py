@@ -0,0 +1,159 @@
+"""Device triggers for OBS WebSocket."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components.device_automation import (
+    DEVICE_TRIGGER_BASE_SCHEMA,
+    InvalidDeviceAutomationConfig,
+)
+from homeassistant.const import CONF_DEVICE_ID, CONF_DOMAIN, CONF_PLATFORM, CONF_TYPE
+from homeassistant.core import CALLBACK_TYPE, HassJob, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers.trigger import TriggerActionType, TriggerInfo
+from homeassistant.helpers.typing import ConfigType
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, OUTPUT_RECONNECTING, OUTPUT_STARTED, OUTPUT_STOPPED
+
+# Trigger type -> (OBS event type, required outputState or None)
+TRIGGERS: dict[str, tuple[str, str | None]] = {
+    "stream_started": ("StreamStateChanged", OUTPUT_STARTED),
+    "stream_stopped": ("StreamStateChanged", OUTPUT_STOPPED),
+    "stream_reconnecting": ("StreamStateChanged", OUTPUT_RECONNECTING),
+    "recording_started": ("RecordStateChanged", OUTPUT_STARTED),
+    "recording_stopped": ("RecordStateChanged", OUTPUT_STOPPED),
+    "scene_switched": ("CurrentProgramSceneChanged", None),
+    "transition_started": ("SceneTransitionStarted", None),
+    "transition_ended": ("SceneTransitionEnded", None),
+}
+
+TRIGGER_EVENTS: frozenset[str] = frozenset(event for event, _ in TRIGGERS.values())
+
+type _Handler = Callable[[dict[str, Any]], None]
+
+TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
+    {vol.Required(CONF_TYPE): vol.In(TRIGGERS)}
+)
+
+
+class OBSTriggerRegistry:
+    """Attached device triggers indexed by config entry and OBS event type.
+
+    The registry outlives config entry reloads, so automations stay attached
+    while an entry reconnects, and dispatching an event only visits the
+    triggers of that entry and event type.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self._triggers: dict[tuple[str, str], list[tuple[str | None, _Handler]]] = {}
+
+    @callback
+    def async_attach(
+        self,
+        entry_id: str,
+        event_type: str,
+        output_state: str | None,
+        handler: _Handler,
+    ) -> CALLBACK_TYPE:
+        """Attach a handler called with the event data."""
+        key = (entry_id, event_type)
+        item = (output_state, handler)
+        self._triggers.setdefault(key, []).append(item)
+
+        @callback
+        def _detach() -> None:
+            triggers = self._triggers[key]
+            triggers.remove(item)
+            if not triggers:
+                del self._triggers[key]
+
+        return _detach
+
+    @callback
+    def async_dispatch(
+        self, entry_id: str, event_type: str, data: dict[str, Any]
+    ) -> None:
+        """Run the triggers attached to an entry's event type."""
+        if not (triggers := self._triggers.get((entry_id, event_type))):
+            return
+        output_state = data.get("outputState")
+        for required_state, handler in list(triggers):
+            if required_state is None or required_state == output_state:
+                handler(data)
+
+
+DATA_TRIGGERS: HassKey[OBSTriggerRegistry] = HassKey(f"{DOMAIN}_triggers")
+
+
+@callback
+def async_get_trigger_registry(hass: HomeAssistant) -> OBSTriggerRegistry:
+    """Return the trigger registry, creating it on first use."""
+    if (registry := hass.data.get(DATA_TRIGGERS)) is None:
+        registry = hass.data[DATA_TRIGGERS] = OBSTriggerRegistry()
+    return registry
+
+
+def _entry_id_for_device(hass: HomeAssistant, device_id: str) -> str:
+    """Return the config entry ID an OBS device belongs to."""
+    if device := dr.async_get(hass).async_get(device_id):
+        for domain, identifier in device.identifiers:
+            if domain == DOMAIN:
+                return identifier
+    raise InvalidDeviceAutomationConfig(f"Device {device_id} is not an OBS device")
+
+
+async def async_get_triggers(
+    hass: HomeAssistant, device_id: str
+) -> list[dict[str, str]]:
+    """List device triggers for an OBS device."""
+    return [
+        {
+            CONF_PLATFORM: "device",
+            CONF_DOMAIN: DOMAIN,
+            CONF_DEVICE_ID: device_id,
+            CONF_TYPE: trigger_type,
+        }
+        for trigger_type in TRIGGERS
+    ]
+
+
+async def async_attach_trigger(
+    hass: HomeAssistant,
+    config: ConfigType,
+    action: TriggerActionType,
+    trigger_info: TriggerInfo,
+) -> CALLBACK_TYPE:
+    """Attach a trigger."""
+    device_id = config[CONF_DEVICE_ID]
+    trigger_type = config[CONF_TYPE]
+    event_type, output_state = TRIGGERS[trigger_type]
+    entry_id = _entry_id_for_device(hass, device_id)
+    trigger_data = trigger_info["trigger_data"]
+    job = HassJob(action, f"OBS device trigger {trigger_info}")
+
+    @callback
+    def _handle(data: dict[str, Any]) -> None:
+        hass.async_run_hass_job(
+            job,
+            {
+                "trigger": {
+                    **trigger_data,
+                    CONF_PLATFORM: "device",
+                    CONF_DOMAIN: DOMAIN,
+                    CONF_DEVICE_ID: device_id,
+                    CONF_TYPE: trigger_type,
+                    "event_data": data,
+                    "description": f"OBS {trigger_type.replace('_', ' ')}",
+                }
+            },
+        )
+
+    return async_get_trigger_registry(hass).async_attach(
+        entry_id, event_type, output_state, _handle
+    )
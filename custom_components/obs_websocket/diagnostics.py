@@ -54,6 +54,7 @@ async def async_get_config_entry_diagnostics(
                 "last_update_success": coordinator.last_update_success,
                 "data": coordinator_data,
             },
+            "telemetry": connection.telemetry.as_dict(),
         },
         TO_REDACT,
     )
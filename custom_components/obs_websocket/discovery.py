@@ -0,0 +1,111 @@
+"""Find OBS WebSocket servers on the local network."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+import ipaddress
+import json
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.hass_dict import HassKey
+
+from .const import (
+    DISCOVERY_CONCURRENCY,
+    DISCOVERY_MAX_PROBES,
+    DISCOVERY_TIMEOUT,
+    DOMAIN,
+)
+
+# Subprotocol OBS negotiates for JSON messages
+_PROTOCOL = "obswebsocket.json"
+
+
+@dataclass(frozen=True)
+class OBSServer:
+    """An OBS WebSocket server that answered with a v5 Hello."""
+
+    host: str
+    port: int
+    websocket_version: str
+    auth_required: bool
+
+
+DATA_DISCOVERY_SEMAPHORE: HassKey[asyncio.Semaphore] = HassKey(
+    f"{DOMAIN}_discovery_semaphore"
+)
+
+
+def parse_targets(network: str, ports: str) -> list[tuple[str, int]]:
+    """Return the host and port pairs of a network and a port range.
+
+    ``network`` is an address or CIDR network and ``ports`` a port or an
+    inclusive range such as ``4455-4460``. Raises ``ValueError`` if either
+    is invalid and ``OverflowError`` if the scan would exceed
+    ``DISCOVERY_MAX_PROBES``.
+    """
+    addresses = ipaddress.ip_network(network.strip(), strict=False)
+    first, _, last = ports.strip().partition("-")
+    port_range = range(int(first), int(last or first) + 1)
+    if not port_range or port_range.start < 1 or port_range.stop > 65536:
+        raise ValueError(f"Invalid port range {ports}")
+    if addresses.num_addresses * len(port_range) > DISCOVERY_MAX_PROBES:
+        raise OverflowError(f"Scanning {network} on {ports} needs too many probes")
+    return [
+        (str(address), port) for address in addresses.hosts() for port in port_range
+    ]
+
+
+async def _async_probe(
+    session: aiohttp.ClientSession, host: str, port: int
+) -> OBSServer | None:
+    """Return the server at an address if it greets like OBS WebSocket v5."""
+    try:
+        async with (
+            asyncio.timeout(DISCOVERY_TIMEOUT),
+            session.ws_connect(
+                f"ws://{host}:{port}", protocols=(_PROTOCOL,), autoping=False
+            ) as ws,
+        ):
+            message = await ws.receive()
+    except (aiohttp.ClientError, OSError, TimeoutError):
+        return None
+    if message.type is not aiohttp.WSMsgType.TEXT:
+        return None
+    try:
+        hello = json.loads(message.data)
+        data = hello["d"]
+        version = data["obsWebSocketVersion"]
+    except (ValueError, KeyError, TypeError):
+        return None
+    if hello.get("op") != 0:
+        return None
+    return OBSServer(host, port, version, "authentication" in data)
+
+
+async def async_discover(
+    hass: HomeAssistant, targets: list[tuple[str, int]]
+) -> list[OBSServer]:
+    """Probe host and port pairs concurrently for OBS WebSocket servers.
+
+    Each probe only reads the Hello sent on connect and closes before
+    identifying. Probes of all scans share one semaphore, so concurrent
+    flows never hold more than ``DISCOVERY_CONCURRENCY`` sockets open.
+    """
+    if (semaphore := hass.data.get(DATA_DISCOVERY_SEMAPHORE)) is None:
+        semaphore = hass.data[DATA_DISCOVERY_SEMAPHORE] = asyncio.Semaphore(
+            DISCOVERY_CONCURRENCY
+        )
+    session = async_get_clientsession(hass)
+
+    async def _async_bounded_probe(host: str, port: int) -> OBSServer | None:
+        async with semaphore:
+            return await _async_probe(session, host, port)
+
+    results = await asyncio.gather(
+        *(_async_bounded_probe(host, port) for host, port in targets)
+    )
+    return [server for server in results if server is not None]
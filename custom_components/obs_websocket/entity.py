@@ -0,0 +1,58 @@
+"""Shared entity helpers for OBS WebSocket."""
+
+from __future__ import annotations
+
+from homeassistant.core import callback
+from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import Entity
+
+from .const import CONF_CAPABILITIES, DOMAIN
+from . import OBSConfigEntry
+
+
+def obs_device_info(entry: OBSConfigEntry) -> DeviceInfo:
+    """Return the device info shared by all entities of an entry."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=f"OBS Studio ({entry.data['host']})",
+        manufacturer="OBS Project",
+        sw_version=entry.data.get(CONF_CAPABILITIES, {}).get("obs_version"),
+    )
+
+
+class OBSStudioEntity(Entity):
+    """Base class for entities of the studio mode and transition state."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, entry: OBSConfigEntry, key: str) -> None:
+        """Initialize."""
+        # Only set up while the studio mode feature is enabled
+        assert entry.runtime_data.studio is not None
+        self._studio = entry.runtime_data.studio
+        self._coordinator = entry.runtime_data.coordinator
+        self._attr_device_info = obs_device_info(entry)
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_translation_key = key
+        self._was_available = False
+
+    @property
+    def available(self) -> bool:
+        """Return if OBS is reachable and the state was fetched."""
+        return self._coordinator.last_update_success and self._studio.synced
+
+    async def async_added_to_hass(self) -> None:
+        """Follow the studio state, and the coordinator for availability."""
+        self._was_available = self.available
+        self.async_on_remove(self._studio.async_add_listener(self.async_write_ha_state))
+        self.async_on_remove(
+            self._coordinator.async_add_listener(self._async_on_coordinator_update)
+        )
+
+    @callback
+    def _async_on_coordinator_update(self) -> None:
+        """Write the state only when availability flips."""
+        if (available := self.available) != self._was_available:
+            self._was_available = available
+            self.async_write_ha_state()
@@ -0,0 +1,135 @@
+"""Forward selected OBS events onto the Home Assistant event bus."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+
+from .const import EVENT_OBS
+
+if TYPE_CHECKING:
+    from . import OBSConnection
+
+# High rate events that are coalesced instead of forwarded one by one
+NOISY_EVENTS: frozenset[str] = frozenset(
+    {
+        "InputVolumeChanged",
+        "InputVolumeMeters",
+        "InputAudioBalanceChanged",
+        "InputAudioSyncOffsetChanged",
+        "InputActiveStateChanged",
+        "InputShowStateChanged",
+        "SceneItemTransformChanged",
+        "SceneItemSelected",
+    }
+)
+
+# Fields identifying what a noisy event is about, so that updates for
+# different inputs or items are coalesced separately
+_SUBJECT_FIELDS = ("inputName", "sourceName", "sceneName", "sceneItemId")
+
+
+class OBSEventForwarder:
+    """Fire allowlisted OBS events as ``obs_websocket_event`` bus events.
+
+    Only allowlisted event types are registered with the connection, so
+    other events never leave the EventClient thread. Noisy event types are
+    rate limited per subject: the first event fires immediately, later ones
+    within ``coalesce_interval`` are merged and the latest is fired when the
+    interval ends.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        connection: OBSConnection,
+        entry_id: str,
+        coalesce_interval: float,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self.connection = connection
+        self.entry_id = entry_id
+        self.coalesce_interval = coalesce_interval
+        self.fired = 0
+        self.coalesced = 0
+        self._unsubs: list[CALLBACK_TYPE] = []
+        self._last_fired: dict[tuple[Any, ...], float] = {}
+        self._pending: dict[tuple[Any, ...], dict[str, Any]] = {}
+        self._timers: dict[tuple[Any, ...], CALLBACK_TYPE] = {}
+
+    @callback
+    def async_set_allowlist(self, event_types: Iterable[str]) -> None:
+        """Replace the forwarded event types."""
+        self.async_stop()
+        for event_type in sorted(set(event_types)):
+            handler: Callable[[dict[str, Any]], None]
+            if event_type in NOISY_EVENTS and self.coalesce_interval > 0:
+                handler = self._async_coalesce(event_type)
+            else:
+                handler = self._async_forward(event_type)
+            self._unsubs.append(
+                self.connection.async_add_listener(event_type, handler)
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop forwarding and drop pending coalesced events."""
+        while self._unsubs:
+            self._unsubs.pop()()
+        for cancel in self._timers.values():
+            cancel()
+        self._timers.clear()
+        self._pending.clear()
+        self._last_fired.clear()
+
+    @callback
+    def _async_fire(self, event_type: str, data: dict[str, Any]) -> None:
+        self.fired += 1
+        self.hass.bus.async_fire(
+            EVENT_OBS,
+            {
+                "entry_id": self.entry_id,
+                "host": self.connection.host,
+                "event_type": event_type,
+                "event_data": data,
+            },
+        )
+
+    def _async_forward(self, event_type: str) -> Callable[[dict[str, Any]], None]:
+        @callback
+        def _forward(data: dict[str, Any]) -> None:
+            self._async_fire(event_type, data)
+
+        return _forward
+
+    def _async_coalesce(self, event_type: str) -> Callable[[dict[str, Any]], None]:
+        @callback
+        def _coalesce(data: dict[str, Any]) -> None:
+            key = (event_type, *(data.get(field) for field in _SUBJECT_FIELDS))
+            now = time.monotonic()
+            if key in self._timers:
+                self.coalesced += 1
+                self._pending[key] = data
+                return
+            wait = self._last_fired.get(key, 0.0) + self.coalesce_interval - now
+            if wait <= 0:
+                self._last_fired[key] = now
+                self._async_fire(event_type, data)
+                return
+            self._pending[key] = data
+            self._timers[key] = self.hass.loop.call_later(
+                wait, self._async_flush, event_type, key
+            ).cancel
+
+        return _coalesce
+
+    @callback
+    def _async_flush(self, event_type: str, key: tuple[Any, ...]) -> None:
+        """Fire the latest event collected during a coalescing interval."""
+        del self._timers[key]
+        self._last_fired[key] = time.monotonic()
+        self._async_fire(event_type, self._pending.pop(key))
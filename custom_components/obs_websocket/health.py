@@ -0,0 +1,160 @@
+"""Incremental stream health scoring for OBS WebSocket."""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any
+
+# Weight of the latest sample in the congestion average
+CONGESTION_ALPHA = 0.3
+# Weights of the latest bitrate in the current and the baseline averages;
+# the baseline follows slowly so that a drop stands out against it
+BITRATE_ALPHA = 0.5
+BASELINE_ALPHA = 0.05
+# Samples the skipped frame ratio and the reconnects are counted over
+HEALTH_WINDOW = 10
+
+
+class OBSStreamHealth:
+    """Score the health of a stream from successive GetStreamStatus samples.
+
+    Each metric is divided by its threshold and the score is the largest of
+    them, so a score of 1 means one metric reached its threshold:
+
+    - the exponentially weighted average of ``output_congestion``,
+    - the ratio of skipped frames over the last ``HEALTH_WINDOW`` samples,
+    - the reconnects started within those samples, against one reconnect,
+    - the drop of the bitrate below its slowly following baseline.
+
+    The stream becomes degraded when the score reaches 1 and recovers only
+    when it falls below ``1 - hysteresis``. Adding a sample is O(1).
+    """
+
+    def __init__(
+        self,
+        congestion: float,
+        skipped_ratio: float,
+        bitrate_drop: float,
+        hysteresis: float,
+    ) -> None:
+        """Initialize."""
+        self.configure(congestion, skipped_ratio, bitrate_drop, hysteresis)
+        self.degraded = False
+        self.score = 0.0
+        self.congestion = 0.0
+        self.skipped_ratio = 0.0
+        self.reconnects = 0
+        self.bitrate: float | None = None
+        self.baseline: float | None = None
+        self._frames: deque[tuple[int, int]] = deque(maxlen=HEALTH_WINDOW + 1)
+        self._reconnect_starts: deque[bool] = deque(maxlen=HEALTH_WINDOW)
+        self._reconnecting = False
+        self._last_output: tuple[int, int] | None = None
+
+    def configure(
+        self,
+        congestion: float,
+        skipped_ratio: float,
+        bitrate_drop: float,
+        hysteresis: float,
+    ) -> None:
+        """Set the thresholds, applied from the next sample."""
+        self.congestion_threshold = congestion
+        self.skipped_ratio_threshold = skipped_ratio
+        self.bitrate_drop_threshold = bitrate_drop
+        self.hysteresis = hysteresis
+
+    def reset(self) -> None:
+        """Forget the samples of a stream that ended."""
+        self.degraded = False
+        self.score = 0.0
+        self.congestion = 0.0
+        self.skipped_ratio = 0.0
+        self.reconnects = 0
+        self.bitrate = None
+        self.baseline = None
+        self._frames.clear()
+        self._reconnect_starts.clear()
+        self._reconnecting = False
+        self._last_output = None
+
+    @property
+    def bitrate_drop(self) -> float:
+        """Return how far the bitrate is below its baseline, from 0 to 1."""
+        if self.bitrate is None or not self.baseline:
+            return 0.0
+        return max(0.0, 1 - self.bitrate / self.baseline)
+
+    def add(self, status: Any) -> None:
+        """Score a GetStreamStatus sample; idle streams reset the state."""
+        if not getattr(status, "output_active", False):
+            self.reset()
+            return
+
+        congestion = getattr(status, "output_congestion", None) or 0.0
+        self.congestion += CONGESTION_ALPHA * (congestion - self.congestion)
+
+        frames = self._frames
+        frames.append(
+            (
+                getattr(status, "output_skipped_frames", None) or 0,
+                getattr(status, "output_total_frames", None) or 0,
+            )
+        )
+        skipped = frames[-1][0] - frames[0][0]
+        total = frames[-1][1] - frames[0][1]
+        self.skipped_ratio = skipped / total if total > 0 else 0.0
+
+        reconnecting = bool(getattr(status, "output_reconnecting", False))
+        started = reconnecting and not self._reconnecting
+        self._reconnecting = reconnecting
+        if len(self._reconnect_starts) == HEALTH_WINDOW:
+            self.reconnects -= self._reconnect_starts[0]
+        self._reconnect_starts.append(started)
+        self.reconnects += started
+
+        self._add_bitrate(
+            getattr(status, "output_bytes", None) or 0,
+            getattr(status, "output_duration", None) or 0,
+        )
+
+        self.score = max(
+            _ratio(self.congestion, self.congestion_threshold),
+            _ratio(self.skipped_ratio, self.skipped_ratio_threshold),
+            float(self.reconnects),
+            _ratio(self.bitrate_drop, self.bitrate_drop_threshold),
+        )
+        if self.degraded:
+            self.degraded = self.score >= 1 - self.hysteresis
+        else:
+            self.degraded = self.score >= 1
+
+    def _add_bitrate(self, output_bytes: int, duration_ms: int) -> None:
+        """Update the bitrate averages from the bytes sent since the last sample."""
+        last, self._last_output = self._last_output, (output_bytes, duration_ms)
+        if last is None or duration_ms <= last[1] or output_bytes < last[0]:
+            return
+        bitrate = (output_bytes - last[0]) * 8 / (duration_ms - last[1])  # kbit/s
+        if self.bitrate is None or self.baseline is None:
+            self.bitrate = self.baseline = bitrate
+            return
+        self.bitrate += BITRATE_ALPHA * (bitrate - self.bitrate)
+        # A degraded stream must not drag its own baseline down
+        if not self.degraded:
+            self.baseline += BASELINE_ALPHA * (bitrate - self.baseline)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics behind the score."""
+        return {
+            "score": round(self.score, 3),
+            "congestion": round(self.congestion, 4),
+            "skipped_ratio": round(self.skipped_ratio, 4),
+            "reconnects": self.reconnects,
+            "bitrate_kbps": None if self.bitrate is None else round(self.bitrate, 1),
+            "baseline_kbps": None if self.baseline is None else round(self.baseline, 1),
+            "bitrate_drop": round(self.bitrate_drop, 3),
+        }
+
+
+def _ratio(value: float, threshold: float) -> float:
+    return value / threshold if threshold > 0 else 0.0
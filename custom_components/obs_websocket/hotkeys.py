@@ -0,0 +1,84 @@
+"""Hotkey index for OBS WebSocket."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import OBSConfigEntry, OBSConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+# Scenes and sources register hotkeys of their own, so these events make
+# the hotkey list stale
+STALE_EVENTS: tuple[str, ...] = (
+    "SceneCreated",
+    "SceneRemoved",
+    "InputCreated",
+    "InputRemoved",
+)
+
+
+class OBSHotkeyIndex:
+    """Names of the hotkeys OBS offers, used to validate service calls.
+
+    The list is fetched with ``GetHotkeyList`` on each new session. Events
+    that add or remove hotkeys only mark it stale, and the next lookup
+    fetches it again, so validating a hotkey usually needs no round trip.
+    """
+
+    def __init__(self, entry: OBSConfigEntry, connection: OBSConnection) -> None:
+        """Initialize."""
+        self._entry = entry
+        self.connection = connection
+        self.names: frozenset[str] | None = None
+        self._stale = True
+
+    async def async_start(self) -> None:
+        """Subscribe to events and fetch the hotkey list."""
+        entry = self._entry
+        for event_type in STALE_EVENTS:
+            entry.async_on_unload(
+                self.connection.async_add_listener(event_type, self._async_on_stale)
+            )
+        entry.async_on_unload(
+            self.connection.async_add_connect_listener(self._async_on_connect)
+        )
+        await self.async_refresh()
+
+    async def async_refresh(self) -> None:
+        """Fetch the hotkey list."""
+        if not self.connection.supports("GetHotkeyList"):
+            return
+        self._stale = False
+        try:
+            response = await self.connection.async_request("GetHotkeyList")
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot fetch the hotkey list: %s", err)
+            self._stale = True
+            return
+        self.names = frozenset(response.get("hotkeys", ()))
+
+    async def async_contains(self, name: str) -> bool:
+        """Return whether OBS offers a hotkey, assuming so while unknown."""
+        if self._stale:
+            await self.async_refresh()
+        return self.names is None or name in self.names
+
+    @callback
+    def _async_on_stale(self, data: dict[str, Any]) -> None:
+        self._stale = True
+
+    @callback
+    def _async_on_connect(self) -> None:
+        # Plugins loaded by the new OBS session may register other hotkeys
+        self._stale = True
+        self._entry.async_create_background_task(
+            self.connection.hass, self.async_refresh(), f"{DOMAIN} hotkeys"
+        )
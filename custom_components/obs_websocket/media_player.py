@@ -0,0 +1,422 @@
+"""Media player platform for OBS WebSocket media inputs."""
+
+from __future__ import annotations
+
+from datetime import datetime
+import logging
+from typing import Any
+
+from homeassistant.components.media_player import (
+    MediaPlayerEntity,
+    MediaPlayerEntityFeature,
+    MediaPlayerState,
+)
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_platform, entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+from . import OBSConfigEntry, OBSConnection, OBSCoordinator
+from .entity import obs_device_info
+from .services import EXECUTION_TYPES
+
+_LOGGER = logging.getLogger(__name__)
+
+PARALLEL_UPDATES = 1
+
+SERVICE_RESTART_MEDIA = "restart_media"
+
+# Input kinds that play media files, with ``unversionedInputKind`` names
+MEDIA_INPUT_KINDS: frozenset[str] = frozenset({"ffmpeg_source", "vlc_source"})
+# Input kinds with a playlist to skip through
+PLAYLIST_INPUT_KINDS: frozenset[str] = frozenset({"vlc_source"})
+
+MEDIA_STATES: dict[str, MediaPlayerState] = {
+    "OBS_MEDIA_STATE_PLAYING": MediaPlayerState.PLAYING,
+    "OBS_MEDIA_STATE_OPENING": MediaPlayerState.BUFFERING,
+    "OBS_MEDIA_STATE_BUFFERING": MediaPlayerState.BUFFERING,
+    "OBS_MEDIA_STATE_PAUSED": MediaPlayerState.PAUSED,
+}
+
+ACTION_PLAY = "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_PLAY"
+ACTION_PAUSE = "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_PAUSE"
+ACTION_STOP = "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_STOP"
+ACTION_RESTART = "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_RESTART"
+ACTION_NEXT = "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_NEXT"
+ACTION_PREVIOUS = "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_PREVIOUS"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: OBSConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up OBS WebSocket media players from a config entry."""
+    platform = entity_platform.async_get_current_platform()
+    platform.async_register_entity_service(
+        SERVICE_RESTART_MEDIA, None, "async_restart_media"
+    )
+    index = OBSMediaInputIndex(hass, entry, async_add_entities)
+    await index.async_start()
+
+
+def _unique_id_prefix(entry: OBSConfigEntry) -> str:
+    return f"{entry.entry_id}_media_input_"
+
+
+def _input_key(data: dict[str, Any]) -> str:
+    """Return the key of an input, its UUID where OBS reports one."""
+    return data.get("inputUuid") or data["inputName"]
+
+
+def _input_kind(data: dict[str, Any]) -> str | None:
+    return data.get("unversionedInputKind") or data.get("inputKind")
+
+
+class OBSMediaInputIndex:
+    """Media inputs of OBS, tracked from events after one status each.
+
+    Each session lists the inputs once and fetches the status of all media
+    inputs in one batch. Playback is then followed from media input events
+    alone, and positions are extrapolated by the frontend from the anchor.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: OBSConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._entry = entry
+        self.connection: OBSConnection = entry.runtime_data.connection
+        self.coordinator: OBSCoordinator = entry.runtime_data.coordinator
+        self._async_add_entities = async_add_entities
+        self._inputs: dict[str, OBSMediaInputPlayer] = {}
+        self._available = self.coordinator.last_update_success
+
+    async def async_start(self) -> None:
+        """Subscribe to events and load the media inputs."""
+        entry = self._entry
+        for event_type, handler in (
+            ("MediaInputPlaybackStarted", self._async_on_playback_started),
+            ("MediaInputPlaybackEnded", self._async_on_playback_ended),
+            ("MediaInputActionTriggered", self._async_on_action_triggered),
+            ("InputCreated", self._async_on_input_created),
+            ("InputRemoved", self._async_on_input_removed),
+            ("InputNameChanged", self._async_on_input_name_changed),
+        ):
+            entry.async_on_unload(self.connection.async_add_listener(event_type, handler))
+        entry.async_on_unload(
+            self.connection.async_add_connect_listener(self._async_on_connect)
+        )
+        entry.async_on_unload(
+            self.coordinator.async_add_listener(self._async_on_coordinator_update)
+        )
+        await self._async_sync()
+
+    async def _async_sync(self) -> None:
+        """List the media inputs and anchor each on its current status."""
+        try:
+            response = await self.connection.async_request("GetInputList")
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot list inputs: %s", err)
+            return
+        inputs = {
+            _input_key(data): data
+            for data in response.get("inputs", [])
+            if _input_kind(data) in MEDIA_INPUT_KINDS
+        }
+        for key in set(self._inputs) - set(inputs):
+            self._async_remove_input(key)
+        new_entities: list[OBSMediaInputPlayer] = []
+        for key, data in inputs.items():
+            if (entity := self._inputs.get(key)) is None:
+                entity = self._inputs[key] = OBSMediaInputPlayer(
+                    self, key, data["inputName"], _input_kind(data)
+                )
+                new_entities.append(entity)
+            else:
+                entity.async_set_input_name(data["inputName"])
+        await self._async_fetch_status(list(self._inputs.values()))
+        if new_entities:
+            self._async_add_entities(new_entities)
+
+    async def _async_fetch_status(self, entities: list[OBSMediaInputPlayer]) -> None:
+        """Anchor media inputs on GetMediaInputStatus, batched in one request."""
+        if not entities:
+            return
+        try:
+            results = await self.connection.async_request_batch(
+                [
+                    {
+                        "requestType": "GetMediaInputStatus",
+                        "requestData": {"inputName": entity.input_name},
+                    }
+                    for entity in entities
+                ],
+                EXECUTION_TYPES["serial_realtime"],
+            )
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot fetch media input status: %s", err)
+            return
+        for entity, result in zip(entities, results, strict=False):
+            if result.get("requestStatus", {}).get("result"):
+                entity.async_set_status(result.get("responseData") or {})
+
+    def _entity(self, data: dict[str, Any]) -> OBSMediaInputPlayer | None:
+        return self._inputs.get(_input_key(data))
+
+    @callback
+    def _async_remove_input(self, key: str) -> None:
+        """Remove a media player and its registry entry without reloading."""
+        entity = self._inputs.pop(key)
+        ent_reg = er.async_get(self.hass)
+        if entity_id := ent_reg.async_get_entity_id(
+            "media_player", DOMAIN, entity.unique_id
+        ):
+            ent_reg.async_remove(entity_id)
+        elif entity.hass is not None:
+            self.hass.async_create_task(entity.async_remove())
+
+    @callback
+    def _async_on_playback_started(self, data: dict[str, Any]) -> None:
+        if entity := self._entity(data):
+            entity.async_set_playing_from(0.0)
+            if entity.media_duration is None:
+                self._async_refetch(entity)
+
+    @callback
+    def _async_on_playback_ended(self, data: dict[str, Any]) -> None:
+        if entity := self._entity(data):
+            entity.async_set_idle()
+
+    @callback
+    def _async_on_action_triggered(self, data: dict[str, Any]) -> None:
+        if (entity := self._entity(data)) is None:
+            return
+        action = data.get("mediaAction")
+        if action == ACTION_PLAY:
+            entity.async_set_playing_from(entity.position_at(dt_util.utcnow()))
+        elif action == ACTION_PAUSE:
+            entity.async_set_paused()
+        elif action == ACTION_STOP:
+            entity.async_set_idle()
+        elif action == ACTION_RESTART:
+            entity.async_set_playing_from(0.0)
+        elif action in (ACTION_NEXT, ACTION_PREVIOUS):
+            # Another playlist item with a duration of its own
+            self._async_refetch(entity)
+
+    @callback
+    def _async_refetch(self, entity: OBSMediaInputPlayer) -> None:
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_fetch_status([entity]),
+            f"{DOMAIN} fetch media input status",
+        )
+
+    @callback
+    def _async_on_input_created(self, data: dict[str, Any]) -> None:
+        if _input_kind(data) not in MEDIA_INPUT_KINDS:
+            return
+        key = _input_key(data)
+        if key in self._inputs:
+            return
+        entity = self._inputs[key] = OBSMediaInputPlayer(
+            self, key, data["inputName"], _input_kind(data)
+        )
+        self._async_add_entities([entity])
+        self._async_refetch(entity)
+
+    @callback
+    def _async_on_input_removed(self, data: dict[str, Any]) -> None:
+        if (key := _input_key(data)) in self._inputs:
+            self._async_remove_input(key)
+
+    @callback
+    def _async_on_input_name_changed(self, data: dict[str, Any]) -> None:
+        key = data.get("inputUuid") or data["oldInputName"]
+        if (entity := self._inputs.get(key)) is None:
+            return
+        unique_id: str | None = None
+        if not data.get("inputUuid"):
+            # Without UUIDs, inputs are keyed by name, so the player moves
+            # to the new key along with its registry entry
+            new_key = data["inputName"]
+            self._inputs[new_key] = self._inputs.pop(key)
+            unique_id = f"{_unique_id_prefix(self._entry)}{new_key}"
+            ent_reg = er.async_get(self.hass)
+            if entity_id := ent_reg.async_get_entity_id(
+                "media_player", DOMAIN, entity.unique_id
+            ):
+                ent_reg.async_update_entity(entity_id, new_unique_id=unique_id)
+        entity.async_set_input_name(data["inputName"], unique_id)
+
+    @callback
+    def _async_on_connect(self) -> None:
+        self._entry.async_create_background_task(
+            self.hass, self._async_sync(), f"{DOMAIN} sync media inputs"
+        )
+
+    @callback
+    def _async_on_coordinator_update(self) -> None:
+        """Write media player states only when availability flips."""
+        available = self.coordinator.last_update_success
+        if available == self._available:
+            return
+        self._available = available
+        for entity in self._inputs.values():
+            if entity.hass is not None:
+                entity.async_write_ha_state()
+
+
+class OBSMediaInputPlayer(MediaPlayerEntity):
+    """Media player controlling an OBS media input.
+
+    The position is only set from GetMediaInputStatus, seeks and playback
+    events, together with ``media_position_updated_at``; it is never polled.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_translation_key = "media_input"
+
+    def __init__(
+        self,
+        index: OBSMediaInputIndex,
+        key: str,
+        input_name: str,
+        input_kind: str | None,
+    ) -> None:
+        """Initialize."""
+        self._index = index
+        self.input_name = input_name
+        self._attr_name = input_name
+        self._attr_unique_id = f"{_unique_id_prefix(index._entry)}{key}"
+        self._attr_device_info = obs_device_info(index._entry)
+        self._attr_state = MediaPlayerState.IDLE
+        self._attr_supported_features = (
+            MediaPlayerEntityFeature.PLAY
+            | MediaPlayerEntityFeature.PAUSE
+            | MediaPlayerEntityFeature.STOP
+            | MediaPlayerEntityFeature.SEEK
+        )
+        if input_kind in PLAYLIST_INPUT_KINDS:
+            self._attr_supported_features |= (
+                MediaPlayerEntityFeature.NEXT_TRACK
+                | MediaPlayerEntityFeature.PREVIOUS_TRACK
+            )
+
+    @property
+    def available(self) -> bool:
+        """Return if OBS is reachable."""
+        return self._index.coordinator.last_update_success
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the OBS input name."""
+        return {"input_name": self.input_name}
+
+    @callback
+    def async_set_input_name(
+        self, input_name: str, unique_id: str | None = None
+    ) -> None:
+        """Follow a rename of the input in OBS."""
+        if unique_id is not None:
+            self._attr_unique_id = unique_id
+        if input_name == self.input_name:
+            return
+        self.input_name = input_name
+        self._attr_name = input_name
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    def position_at(self, now: datetime) -> float:
+        """Return the position extrapolated to ``now`` in seconds."""
+        position = self._attr_media_position or 0.0
+        updated_at = self._attr_media_position_updated_at
+        if self._attr_state == MediaPlayerState.PLAYING and updated_at is not None:
+            position += (now - updated_at).total_seconds()
+        if (duration := self._attr_media_duration) is not None:
+            position = min(position, duration)
+        return position
+
+    @callback
+    def async_set_status(self, status: dict[str, Any]) -> None:
+        """Anchor on a GetMediaInputStatus response."""
+        self._attr_state = MEDIA_STATES.get(
+            status.get("mediaState"), MediaPlayerState.IDLE
+        )
+        duration = status.get("mediaDuration")
+        self._attr_media_duration = None if duration is None else duration / 1000
+        cursor = status.get("mediaCursor")
+        self._async_anchor(None if cursor is None else cursor / 1000)
+
+    @callback
+    def async_set_playing_from(self, position: float) -> None:
+        """Play on from a known position."""
+        self._attr_state = MediaPlayerState.PLAYING
+        self._async_anchor(position)
+
+    @callback
+    def async_set_paused(self) -> None:
+        """Pause at the extrapolated position."""
+        position = self.position_at(dt_util.utcnow())
+        self._attr_state = MediaPlayerState.PAUSED
+        self._async_anchor(position)
+
+    @callback
+    def async_set_idle(self) -> None:
+        """Stop playback."""
+        self._attr_state = MediaPlayerState.IDLE
+        self._async_anchor(None)
+
+    @callback
+    def _async_anchor(self, position: float | None) -> None:
+        self._attr_media_position = position
+        self._attr_media_position_updated_at = (
+            None if position is None else dt_util.utcnow()
+        )
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    async def _async_action(self, action: str) -> None:
+        await self._index.connection.async_request(
+            "TriggerMediaInputAction",
+            {"inputName": self.input_name, "mediaAction": action},
+        )
+
+    async def async_media_play(self) -> None:
+        """Play the media input."""
+        await self._async_action(ACTION_PLAY)
+
+    async def async_media_pause(self) -> None:
+        """Pause the media input."""
+        await self._async_action(ACTION_PAUSE)
+
+    async def async_media_stop(self) -> None:
+        """Stop the media input."""
+        await self._async_action(ACTION_STOP)
+
+    async def async_media_next_track(self) -> None:
+        """Skip to the next playlist item."""
+        await self._async_action(ACTION_NEXT)
+
+    async def async_media_previous_track(self) -> None:
+        """Go back to the previous playlist item."""
+        await self._async_action(ACTION_PREVIOUS)
+
+    async def async_restart_media(self) -> None:
+        """Play the media input from the start."""
+        await self._async_action(ACTION_RESTART)
+
+    async def async_media_seek(self, position: float) -> None:
+        """Seek to a position in seconds."""
+        await self._index.connection.async_request(
+            "SetMediaInputCursor",
+            {"inputName": self.input_name, "mediaCursor": int(position * 1000)},
+        )
+        # OBS sends no event for seeks
+        self._async_anchor(position)
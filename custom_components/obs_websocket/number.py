@@ -0,0 +1,53 @@
+"""Number platform for OBS WebSocket transition duration."""
+
+from __future__ import annotations
+
+from homeassistant.components.number import NumberDeviceClass, NumberEntity, NumberMode
+from homeassistant.const import UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import OBSConfigEntry
+from .entity import OBSStudioEntity
+
+PARALLEL_UPDATES = 1
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: OBSConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up OBS WebSocket numbers from a config entry."""
+    async_add_entities([OBSTransitionDurationNumber(entry)])
+
+
+class OBSTransitionDurationNumber(OBSStudioEntity, NumberEntity):
+    """Number setting the duration of the current scene transition."""
+
+    _attr_device_class = NumberDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    # Limits of SetCurrentSceneTransitionDuration
+    _attr_native_min_value = 50
+    _attr_native_max_value = 20000
+    _attr_native_step = 50
+    _attr_mode = NumberMode.BOX
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(entry, "transition_duration")
+
+    @property
+    def available(self) -> bool:
+        """Return if the current transition has a configurable duration."""
+        transition = self._studio.transitions.get(self._studio.transition or "", {})
+        return super().available and not transition.get("transitionFixed", False)
+
+    @property
+    def native_value(self) -> int | None:
+        """Return the transition duration."""
+        return self._studio.transition_duration
+
+    async def async_set_native_value(self, value: float) -> None:
+        """Set the transition duration."""
+        await self._studio.connection.async_request(
+            "SetCurrentSceneTransitionDuration", {"transitionDuration": int(value)}
+        )
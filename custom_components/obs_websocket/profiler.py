@@ -0,0 +1,169 @@
+"""Timing spans and profiling of the OBS WebSocket hot paths."""
+
+from __future__ import annotations
+
+import asyncio
+import cProfile
+from contextlib import AbstractContextManager, nullcontext
+import json
+import os
+from pathlib import Path
+import pstats
+import threading
+import time
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+from .const import DOMAIN, PROFILE_DIR
+from .telemetry import LatencyHistogram
+
+# Returned by span() while the profiler is off, so an inactive span costs
+# one attribute check and an empty context manager
+_NO_SPAN = nullcontext()
+
+# Path fragment identifying the functions of this integration
+_MODULE_PATH = f"{os.sep}{DOMAIN}{os.sep}"
+
+
+class _Span:
+    """Time one pass through an instrumented path."""
+
+    __slots__ = ("_profiler", "_name", "_start")
+
+    def __init__(self, profiler: OBSProfiler, name: str) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(self, *exc: object) -> None:
+        self._profiler.record(self._name, time.perf_counter() - self._start)
+
+
+class OBSProfiler:
+    """Timing spans shared by all OBS connections.
+
+    Spans are recorded from the event loop and the client threads, so
+    recording takes a lock; nothing is recorded while the profiler is off.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.active = False
+        self._lock = threading.Lock()
+        self._spans: dict[str, LatencyHistogram] = {}
+
+    def span(self, name: str) -> AbstractContextManager[None]:
+        """Return a context manager timing a hot path while profiling."""
+        if not self.active:
+            return _NO_SPAN
+        return _Span(self, name)
+
+    def record(self, name: str, seconds: float) -> None:
+        """Record the duration of a span."""
+        with self._lock:
+            if (histogram := self._spans.get(name)) is None:
+                histogram = self._spans[name] = LatencyHistogram()
+            histogram.add(seconds * 1000)
+
+    @callback
+    def async_start(self) -> None:
+        """Start recording spans."""
+        self._spans = {}
+        self.active = True
+
+    @callback
+    def async_stop(self) -> dict[str, Any]:
+        """Stop recording and return the span histograms."""
+        self.active = False
+        with self._lock:
+            spans, self._spans = self._spans, {}
+        return {name: spans[name].as_dict() for name in sorted(spans)}
+
+
+DATA_PROFILER: HassKey[OBSProfiler] = HassKey(f"{DOMAIN}_profiler")
+
+
+@callback
+def async_get_profiler(hass: HomeAssistant) -> OBSProfiler:
+    """Return the profiler, creating it on first use."""
+    if (profiler := hass.data.get(DATA_PROFILER)) is None:
+        profiler = hass.data[DATA_PROFILER] = OBSProfiler()
+    return profiler
+
+
+def _top_functions(profile: cProfile.Profile, limit: int) -> list[dict[str, Any]]:
+    """Return the integration functions with the most cumulative time."""
+    stats = pstats.Stats(profile).stats  # type: ignore[attr-defined]
+    functions = [
+        {
+            "function": f"{Path(filename).name}:{line}({name})",
+            "calls": calls,
+            "total_ms": round(total * 1000, 3),
+            "cumulative_ms": round(cumulative * 1000, 3),
+        }
+        for (filename, line, name), (_, calls, total, cumulative, _) in stats.items()
+        if _MODULE_PATH in filename
+    ]
+    functions.sort(key=lambda function: function["cumulative_ms"], reverse=True)
+    return functions[:limit]
+
+
+def _write_results(
+    directory: Path,
+    name: str,
+    summary: dict[str, Any],
+    profile: cProfile.Profile | None,
+) -> dict[str, str]:
+    """Write the summary and the profile; runs in the executor."""
+    directory.mkdir(parents=True, exist_ok=True)
+    paths = {"summary": str(directory / f"{name}.json")}
+    if profile is not None:
+        paths["profile"] = str(directory / f"{name}.prof")
+        profile.dump_stats(paths["profile"])
+        summary["functions"] = _top_functions(profile, 25)
+    with open(paths["summary"], "w", encoding="utf-8") as file:
+        json.dump(summary, file, indent=2)
+        file.write("\n")
+    return paths
+
+
+async def async_profile(
+    hass: HomeAssistant, duration: float, use_cprofile: bool
+) -> dict[str, Any]:
+    """Profile the integration for ``duration`` seconds and write the results.
+
+    Spans time the connection, event dispatch, coordinator and sensor
+    update paths. With ``use_cprofile`` the event loop thread is also
+    profiled with cProfile; the ``.prof`` file loads in pstats or snakeviz
+    and the summary lists the integration functions taking the most time.
+    cProfile slows down everything on the loop, which is why the service
+    caps ``duration``.
+    """
+    profiler = async_get_profiler(hass)
+    started = dt_util.now()
+    name = f"profile-{started.strftime('%Y%m%d-%H%M%S')}"
+    profile = cProfile.Profile() if use_cprofile else None
+    profiler.async_start()
+    if profile is not None:
+        profile.enable()
+    try:
+        await asyncio.sleep(duration)
+    finally:
+        if profile is not None:
+            profile.disable()
+        spans = profiler.async_stop()
+    summary: dict[str, Any] = {
+        "started": started.isoformat(),
+        "duration": duration,
+        "spans": spans,
+    }
+    paths = await hass.async_add_executor_job(
+        _write_results, Path(hass.config.path(PROFILE_DIR)), name, summary, profile
+    )
+    return {**paths, "spans": spans}
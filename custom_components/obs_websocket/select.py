@@ -0,0 +1,72 @@
+"""Select platform for OBS WebSocket studio mode scenes and transitions."""
+
+from __future__ import annotations
+
+from homeassistant.components.select import SelectEntity
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from . import OBSConfigEntry
+from .entity import OBSStudioEntity
+
+PARALLEL_UPDATES = 1
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: OBSConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up OBS WebSocket selects from a config entry."""
+    async_add_entities([OBSPreviewSceneSelect(entry), OBSTransitionSelect(entry)])
+
+
+class OBSPreviewSceneSelect(OBSStudioEntity, SelectEntity):
+    """Select of the studio mode preview scene."""
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(entry, "preview_scene")
+
+    @property
+    def available(self) -> bool:
+        """Return if studio mode is enabled."""
+        return super().available and self._studio.studio_mode
+
+    @property
+    def options(self) -> list[str]:
+        """Return the scenes."""
+        return self._studio.scenes
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the preview scene."""
+        return self._studio.preview_scene
+
+    async def async_select_option(self, option: str) -> None:
+        """Set the preview scene."""
+        await self._studio.connection.async_request(
+            "SetCurrentPreviewScene", {"sceneName": option}
+        )
+
+
+class OBSTransitionSelect(OBSStudioEntity, SelectEntity):
+    """Select of the current scene transition."""
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(entry, "transition")
+
+    @property
+    def options(self) -> list[str]:
+        """Return the transitions."""
+        return list(self._studio.transitions)
+
+    @property
+    def current_option(self) -> str | None:
+        """Return the current transition."""
+        return self._studio.transition
+
+    async def async_select_option(self, option: str) -> None:
+        """Set the current transition."""
+        await self._studio.connection.async_request(
+            "SetCurrentSceneTransition", {"transitionName": option}
+        )
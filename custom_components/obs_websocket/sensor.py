@@ -2,21 +2,31 @@
 
 from __future__ import annotations
 
+from datetime import datetime
 import logging
+import time
 from typing import Any
 
-from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
-from homeassistant.const import EntityCategory
-from homeassistant.core import HomeAssistant
-from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.components.sensor import (
+    RestoreSensor,
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, UnitOfDataRate, UnitOfTime
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.event import async_call_later
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import OUTPUT_STARTED, OUTPUT_STOPPED
 from . import OBSConfigEntry, OBSCoordinator
+from .entity import obs_device_info
 
 _LOGGER = logging.getLogger(__name__)
 
+# Module wide by design of the entity platform, so not an entry option;
+# sensors update from the coordinator, which the throttle option covers
 PARALLEL_UPDATES = 1
 
 
@@ -29,10 +39,37 @@ async def async_setup_entry(
     async_add_entities(
         [
             OBSStreamStatusSensor(coordinator, entry),
+            OBSStreamStartedSensor(coordinator, entry),
             OBSStreamServiceSensor(coordinator, entry),
+            OBSRoundTripTimeSensor(coordinator, entry),
+            OBSRecordFileSensor(entry),
+            OBSLastRecordFileSensor(entry),
         ]
     )
 
+    outputs: set[str] = set()
+
+    @callback
+    def _async_add_output_sensors() -> None:
+        """Add sensors for outputs GetOutputList reported for the first time."""
+        new = [
+            name for name in coordinator.connection.outputs if name not in outputs
+        ]
+        if not new:
+            return
+        outputs.update(new)
+        async_add_entities(
+            sensor
+            for name in new
+            for sensor in (
+                OBSOutputStatusSensor(coordinator, entry, name),
+                OBSOutputBitrateSensor(coordinator, entry, name),
+            )
+        )
+
+    _async_add_output_sensors()
+    entry.async_on_unload(coordinator.async_add_listener(_async_add_output_sensors))
+
 
 class OBSSensorBase(CoordinatorEntity[OBSCoordinator], SensorEntity):
     """Base class for OBS sensors."""
@@ -42,12 +79,45 @@ class OBSSensorBase(CoordinatorEntity[OBSCoordinator], SensorEntity):
     def __init__(self, coordinator: OBSCoordinator, entry: OBSConfigEntry) -> None:
         """Initialize."""
         super().__init__(coordinator)
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, entry.entry_id)},
-            name=f"OBS Studio ({entry.data['host']})",
-            manufacturer="OBS Project",
-            sw_version=None,
-        )
+        self._attr_device_info = obs_device_info(entry)
+        self._last_write = 0.0
+        self._cancel_write: CALLBACK_TYPE | None = None
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Cancel a throttled state write."""
+        await super().async_will_remove_from_hass()
+        if self._cancel_write is not None:
+            self._cancel_write()
+            self._cancel_write = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write the state, at most once per state throttle interval.
+
+        Updates arriving within the interval are collapsed into one write
+        of the latest data when the interval ends.
+        """
+        if self._cancel_write is not None:
+            return
+        wait = self._last_write + self.coordinator.state_throttle - time.monotonic()
+        if wait > 0:
+            self._cancel_write = async_call_later(
+                self.hass, wait, self._async_throttled_write
+            )
+            return
+        self._async_write_update()
+
+    @callback
+    def _async_throttled_write(self, _now: Any) -> None:
+        self._cancel_write = None
+        self._async_write_update()
+
+    @callback
+    def _async_write_update(self) -> None:
+        """Write the state, timed while profiling."""
+        self._last_write = time.monotonic()
+        with self.coordinator.connection.profiler.span("sensor.update"):
+            super()._handle_coordinator_update()
 
 
 class OBSStreamStatusSensor(OBSSensorBase):
@@ -80,16 +150,47 @@ class OBSStreamStatusSensor(OBSSensorBase):
         if self.coordinator.data is None:
             return {}
         status = self.coordinator.data["stream_status"]
+        clock = self.coordinator.clock
+        now = time.monotonic()
+        duration = clock.duration_ms(now)
         return {
             "output_bytes": getattr(status, "output_bytes", None),
-            "output_duration": getattr(status, "output_duration", None),
-            "output_timecode": getattr(status, "output_timecode", None),
+            # Interpolated from the last poll or event while streaming
+            "output_duration": (
+                getattr(status, "output_duration", None)
+                if duration is None
+                else duration
+            ),
+            "output_timecode": clock.timecode(now)
+            or getattr(status, "output_timecode", None),
             "output_skipped_frames": getattr(status, "output_skipped_frames", None),
             "output_total_frames": getattr(status, "output_total_frames", None),
             "output_congestion": getattr(status, "output_congestion", None),
         }
 
 
+class OBSStreamStartedSensor(OBSSensorBase):
+    """Sensor showing when the current stream started.
+
+    The timestamp comes from the local stream clock and only changes when a
+    poll or event moves it noticeably, so the frontend can count the stream
+    duration up without state writes.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_translation_key = "stream_started"
+
+    def __init__(self, coordinator: OBSCoordinator, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_stream_started"
+
+    @property
+    def native_value(self) -> datetime | None:
+        """Return the start of the stream, None while idle."""
+        return self.coordinator.clock.started
+
+
 class OBSStreamServiceSensor(OBSSensorBase):
     """Sensor showing OBS stream service configuration."""
 
@@ -118,3 +219,227 @@ class OBSStreamServiceSensor(OBSSensorBase):
         svc = self.coordinator.data["service_settings"]
         settings = getattr(svc, "stream_service_settings", {})
         return {"stream_service_settings": settings}
+
+
+class OBSRoundTripTimeSensor(OBSSensorBase):
+    """Sensor showing the round trip time of the latest OBS request."""
+
+    _attr_translation_key = "round_trip_time"
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 1
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(self, coordinator: OBSCoordinator, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(coordinator, entry)
+        self._attr_unique_id = f"{entry.entry_id}_round_trip_time"
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the latest request round trip time."""
+        return self.coordinator.connection.telemetry.last_rtt_ms
+
+
+class OBSOutputSensorBase(OBSSensorBase):
+    """Base class for sensors of an output listed by GetOutputList."""
+
+    def __init__(
+        self, coordinator: OBSCoordinator, entry: OBSConfigEntry, output: str
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator, entry)
+        self._output = output
+        self._attr_translation_placeholders = {"output": output}
+
+    @property
+    def available(self) -> bool:
+        """Return if OBS is reachable and still lists the output."""
+        outputs = self.coordinator.connection.outputs
+        return super().available and self._output in outputs
+
+    @property
+    def _status(self) -> dict[str, Any] | None:
+        """Return the output status of the last poll, None while inactive."""
+        if self.coordinator.data is None:
+            return None
+        return self.coordinator.data.get("outputs", {}).get(self._output)
+
+
+class OBSOutputStatusSensor(OBSOutputSensorBase):
+    """Sensor showing the state of an output."""
+
+    _attr_device_class = SensorDeviceClass.ENUM
+    _attr_options = ["inactive", "active", "reconnecting"]
+    _attr_translation_key = "output_status"
+
+    def __init__(
+        self, coordinator: OBSCoordinator, entry: OBSConfigEntry, output: str
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator, entry, output)
+        self._attr_unique_id = f"{entry.entry_id}_output_{output}_status"
+
+    @property
+    def native_value(self) -> str:
+        """Return the output state."""
+        status = self._status or {}
+        if status.get("outputReconnecting"):
+            return "reconnecting"
+        if status.get("outputActive"):
+            return "active"
+        return "inactive"
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the output statistics and kind."""
+        status = self._status or {}
+        output = self.coordinator.connection.outputs.get(self._output, {})
+        return {
+            "output_kind": output.get("outputKind"),
+            "output_bytes": status.get("outputBytes"),
+            "output_duration": status.get("outputDuration"),
+            "output_timecode": status.get("outputTimecode"),
+            "output_skipped_frames": status.get("outputSkippedFrames"),
+            "output_total_frames": status.get("outputTotalFrames"),
+            "output_congestion": status.get("outputCongestion"),
+        }
+
+
+class OBSOutputBitrateSensor(OBSOutputSensorBase):
+    """Sensor showing the bitrate of an output between the last two polls."""
+
+    _attr_device_class = SensorDeviceClass.DATA_RATE
+    _attr_native_unit_of_measurement = UnitOfDataRate.KILOBITS_PER_SECOND
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_suggested_display_precision = 0
+    _attr_translation_key = "output_bitrate"
+    _attr_entity_registry_enabled_default = False
+
+    def __init__(
+        self, coordinator: OBSCoordinator, entry: OBSConfigEntry, output: str
+    ) -> None:
+        """Initialize."""
+        super().__init__(coordinator, entry, output)
+        self._attr_unique_id = f"{entry.entry_id}_output_{output}_bitrate"
+        self._sample: tuple[int, int] | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Compute the bitrate from the bytes sent since the previous poll."""
+        status = self._status
+        if status is None:
+            self._sample = None
+            self._attr_native_value = None
+        else:
+            sample = (status.get("outputBytes") or 0, status.get("outputDuration") or 0)
+            last, self._sample = self._sample, sample
+            if last is not None and sample[1] > last[1] and sample[0] >= last[0]:
+                # Bytes per millisecond times 8 is kbit/s
+                self._attr_native_value = (
+                    (sample[0] - last[0]) * 8 / (sample[1] - last[1])
+                )
+        super()._handle_coordinator_update()
+
+
+class OBSRecordFileSensorBase(RestoreSensor):
+    """Base class for sensors following recording files from events.
+
+    ``RecordStateChanged`` reports the path when a recording stops, and
+    ``RecordFileChanged`` when a split closes one file and opens the next,
+    so these sensors never send a request.
+    """
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+
+    def __init__(self, entry: OBSConfigEntry, key: str) -> None:
+        """Initialize."""
+        self._connection = entry.runtime_data.connection
+        self._attr_device_info = obs_device_info(entry)
+        self._attr_unique_id = f"{entry.entry_id}_{key}"
+        self._attr_translation_key = key
+        # Path of the file being written, when known
+        self._current: str | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to recording events."""
+        await super().async_added_to_hass()
+        for event_type, handler in (
+            ("RecordStateChanged", self._async_on_state_changed),
+            ("RecordFileChanged", self._async_on_file_changed),
+        ):
+            self.async_on_remove(
+                self._connection.async_add_listener(event_type, handler, replay=True)
+            )
+
+    @callback
+    def _async_on_state_changed(self, data: dict[str, Any]) -> None:
+        state = data.get("outputState")
+        if state == OUTPUT_STARTED:
+            self._current = data.get("outputPath")
+            self._async_started()
+        elif state == OUTPUT_STOPPED:
+            closed = data.get("outputPath") or self._current
+            self._current = None
+            self._async_closed(closed, stopped=True)
+
+    @callback
+    def _async_on_file_changed(self, data: dict[str, Any]) -> None:
+        closed, self._current = self._current, data["newOutputPath"]
+        self._async_closed(closed, stopped=False)
+
+    @callback
+    def _async_started(self) -> None:
+        """Handle a recording that started writing ``self._current``."""
+
+    @callback
+    def _async_closed(self, path: str | None, *, stopped: bool) -> None:
+        """Handle a finished file, on stop or when split."""
+
+
+class OBSRecordFileSensor(OBSRecordFileSensorBase):
+    """Sensor showing the file being recorded, unknown while not recording."""
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(entry, "record_file")
+
+    @callback
+    def _async_started(self) -> None:
+        self._attr_native_value = self._current
+        self.async_write_ha_state()
+
+    @callback
+    def _async_closed(self, path: str | None, *, stopped: bool) -> None:
+        self._attr_native_value = self._current
+        self.async_write_ha_state()
+
+
+class OBSLastRecordFileSensor(OBSRecordFileSensorBase):
+    """Sensor showing the latest finished recording file.
+
+    The state changes as soon as OBS closes a file, so automations can hand
+    it over without scanning the recording directory. It is restored after
+    a restart, since OBS cannot be asked for it.
+    """
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(entry, "last_record_file")
+
+    async def async_added_to_hass(self) -> None:
+        """Restore the last file."""
+        await super().async_added_to_hass()
+        if (data := await self.async_get_last_sensor_data()) is not None:
+            self._attr_native_value = data.native_value
+
+    @callback
+    def _async_closed(self, path: str | None, *, stopped: bool) -> None:
+        if path is None:
+            return
+        self._attr_native_value = path
+        self._attr_extra_state_attributes = {"split": not stopped}
+        self.async_write_ha_state()
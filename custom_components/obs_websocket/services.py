@@ -0,0 +1,475 @@
+"""Services for the OBS WebSocket integration."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, cast
+
+import voluptuous as vol
+
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+from homeassistant.util import dt as dt_util, slugify
+
+from .capture import async_replay
+from .const import (
+    CAPTURE_DIR,
+    DEFAULT_CAPTURE_BACKUPS,
+    DEFAULT_CAPTURE_MAX_SIZE,
+    DOMAIN,
+)
+from .profiler import async_get_profiler, async_profile
+
+if TYPE_CHECKING:
+    from . import OBSConfigEntry
+
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_REQUESTS = "requests"
+ATTR_REQUEST_TYPE = "request_type"
+ATTR_REQUEST_DATA = "request_data"
+ATTR_EXECUTION_TYPE = "execution_type"
+ATTR_HALT_ON_FAILURE = "halt_on_failure"
+ATTR_CACHE = "cache"
+ATTR_MAX_SIZE = "max_size"
+ATTR_BACKUPS = "backups"
+ATTR_FILE = "file"
+ATTR_SPEED = "speed"
+ATTR_DURATION = "duration"
+ATTR_CPROFILE = "cprofile"
+ATTR_HOTKEY_NAME = "hotkey_name"
+ATTR_KEY_ID = "key_id"
+ATTR_KEY_MODIFIERS = "key_modifiers"
+ATTR_VENDOR_NAME = "vendor_name"
+ATTR_CHAPTER_NAME = "chapter_name"
+
+# Modifiers of TriggerHotkeyByKeySequence
+KEY_MODIFIERS = ("shift", "control", "alt", "command")
+
+# RequestBatchExecutionType values from the obs-websocket v5 protocol
+EXECUTION_TYPES: dict[str, int] = {
+    "serial_realtime": 0,
+    "serial_frame": 1,
+    "parallel": 2,
+}
+
+SERVICE_RUN_BATCH = "run_batch"
+SERVICE_RUN_BATCH_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Required(ATTR_REQUESTS): vol.All(
+            cv.ensure_list,
+            [
+                vol.Schema(
+                    {
+                        vol.Required(ATTR_REQUEST_TYPE): cv.string,
+                        vol.Optional(ATTR_REQUEST_DATA): dict,
+                    }
+                )
+            ],
+            vol.Length(min=1),
+        ),
+        vol.Optional(ATTR_EXECUTION_TYPE, default="serial_realtime"): vol.In(
+            EXECUTION_TYPES
+        ),
+        vol.Optional(ATTR_HALT_ON_FAILURE, default=False): cv.boolean,
+    }
+)
+
+SERVICE_REQUEST = "request"
+SERVICE_REQUEST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Required(ATTR_REQUEST_TYPE): cv.string,
+        vol.Optional(ATTR_REQUEST_DATA): dict,
+        vol.Optional(ATTR_CACHE, default=False): cv.boolean,
+    }
+)
+
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_START_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Optional(ATTR_MAX_SIZE, default=DEFAULT_CAPTURE_MAX_SIZE): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1)
+        ),
+        vol.Optional(ATTR_BACKUPS, default=DEFAULT_CAPTURE_BACKUPS): vol.All(
+            vol.Coerce(int), vol.Range(min=0, max=100)
+        ),
+    }
+)
+
+SERVICE_STOP_CAPTURE = "stop_capture"
+SERVICE_STOP_CAPTURE_SCHEMA = vol.Schema({vol.Required(ATTR_CONFIG_ENTRY_ID): str})
+
+SERVICE_REPLAY_CAPTURE = "replay_capture"
+SERVICE_REPLAY_CAPTURE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Required(ATTR_FILE): cv.string,
+        vol.Optional(ATTR_SPEED, default=1.0): vol.All(
+            vol.Coerce(float), vol.Range(min=0)
+        ),
+    }
+)
+
+SERVICE_PROFILE = "profile"
+SERVICE_PROFILE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_DURATION, default=30): vol.All(
+            vol.Coerce(float), vol.Range(min=0, max=60)
+        ),
+        vol.Optional(ATTR_CPROFILE, default=False): cv.boolean,
+    }
+)
+
+SERVICE_TRIGGER_HOTKEY = "trigger_hotkey"
+SERVICE_TRIGGER_HOTKEY_SCHEMA = vol.All(
+    vol.Schema(
+        {
+            vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+            vol.Exclusive(ATTR_HOTKEY_NAME, "hotkey"): cv.string,
+            vol.Exclusive(ATTR_KEY_ID, "hotkey"): vol.All(
+                cv.string, vol.Match(r"^OBS_KEY_")
+            ),
+            vol.Optional(ATTR_KEY_MODIFIERS, default=[]): vol.All(
+                cv.ensure_list, [vol.In(KEY_MODIFIERS)]
+            ),
+        }
+    ),
+    cv.has_at_least_one_key(ATTR_HOTKEY_NAME, ATTR_KEY_ID),
+)
+
+SERVICE_CALL_VENDOR_REQUEST = "call_vendor_request"
+SERVICE_CALL_VENDOR_REQUEST_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Required(ATTR_VENDOR_NAME): cv.string,
+        vol.Required(ATTR_REQUEST_TYPE): cv.string,
+        vol.Optional(ATTR_REQUEST_DATA): dict,
+    }
+)
+
+SERVICE_SPLIT_RECORD_FILE = "split_record_file"
+SERVICE_SPLIT_RECORD_FILE_SCHEMA = vol.Schema(
+    {vol.Required(ATTR_CONFIG_ENTRY_ID): str}
+)
+
+SERVICE_CREATE_RECORD_CHAPTER = "create_record_chapter"
+SERVICE_CREATE_RECORD_CHAPTER_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_CONFIG_ENTRY_ID): str,
+        vol.Optional(ATTR_CHAPTER_NAME): cv.string,
+    }
+)
+
+
+def async_get_entry(hass: HomeAssistant, config_entry_id: str) -> OBSConfigEntry:
+    """Get a loaded OBS WebSocket config entry."""
+    entry = hass.config_entries.async_get_entry(config_entry_id)
+    if entry is None or entry.domain != DOMAIN:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_found",
+            translation_placeholders={"entry_id": config_entry_id},
+        )
+    if entry.state is not ConfigEntryState.LOADED:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="entry_not_loaded",
+            translation_placeholders={"title": entry.title},
+        )
+    return cast("OBSConfigEntry", entry)
+
+
+def _check_supported(entry: OBSConfigEntry, request_type: str) -> None:
+    """Reject a request the connected OBS does not offer."""
+    if not entry.runtime_data.connection.supports(request_type):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="request_not_supported",
+            translation_placeholders={
+                "request_type": request_type,
+                "title": entry.title,
+            },
+        )
+
+
+def _validate_sleep(request_data: dict[str, Any], execution_type: str) -> None:
+    """Check a Sleep request is valid for the batch execution type."""
+    if execution_type == "serial_realtime" and "sleepMillis" in request_data:
+        return
+    if execution_type == "serial_frame" and "sleepFrames" in request_data:
+        return
+    raise ServiceValidationError(
+        translation_domain=DOMAIN,
+        translation_key="invalid_sleep",
+        translation_placeholders={"execution_type": execution_type},
+    )
+
+
+async def _async_run_batch(call: ServiceCall) -> ServiceResponse:
+    """Send an ordered list of requests as one RequestBatch."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    execution_type: str = call.data[ATTR_EXECUTION_TYPE]
+
+    connection = entry.runtime_data.connection
+    requests: list[dict[str, Any]] = []
+    for request in call.data[ATTR_REQUESTS]:
+        _check_supported(entry, request[ATTR_REQUEST_TYPE])
+        request_data = request.get(ATTR_REQUEST_DATA) or {}
+        if request[ATTR_REQUEST_TYPE] == "Sleep":
+            _validate_sleep(request_data, execution_type)
+        payload: dict[str, Any] = {"requestType": request[ATTR_REQUEST_TYPE]}
+        if request_data:
+            payload["requestData"] = request_data
+        requests.append(payload)
+
+    results = await connection.async_request_batch(
+        requests,
+        EXECUTION_TYPES[execution_type],
+        call.data[ATTR_HALT_ON_FAILURE],
+    )
+    return {
+        "results": [
+            {
+                "request_type": result["requestType"],
+                "result": result["requestStatus"]["result"],
+                "code": result["requestStatus"]["code"],
+                "comment": result["requestStatus"].get("comment"),
+                "data": result.get("responseData", {}),
+            }
+            for result in results
+        ]
+    }
+
+
+async def _async_request(call: ServiceCall) -> ServiceResponse:
+    """Send any v5 request and return its response data."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    _check_supported(entry, call.data[ATTR_REQUEST_TYPE])
+    return await entry.runtime_data.connection.async_request(
+        call.data[ATTR_REQUEST_TYPE],
+        call.data.get(ATTR_REQUEST_DATA) or None,
+        use_cache=call.data[ATTR_CACHE],
+    )
+
+
+async def _async_trigger_hotkey(call: ServiceCall) -> None:
+    """Trigger an OBS hotkey by name or by key sequence."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    connection = entry.runtime_data.connection
+    if (name := call.data.get(ATTR_HOTKEY_NAME)) is not None:
+        _check_supported(entry, "TriggerHotkeyByName")
+        # Without the hotkey list, names go to OBS unchecked
+        hotkeys = entry.runtime_data.hotkeys
+        if hotkeys is not None and not await hotkeys.async_contains(name):
+            raise ServiceValidationError(
+                translation_domain=DOMAIN,
+                translation_key="hotkey_not_found",
+                translation_placeholders={"hotkey": name, "title": entry.title},
+            )
+        await connection.async_request("TriggerHotkeyByName", {"hotkeyName": name})
+        return
+    _check_supported(entry, "TriggerHotkeyByKeySequence")
+    modifiers = call.data[ATTR_KEY_MODIFIERS]
+    await connection.async_request(
+        "TriggerHotkeyByKeySequence",
+        {
+            "keyId": call.data[ATTR_KEY_ID],
+            "keyModifiers": {
+                modifier: modifier in modifiers for modifier in KEY_MODIFIERS
+            },
+        },
+    )
+
+
+async def _async_call_vendor_request(call: ServiceCall) -> ServiceResponse:
+    """Call a request registered by an OBS plugin and return its response."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    _check_supported(entry, "CallVendorRequest")
+    response = await entry.runtime_data.connection.async_request(
+        "CallVendorRequest",
+        {
+            "vendorName": call.data[ATTR_VENDOR_NAME],
+            "requestType": call.data[ATTR_REQUEST_TYPE],
+            "requestData": call.data.get(ATTR_REQUEST_DATA) or {},
+        },
+    )
+    return response.get("responseData") or {}
+
+
+async def _async_split_record_file(call: ServiceCall) -> None:
+    """Close the current recording file and continue in a new one."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    _check_supported(entry, "SplitRecordFile")
+    await entry.runtime_data.connection.async_request("SplitRecordFile")
+
+
+async def _async_create_record_chapter(call: ServiceCall) -> None:
+    """Add a chapter marker to the current recording."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    _check_supported(entry, "CreateRecordChapter")
+    data = None
+    if (name := call.data.get(ATTR_CHAPTER_NAME)) is not None:
+        data = {"chapterName": name}
+    await entry.runtime_data.connection.async_request("CreateRecordChapter", data)
+
+
+async def _async_start_capture(call: ServiceCall) -> ServiceResponse:
+    """Start capturing the traffic of an OBS connection to a file."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    connection = entry.runtime_data.connection
+    if connection.capture is not None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="capture_running",
+            translation_placeholders={"path": str(connection.capture.path)},
+        )
+    name = f"{slugify(connection.host)}-{dt_util.now().strftime('%Y%m%d-%H%M%S')}"
+    capture = await connection.async_start_capture(
+        Path(call.hass.config.path(CAPTURE_DIR, f"{name}.jsonl")),
+        int(call.data[ATTR_MAX_SIZE] * 1024 * 1024),
+        call.data[ATTR_BACKUPS],
+    )
+    return {"path": str(capture.path)}
+
+
+async def _async_stop_capture(call: ServiceCall) -> ServiceResponse:
+    """Stop capturing the traffic of an OBS connection."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    capture = await entry.runtime_data.connection.async_stop_capture()
+    if capture is None:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="capture_not_running",
+            translation_placeholders={"title": entry.title},
+        )
+    return {
+        "path": str(capture.path),
+        "records": capture.records,
+        "bytes": await call.hass.async_add_executor_job(capture.size),
+    }
+
+
+def _capture_path(hass: HomeAssistant, file: str) -> Path:
+    """Resolve a capture file name and check it may be read."""
+    capture_dir = Path(hass.config.path(CAPTURE_DIR)).resolve()
+    path = (capture_dir / file).resolve()
+    if not path.is_relative_to(capture_dir) and not hass.config.is_allowed_path(
+        str(path)
+    ):
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="path_not_allowed",
+            translation_placeholders={"path": file},
+        )
+    if not path.is_file():
+        raise ServiceValidationError(
+            translation_domain=DOMAIN,
+            translation_key="capture_not_found",
+            translation_placeholders={"path": file},
+        )
+    return path
+
+
+async def _async_replay_capture(call: ServiceCall) -> ServiceResponse:
+    """Replay a capture through the listeners and coordinator of an entry."""
+    entry = async_get_entry(call.hass, call.data[ATTR_CONFIG_ENTRY_ID])
+    path = await call.hass.async_add_executor_job(
+        _capture_path, call.hass, call.data[ATTR_FILE]
+    )
+    return await async_replay(
+        entry.runtime_data.connection,
+        entry.runtime_data.coordinator,
+        path,
+        call.data[ATTR_SPEED],
+    )
+
+
+async def _async_profile(call: ServiceCall) -> ServiceResponse:
+    """Time the integration's hot paths for a while and write the results."""
+    if async_get_profiler(call.hass).active:
+        raise ServiceValidationError(
+            translation_domain=DOMAIN, translation_key="profile_running"
+        )
+    return await async_profile(
+        call.hass, call.data[ATTR_DURATION], call.data[ATTR_CPROFILE]
+    )
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the OBS WebSocket services."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REQUEST,
+        _async_request,
+        schema=SERVICE_REQUEST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RUN_BATCH,
+        _async_run_batch,
+        schema=SERVICE_RUN_BATCH_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TRIGGER_HOTKEY,
+        _async_trigger_hotkey,
+        schema=SERVICE_TRIGGER_HOTKEY_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CALL_VENDOR_REQUEST,
+        _async_call_vendor_request,
+        schema=SERVICE_CALL_VENDOR_REQUEST_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SPLIT_RECORD_FILE,
+        _async_split_record_file,
+        schema=SERVICE_SPLIT_RECORD_FILE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_CREATE_RECORD_CHAPTER,
+        _async_create_record_chapter,
+        schema=SERVICE_CREATE_RECORD_CHAPTER_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_START_CAPTURE,
+        _async_start_capture,
+        schema=SERVICE_START_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_STOP_CAPTURE,
+        _async_stop_capture,
+        schema=SERVICE_STOP_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_REPLAY_CAPTURE,
+        _async_replay_capture,
+        schema=SERVICE_REPLAY_CAPTURE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        _async_profile,
+        schema=SERVICE_PROFILE_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
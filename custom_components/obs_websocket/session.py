@@ -0,0 +1,101 @@
+"""Hand connections validated by the config flow over to entry setup."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.importlib import async_import_module
+from homeassistant.util.hass_dict import HassKey
+
+from .capture import response_fields
+from .const import DOMAIN, SESSION_HANDOFF_TIMEOUT
+
+type SessionKey = tuple[str, int, str]
+
+
+@dataclass
+class OBSValidatedSession:
+    """An authenticated ReqClient and the GetVersion result it returned."""
+
+    req_client: Any
+    version: dict[str, Any]
+    cancel_expiry: CALLBACK_TYPE
+
+
+DATA_SESSIONS: HassKey[dict[SessionKey, OBSValidatedSession]] = HassKey(
+    f"{DOMAIN}_sessions"
+)
+
+
+def _disconnect(req_client: Any) -> None:
+    try:
+        req_client.disconnect()
+    except Exception:
+        pass
+
+
+async def async_validate_session(
+    hass: HomeAssistant, host: str, port: int, password: str
+) -> dict[str, Any]:
+    """Connect, authenticate and call GetVersion, keeping the session open.
+
+    The session waits for the entry setup of the same host, port and
+    password to adopt it and is closed if nothing claims it in time.
+    """
+    obs = await async_import_module(hass, "obsws_python")
+
+    def _connect() -> tuple[Any, dict[str, Any]]:
+        kwargs: dict[str, Any] = {"host": host, "port": port, "timeout": 5}
+        if password:
+            kwargs["password"] = password
+        client = obs.ReqClient(**kwargs)
+        try:
+            version = response_fields(client.get_version())
+        except Exception:
+            _disconnect(client)
+            raise
+        return client, version
+
+    req_client, version = await hass.async_add_executor_job(_connect)
+    key = (host, port, password)
+    sessions = hass.data.setdefault(DATA_SESSIONS, {})
+    if (previous := sessions.pop(key, None)) is not None:
+        previous.cancel_expiry()
+        await hass.async_add_executor_job(_disconnect, previous.req_client)
+
+    @callback
+    def _expire(_now: Any) -> None:
+        session = sessions.get(key)
+        if session is not None and session.req_client is req_client:
+            del sessions[key]
+            hass.async_add_executor_job(_disconnect, req_client)
+
+    sessions[key] = OBSValidatedSession(
+        req_client,
+        version,
+        async_call_later(hass, SESSION_HANDOFF_TIMEOUT, _expire),
+    )
+    return version
+
+
+@callback
+def async_take_session(
+    hass: HomeAssistant, host: str, port: int, password: str
+) -> OBSValidatedSession | None:
+    """Claim the validated session for a host, if the flow left one."""
+    sessions = hass.data.get(DATA_SESSIONS)
+    if not sessions or (session := sessions.pop((host, port, password), None)) is None:
+        return None
+    session.cancel_expiry()
+    return session
+
+
+async def async_discard_session(
+    hass: HomeAssistant, host: str, port: int, password: str
+) -> None:
+    """Close a validated session that will not be used."""
+    if (session := async_take_session(hass, host, port, password)) is not None:
+        await hass.async_add_executor_job(_disconnect, session.req_client)
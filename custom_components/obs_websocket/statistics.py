@@ -0,0 +1,253 @@
+"""Hourly long-term statistics of the stream for OBS WebSocket."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import StatisticData, StatisticMetaData
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.const import UnitOfDataRate, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.util import slugify
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from . import OBSConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+STAT_BITRATE = "bitrate"
+STAT_DROPPED_FRAMES = "dropped_frames"
+STAT_STREAMED_TIME = "streamed_time"
+
+
+@dataclass
+class OBSHourBucket:
+    """Stream samples of one hour, reduced to what the statistics need."""
+
+    start: datetime
+    streamed: float = 0.0
+    kilobits: float = 0.0
+    dropped: int = 0
+    bitrate_min: float | None = None
+    bitrate_max: float | None = None
+
+    def add(self, seconds: float, kilobits: float, dropped: int) -> None:
+        """Add the interval between two samples of a running stream."""
+        bitrate = kilobits / seconds
+        self.streamed += seconds
+        self.kilobits += kilobits
+        self.dropped += dropped
+        if self.bitrate_min is None or bitrate < self.bitrate_min:
+            self.bitrate_min = bitrate
+        if self.bitrate_max is None or bitrate > self.bitrate_max:
+            self.bitrate_max = bitrate
+
+    def merge(self, other: OBSHourBucket) -> OBSHourBucket:
+        """Return a bucket with the samples of both buckets of the hour."""
+        bounds = [
+            (low, high)
+            for low, high in (
+                (self.bitrate_min, self.bitrate_max),
+                (other.bitrate_min, other.bitrate_max),
+            )
+            if low is not None and high is not None
+        ]
+        return OBSHourBucket(
+            self.start,
+            self.streamed + other.streamed,
+            self.kilobits + other.kilobits,
+            self.dropped + other.dropped,
+            min((low for low, _ in bounds), default=None),
+            max((high for _, high in bounds), default=None),
+        )
+
+
+class OBSStreamStatistics:
+    """Aggregate stream status polls into hourly external statistics.
+
+    Each poll adds the bytes, duration and skipped frames since the
+    previous poll to the bucket of the current hour. When a poll falls in
+    the next hour, the finished bucket is imported with the recorder's
+    external statistics API: the bitrate as a mean with its minimum and
+    maximum, and the dropped frames and streamed time as sums. An hour of
+    streaming costs three rows, whatever the poll interval.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._entry = entry
+        object_id = slugify(entry.unique_id or entry.entry_id)
+        name = f"OBS Studio ({entry.data['host']})"
+        self.metadata: dict[str, StatisticMetaData] = {
+            key: StatisticMetaData(
+                has_mean=key == STAT_BITRATE,
+                has_sum=key != STAT_BITRATE,
+                name=f"{name} {label}",
+                source=DOMAIN,
+                statistic_id=f"{DOMAIN}:{object_id}_{key}",
+                unit_of_measurement=unit,
+            )
+            for key, label, unit in (
+                (STAT_BITRATE, "bitrate", UnitOfDataRate.KILOBITS_PER_SECOND),
+                (STAT_DROPPED_FRAMES, "dropped frames", None),
+                (STAT_STREAMED_TIME, "streamed time", UnitOfTime.SECONDS),
+            )
+        }
+        self.bucket: OBSHourBucket | None = None
+        # Bytes, duration and skipped frames of the previous active poll
+        self._last: tuple[int, int, int] | None = None
+        # Sums up to the end of the last finished hour, read from the
+        # recorder before the first import
+        self._sums: dict[str, float] | None = None
+        # The part of the hour in progress imported before a restart
+        self._stored: OBSHourBucket | None = None
+        self._lock = asyncio.Lock()
+
+    def add(self, status: Any, now: datetime) -> None:
+        """Add a GetStreamStatus poll made at ``now``."""
+        hour = now.replace(minute=0, second=0, microsecond=0)
+        if self.bucket is not None and self.bucket.start != hour:
+            self._async_schedule_import(self.bucket, finished=True)
+            self.bucket = None
+        if not getattr(status, "output_active", False):
+            self._last = None
+            return
+        sample = (
+            getattr(status, "output_bytes", 0) or 0,
+            getattr(status, "output_duration", 0) or 0,
+            getattr(status, "output_skipped_frames", 0) or 0,
+        )
+        last, self._last = self._last, sample
+        if last is None or sample[1] <= last[1] or sample[0] < last[0]:
+            # First poll of a stream, or a new stream, or reconnecting
+            return
+        if self.bucket is None:
+            self.bucket = OBSHourBucket(hour)
+        self.bucket.add(
+            (sample[1] - last[1]) / 1000,
+            (sample[0] - last[0]) * 8 / 1000,
+            max(sample[2] - last[2], 0),
+        )
+
+    async def async_flush(self) -> None:
+        """Import the hour in progress, e.g. before unloading.
+
+        Importing the same hour again later replaces its rows, so the hour
+        is imported again when it finishes, merged with the part imported
+        here if that happens after a restart.
+        """
+        if self.bucket is not None:
+            await self._async_import(self.bucket, finished=False)
+
+    def _async_schedule_import(self, bucket: OBSHourBucket, finished: bool) -> None:
+        self._entry.async_create_background_task(
+            self.hass,
+            self._async_import(bucket, finished),
+            f"{DOMAIN} import statistics",
+        )
+
+    async def _async_import(self, bucket: OBSHourBucket, finished: bool) -> None:
+        if "recorder" not in self.hass.config.components or not bucket.streamed:
+            return
+        async with self._lock:
+            if self._sums is None:
+                self._sums, self._stored = await self._async_resume(bucket.start)
+            if self._stored is not None and self._stored.start == bucket.start:
+                bucket = self._stored.merge(bucket)
+            sums = {
+                STAT_DROPPED_FRAMES: self._sums[STAT_DROPPED_FRAMES] + bucket.dropped,
+                STAT_STREAMED_TIME: self._sums[STAT_STREAMED_TIME] + bucket.streamed,
+            }
+            async_add_external_statistics(
+                self.hass,
+                self.metadata[STAT_BITRATE],
+                [
+                    StatisticData(
+                        start=bucket.start,
+                        mean=bucket.kilobits / bucket.streamed,
+                        min=bucket.bitrate_min,
+                        max=bucket.bitrate_max,
+                    )
+                ],
+            )
+            async_add_external_statistics(
+                self.hass,
+                self.metadata[STAT_DROPPED_FRAMES],
+                [
+                    StatisticData(
+                        start=bucket.start,
+                        state=bucket.dropped,
+                        sum=sums[STAT_DROPPED_FRAMES],
+                    )
+                ],
+            )
+            async_add_external_statistics(
+                self.hass,
+                self.metadata[STAT_STREAMED_TIME],
+                [
+                    StatisticData(
+                        start=bucket.start,
+                        state=bucket.streamed,
+                        sum=sums[STAT_STREAMED_TIME],
+                    )
+                ],
+            )
+            if finished:
+                self._sums = sums
+                self._stored = None
+
+    async def _async_resume(
+        self, start: datetime
+    ) -> tuple[dict[str, float], OBSHourBucket | None]:
+        """Return the sums before ``start`` and the stored part of its hour.
+
+        After a restart, the latest rows may be the hour in progress,
+        imported by ``async_flush``. Their state and mean are rebuilt into a
+        bucket that the rest of the hour is merged into, and their state is
+        taken off the sums, so every sample is counted once.
+        """
+        last: dict[str, Any] = {}
+        for key in self.metadata:
+            statistic_id = self.metadata[key]["statistic_id"]
+            rows = await get_instance(self.hass).async_add_executor_job(
+                get_last_statistics,
+                self.hass,
+                1,
+                statistic_id,
+                True,
+                {"state", "sum", "mean", "min", "max"},
+            )
+            last[key] = (rows.get(statistic_id) or [None])[0]
+        stored: OBSHourBucket | None = None
+        if all(
+            row is not None and row["start"] == start.timestamp()
+            for row in last.values()
+        ):
+            streamed = last[STAT_STREAMED_TIME].get("state") or 0.0
+            stored = OBSHourBucket(
+                start,
+                streamed,
+                (last[STAT_BITRATE].get("mean") or 0.0) * streamed,
+                int(last[STAT_DROPPED_FRAMES].get("state") or 0),
+                last[STAT_BITRATE].get("min"),
+                last[STAT_BITRATE].get("max"),
+            )
+        sums: dict[str, float] = {}
+        for key, state in (
+            (STAT_DROPPED_FRAMES, stored.dropped if stored else 0),
+            (STAT_STREAMED_TIME, stored.streamed if stored else 0.0),
+        ):
+            row = last[key]
+            sums[key] = ((row.get("sum") or 0.0) if row else 0.0) - state
+        return sums, stored
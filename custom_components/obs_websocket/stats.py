@@ -0,0 +1,194 @@
+"""Live stats sampling for OBS WebSocket dashboards."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import re
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, MAX_STATS_INTERVAL
+from .services import EXECUTION_TYPES
+
+if TYPE_CHECKING:
+    from . import OBSConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+_CAMEL = re.compile(r"(?<!^)(?=[A-Z])")
+
+type StatsCallback = Callable[[dict[str, Any]], None]
+
+
+def _snake_case(response: dict[str, Any]) -> dict[str, Any]:
+    """Return response data with the snake case names obsws-python uses."""
+    return {_CAMEL.sub("_", key).lower(): value for key, value in response.items()}
+
+
+class _Subscriber:
+    """A stats subscriber and the time it was last sent a sample."""
+
+    __slots__ = ("callback", "interval", "on_stop", "sent")
+
+    def __init__(
+        self,
+        callback: StatsCallback,
+        interval: float,
+        on_stop: CALLBACK_TYPE | None,
+    ) -> None:
+        self.callback = callback
+        self.interval = interval
+        self.on_stop = on_stop
+        self.sent = 0.0
+
+
+class OBSStatsSampler:
+    """One sampling loop per OBS instance, shared by all stats subscribers.
+
+    While anyone is subscribed, ``GetStreamStatus`` and ``GetStats`` are
+    fetched in one request batch at the shortest interval any subscriber
+    asked for, and each subscriber is sent the samples due at its own
+    interval. Samples bypass the coordinator, so entity states, and with
+    them the recorder, keep the poll interval.
+    """
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        self._entry = entry
+        self._subscribers: list[_Subscriber] = []
+        self._task: asyncio.Task[None] | None = None
+        self._wake = asyncio.Event()
+        # Previous stream bytes and the monotonic time they were sampled at
+        self._last_bytes: tuple[int, float] | None = None
+        self.interval = MAX_STATS_INTERVAL
+        self.samples = 0
+
+    @property
+    def subscribers(self) -> int:
+        """Return the number of subscribers."""
+        return len(self._subscribers)
+
+    @callback
+    def async_subscribe(
+        self,
+        stats_callback: StatsCallback,
+        interval: float,
+        on_stop: CALLBACK_TYPE | None = None,
+    ) -> CALLBACK_TYPE:
+        """Send samples to a callback every ``interval`` seconds.
+
+        ``on_stop`` is called if the sampler stops before the subscriber
+        unsubscribes, e.g. because the entry is unloaded.
+        """
+        subscriber = _Subscriber(stats_callback, interval, on_stop)
+        self._subscribers.append(subscriber)
+        self._async_update_interval()
+        # Sample right away for the new subscriber
+        self._wake.set()
+
+        @callback
+        def _unsubscribe() -> None:
+            if subscriber not in self._subscribers:
+                return
+            self._subscribers.remove(subscriber)
+            if self._subscribers:
+                self._async_update_interval()
+            else:
+                self._async_cancel()
+
+        return _unsubscribe
+
+    @callback
+    def _async_update_interval(self) -> None:
+        self.interval = min(subscriber.interval for subscriber in self._subscribers)
+        if self._task is None:
+            self._last_bytes = None
+            self._task = self._entry.async_create_background_task(
+                self._entry.runtime_data.connection.hass,
+                self._async_run(),
+                f"{DOMAIN} stats",
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop sampling and tell every remaining subscriber."""
+        subscribers, self._subscribers = self._subscribers, []
+        self._async_cancel()
+        for subscriber in subscribers:
+            if subscriber.on_stop is not None:
+                subscriber.on_stop()
+
+    @callback
+    def _async_cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    async def _async_run(self) -> None:
+        while True:
+            started = time.monotonic()
+            try:
+                sample = await self._async_sample()
+            except HomeAssistantError as err:
+                # The coordinator reports the connection state
+                _LOGGER.debug("Cannot sample stats: %s", err)
+            else:
+                self._async_deliver(sample)
+            self._wake.clear()
+            wait = self.interval - (time.monotonic() - started)
+            try:
+                async with asyncio.timeout(max(wait, 0)):
+                    await self._wake.wait()
+            except TimeoutError:
+                pass
+
+    async def _async_sample(self) -> dict[str, Any]:
+        """Fetch one sample and derive the metrics shown next to it."""
+        runtime = self._entry.runtime_data
+        sent = time.monotonic()
+        status, stats = (
+            result.get("responseData") or {}
+            if result.get("requestStatus", {}).get("result")
+            else {}
+            for result in await runtime.connection.async_request_batch(
+                [{"requestType": "GetStreamStatus"}, {"requestType": "GetStats"}],
+                EXECUTION_TYPES["serial_realtime"],
+            )
+        )
+        at = (sent + time.monotonic()) / 2
+        self.samples += 1
+        return {
+            "time": dt_util.utcnow().isoformat(),
+            "stream": _snake_case(status),
+            "stats": _snake_case(stats),
+            "bitrate_kbps": self._bitrate(status, at),
+            "health": runtime.coordinator.health.as_dict(),
+        }
+
+    def _bitrate(self, status: dict[str, Any], at: float) -> float | None:
+        """Return the bitrate since the previous sample in kbit/s."""
+        if not status.get("outputActive"):
+            self._last_bytes = None
+            return None
+        output_bytes = status.get("outputBytes") or 0
+        last, self._last_bytes = self._last_bytes, (output_bytes, at)
+        if last is None or at <= last[1] or output_bytes < last[0]:
+            return None
+        return round((output_bytes - last[0]) * 8 / 1000 / (at - last[1]), 1)
+
+    @callback
+    def _async_deliver(self, sample: dict[str, Any]) -> None:
+        now = time.monotonic()
+        # Half a sampling interval of slack, so that a sample arriving a
+        # little early is not held back a whole sampling interval
+        slack = self.interval / 2
+        for subscriber in list(self._subscribers):
+            if now - subscriber.sent >= subscriber.interval - slack:
+                subscriber.sent = now
+                subscriber.callback(sample)
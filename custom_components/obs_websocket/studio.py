@@ -0,0 +1,193 @@
+"""Studio mode and scene transition state for OBS WebSocket."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import CALLBACK_TYPE, callback
+from homeassistant.exceptions import HomeAssistantError
+
+from .const import DOMAIN
+from .services import EXECUTION_TYPES
+
+if TYPE_CHECKING:
+    from . import OBSConfigEntry, OBSConnection
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OBSStudioState:
+    """Studio mode, preview scene and transition state, kept current by events.
+
+    Each session fetches the state once in a single request batch; after
+    that only ``StudioModeStateChanged``, ``CurrentPreviewSceneChanged``,
+    ``SceneListChanged``, ``SceneNameChanged``,
+    ``CurrentSceneTransitionChanged``,
+    ``CurrentSceneTransitionDurationChanged`` and the
+    ``SceneTransitionStarted``/``Ended`` events change it.
+    """
+
+    def __init__(self, entry: OBSConfigEntry, connection: OBSConnection) -> None:
+        """Initialize."""
+        self._entry = entry
+        self.connection = connection
+        self.synced = False
+        self.studio_mode = False
+        self.preview_scene: str | None = None
+        self.scenes: list[str] = []
+        self.transition: str | None = None
+        self.transitions: dict[str, dict[str, Any]] = {}
+        self.transition_duration: int | None = None
+        self.transitioning = False
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    async def async_start(self) -> None:
+        """Subscribe to events and fetch the current state."""
+        entry = self._entry
+        for event_type, handler in (
+            ("StudioModeStateChanged", self._async_on_studio_mode_changed),
+            ("CurrentPreviewSceneChanged", self._async_on_preview_scene_changed),
+            ("SceneListChanged", self._async_on_scene_list_changed),
+            ("SceneNameChanged", self._async_on_scene_name_changed),
+            ("CurrentSceneTransitionChanged", self._async_on_transition_changed),
+            (
+                "CurrentSceneTransitionDurationChanged",
+                self._async_on_transition_duration_changed,
+            ),
+            ("SceneTransitionStarted", self._async_on_transition_started),
+            ("SceneTransitionEnded", self._async_on_transition_ended),
+        ):
+            entry.async_on_unload(self.connection.async_add_listener(event_type, handler))
+        entry.async_on_unload(
+            self.connection.async_add_connect_listener(self._async_on_connect)
+        )
+        await self.async_sync()
+
+    @callback
+    def async_add_listener(self, listener: CALLBACK_TYPE) -> CALLBACK_TYPE:
+        """Call listener whenever the state changes."""
+        self._listeners.append(listener)
+
+        @callback
+        def _remove() -> None:
+            self._listeners.remove(listener)
+
+        return _remove
+
+    @callback
+    def _async_notify(self) -> None:
+        for listener in list(self._listeners):
+            listener()
+
+    async def async_sync(self) -> None:
+        """Fetch the whole state in one request batch."""
+        try:
+            results = await self.connection.async_request_batch(
+                [
+                    {"requestType": "GetStudioModeEnabled"},
+                    {"requestType": "GetSceneList"},
+                    {"requestType": "GetSceneTransitionList"},
+                    {"requestType": "GetCurrentSceneTransition"},
+                ],
+                EXECUTION_TYPES["serial_realtime"],
+            )
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot fetch the studio mode state: %s", err)
+            return
+        studio, scenes, transitions, current = (
+            result.get("responseData") or {}
+            if result.get("requestStatus", {}).get("result")
+            else {}
+            for result in results
+        )
+        self.studio_mode = bool(studio.get("studioModeEnabled"))
+        self.preview_scene = scenes.get("currentPreviewSceneName")
+        self._set_scenes(scenes.get("scenes", []))
+        self.transitions = {
+            transition["transitionName"]: transition
+            for transition in transitions.get("transitions", [])
+        }
+        self.transition = transitions.get("currentSceneTransitionName")
+        self.transition_duration = current.get("transitionDuration")
+        self.transitioning = False
+        self.synced = True
+        self._async_notify()
+
+    def _set_scenes(self, scenes: list[dict[str, Any]]) -> None:
+        # OBS lists scenes bottom up by sceneIndex
+        self.scenes = [
+            scene["sceneName"]
+            for scene in sorted(
+                scenes, key=lambda scene: scene.get("sceneIndex", 0), reverse=True
+            )
+        ]
+
+    @callback
+    def _async_on_studio_mode_changed(self, data: dict[str, Any]) -> None:
+        self.studio_mode = data["studioModeEnabled"]
+        if not self.studio_mode:
+            self.preview_scene = None
+            self._async_notify()
+            return
+        # The preview scene is set when studio mode is enabled, without an
+        # event of its own
+        self._entry.async_create_background_task(
+            self.connection.hass, self._async_fetch_preview(), f"{DOMAIN} preview"
+        )
+
+    async def _async_fetch_preview(self) -> None:
+        try:
+            response = await self.connection.async_request("GetCurrentPreviewScene")
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot fetch the preview scene: %s", err)
+        else:
+            self.preview_scene = response.get("currentPreviewSceneName")
+        self._async_notify()
+
+    @callback
+    def _async_on_preview_scene_changed(self, data: dict[str, Any]) -> None:
+        self.preview_scene = data["sceneName"]
+        self._async_notify()
+
+    @callback
+    def _async_on_scene_list_changed(self, data: dict[str, Any]) -> None:
+        self._set_scenes(data["scenes"])
+        self._async_notify()
+
+    @callback
+    def _async_on_scene_name_changed(self, data: dict[str, Any]) -> None:
+        old, new = data["oldSceneName"], data["sceneName"]
+        self.scenes = [new if scene == old else scene for scene in self.scenes]
+        if self.preview_scene == old:
+            self.preview_scene = new
+        self._async_notify()
+
+    @callback
+    def _async_on_transition_changed(self, data: dict[str, Any]) -> None:
+        self.transition = data["transitionName"]
+        if self.transition not in self.transitions:
+            # A transition added since the last sync
+            self.transitions[self.transition] = {"transitionName": self.transition}
+        self._async_notify()
+
+    @callback
+    def _async_on_transition_duration_changed(self, data: dict[str, Any]) -> None:
+        self.transition_duration = data["transitionDuration"]
+        self._async_notify()
+
+    @callback
+    def _async_on_transition_started(self, data: dict[str, Any]) -> None:
+        self.transitioning = True
+        self._async_notify()
+
+    @callback
+    def _async_on_transition_ended(self, data: dict[str, Any]) -> None:
+        self.transitioning = False
+        self._async_notify()
+
+    @callback
+    def _async_on_connect(self) -> None:
+        self._entry.async_create_background_task(
+            self.connection.hass, self.async_sync(), f"{DOMAIN} sync studio mode"
+        )
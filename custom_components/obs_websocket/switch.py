@@ -0,0 +1,372 @@
+"""Switch platform for OBS WebSocket scene item visibility."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.components.switch import SwitchEntity
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, FEATURE_SCENE_ITEMS, FEATURE_STUDIO_MODE
+from . import OBSConfigEntry, OBSConnection, OBSCoordinator
+from .entity import OBSStudioEntity, obs_device_info
+
+_LOGGER = logging.getLogger(__name__)
+
+PARALLEL_UPDATES = 1
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: OBSConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up OBS WebSocket studio mode and scene item switches from a config entry."""
+    features = entry.runtime_data.features
+    if FEATURE_STUDIO_MODE in features:
+        async_add_entities([OBSStudioModeSwitch(entry)])
+    if FEATURE_SCENE_ITEMS in features:
+        index = OBSSceneItemIndex(hass, entry, async_add_entities)
+        await index.async_start()
+
+
+def _unique_id_prefix(entry: OBSConfigEntry) -> str:
+    return f"{entry.entry_id}_scene_item_"
+
+
+class OBSSceneItemIndex:
+    """Lazily loaded index of scene items, kept current by OBS events.
+
+    Scenes are only fetched with GetSceneItemList when they are needed: the
+    current program scene, scenes that become the program scene, and scenes
+    that already have an enabled switch in the entity registry. Loaded scenes
+    are then tracked from scene item events alone. Renamed scenes keep their
+    switches, whose unique IDs are migrated to the new scene name, and the
+    switches of removed scenes are removed with them.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry: OBSConfigEntry,
+        async_add_entities: AddEntitiesCallback,
+    ) -> None:
+        """Initialize."""
+        self.hass = hass
+        self._entry = entry
+        self.connection: OBSConnection = entry.runtime_data.connection
+        self.coordinator: OBSCoordinator = entry.runtime_data.coordinator
+        self._async_add_entities = async_add_entities
+        self._wanted: set[str] = set()
+        self._loaded: set[str] = set()
+        self._loading: set[str] = set()
+        self._scenes: dict[str, dict[int, OBSSceneItemSwitch]] = {}
+        self._available = self.coordinator.last_update_success
+
+    async def async_start(self) -> None:
+        """Subscribe to events and load the initial scenes."""
+        entry = self._entry
+        for event_type, handler in (
+            ("SceneItemEnableStateChanged", self._async_on_enable_state_changed),
+            ("SceneItemCreated", self._async_on_item_created),
+            ("SceneItemRemoved", self._async_on_item_removed),
+            ("CurrentProgramSceneChanged", self._async_on_program_scene_changed),
+            ("SceneNameChanged", self._async_on_scene_name_changed),
+            ("SceneRemoved", self._async_on_scene_removed),
+        ):
+            entry.async_on_unload(self.connection.async_add_listener(event_type, handler))
+        entry.async_on_unload(
+            self.connection.async_add_connect_listener(self._async_on_connect)
+        )
+        entry.async_on_unload(
+            self.coordinator.async_add_listener(self._async_on_coordinator_update)
+        )
+
+        ent_reg = er.async_get(self.hass)
+        prefix = _unique_id_prefix(entry)
+        for reg_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id):
+            if (
+                reg_entry.domain == "switch"
+                and reg_entry.disabled_by is None
+                and reg_entry.unique_id.startswith(prefix)
+            ):
+                self._wanted.add(reg_entry.unique_id[len(prefix) :].rsplit("_", 1)[0])
+
+        await self._async_sync()
+
+    async def _async_sync(self) -> None:
+        """(Re)load the program scene and every scene we are tracking."""
+        self._loaded.clear()
+        try:
+            program = await self.connection.async_request("GetCurrentProgramScene")
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot fetch current program scene: %s", err)
+        else:
+            self._wanted.add(program["currentProgramSceneName"])
+        for scene in list(self._wanted):
+            await self.async_load_scene(scene)
+
+    async def async_load_scene(self, scene: str) -> None:
+        """Fetch a scene's items and create switches for new ones."""
+        self._wanted.add(scene)
+        if scene in self._loaded or scene in self._loading:
+            return
+        self._loading.add(scene)
+        try:
+            response = await self.connection.async_request(
+                "GetSceneItemList", {"sceneName": scene}
+            )
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot load scene items of %s: %s", scene, err)
+            return
+        finally:
+            self._loading.discard(scene)
+        self._loaded.add(scene)
+
+        items = self._scenes.setdefault(scene, {})
+        seen: set[int] = set()
+        new_entities: list[OBSSceneItemSwitch] = []
+        for item in response.get("sceneItems", []):
+            item_id = item["sceneItemId"]
+            seen.add(item_id)
+            if (entity := items.get(item_id)) is None:
+                entity = OBSSceneItemSwitch(
+                    self, scene, item_id, item["sourceName"], item["sceneItemEnabled"]
+                )
+                items[item_id] = entity
+                new_entities.append(entity)
+            else:
+                entity.async_set_enabled(item["sceneItemEnabled"])
+        for item_id in set(items) - seen:
+            self._async_remove_item(scene, item_id)
+        if new_entities:
+            self._async_add_entities(new_entities)
+
+    @callback
+    def _async_remove_item(self, scene: str, item_id: int) -> None:
+        """Remove a switch and its registry entry without reloading the entry."""
+        entity = self._scenes[scene].pop(item_id)
+        ent_reg = er.async_get(self.hass)
+        if entity_id := ent_reg.async_get_entity_id("switch", DOMAIN, entity.unique_id):
+            ent_reg.async_remove(entity_id)
+        elif entity.hass is not None:
+            self.hass.async_create_task(entity.async_remove())
+
+    @callback
+    def _async_on_enable_state_changed(self, data: dict[str, Any]) -> None:
+        items = self._scenes.get(data["sceneName"])
+        if items and (entity := items.get(data["sceneItemId"])):
+            entity.async_set_enabled(data["sceneItemEnabled"])
+
+    @callback
+    def _async_on_item_created(self, data: dict[str, Any]) -> None:
+        if data["sceneName"] in self._loaded:
+            self._entry.async_create_background_task(
+                self.hass,
+                self._async_add_item(
+                    data["sceneName"], data["sceneItemId"], data["sourceName"]
+                ),
+                f"{DOMAIN} add scene item",
+            )
+
+    async def _async_add_item(self, scene: str, item_id: int, source: str) -> None:
+        try:
+            response = await self.connection.async_request(
+                "GetSceneItemEnabled", {"sceneName": scene, "sceneItemId": item_id}
+            )
+        except HomeAssistantError as err:
+            _LOGGER.debug("Cannot add scene item %s/%s: %s", scene, item_id, err)
+            return
+        items = self._scenes.setdefault(scene, {})
+        if item_id in items:
+            return
+        entity = OBSSceneItemSwitch(
+            self, scene, item_id, source, response["sceneItemEnabled"]
+        )
+        items[item_id] = entity
+        self._async_add_entities([entity])
+
+    @callback
+    def _async_on_item_removed(self, data: dict[str, Any]) -> None:
+        items = self._scenes.get(data["sceneName"])
+        if items and data["sceneItemId"] in items:
+            self._async_remove_item(data["sceneName"], data["sceneItemId"])
+
+    @callback
+    def _async_on_program_scene_changed(self, data: dict[str, Any]) -> None:
+        scene = data["sceneName"]
+        if scene not in self._loaded:
+            self._entry.async_create_background_task(
+                self.hass, self.async_load_scene(scene), f"{DOMAIN} load scene"
+            )
+
+    @callback
+    def _async_on_scene_name_changed(self, data: dict[str, Any]) -> None:
+        old, new = data["oldSceneName"], data["sceneName"]
+        for scenes in (self._wanted, self._loaded):
+            if old in scenes:
+                scenes.discard(old)
+                scenes.add(new)
+        # Migrate every switch of the scene, including those not loaded
+        ent_reg = er.async_get(self.hass)
+        prefix = _unique_id_prefix(self._entry)
+        for reg_entry in er.async_entries_for_config_entry(
+            ent_reg, self._entry.entry_id
+        ):
+            if reg_entry.domain != "switch" or not reg_entry.unique_id.startswith(
+                prefix
+            ):
+                continue
+            scene, item_id = reg_entry.unique_id[len(prefix) :].rsplit("_", 1)
+            if scene == old:
+                ent_reg.async_update_entity(
+                    reg_entry.entity_id, new_unique_id=f"{prefix}{new}_{item_id}"
+                )
+        if (items := self._scenes.pop(old, None)) is not None:
+            self._scenes[new] = items
+            for entity in items.values():
+                entity.async_set_scene(new)
+
+    @callback
+    def _async_on_scene_removed(self, data: dict[str, Any]) -> None:
+        # OBS sends no SceneItemRemoved for the items of a removed scene
+        scene = data["sceneName"]
+        self._wanted.discard(scene)
+        self._loaded.discard(scene)
+        for item_id in list(self._scenes.get(scene, ())):
+            self._async_remove_item(scene, item_id)
+        self._scenes.pop(scene, None)
+        # Remove the switches of the scene that were never loaded too
+        ent_reg = er.async_get(self.hass)
+        prefix = _unique_id_prefix(self._entry)
+        for reg_entry in er.async_entries_for_config_entry(
+            ent_reg, self._entry.entry_id
+        ):
+            if reg_entry.domain != "switch" or not reg_entry.unique_id.startswith(
+                prefix
+            ):
+                continue
+            if reg_entry.unique_id[len(prefix) :].rsplit("_", 1)[0] == scene:
+                ent_reg.async_remove(reg_entry.entity_id)
+
+    @callback
+    def _async_on_connect(self) -> None:
+        self._entry.async_create_background_task(
+            self.hass, self._async_sync(), f"{DOMAIN} sync scene items"
+        )
+
+    @callback
+    def _async_on_coordinator_update(self) -> None:
+        """Write switch states only when availability flips."""
+        available = self.coordinator.last_update_success
+        if available == self._available:
+            return
+        self._available = available
+        for items in self._scenes.values():
+            for entity in items.values():
+                if entity.hass is not None:
+                    entity.async_write_ha_state()
+
+
+class OBSSceneItemSwitch(SwitchEntity):
+    """Switch controlling the visibility of an OBS scene item."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_entity_registry_enabled_default = False
+    _attr_translation_key = "scene_item"
+
+    def __init__(
+        self,
+        index: OBSSceneItemIndex,
+        scene: str,
+        item_id: int,
+        source: str,
+        enabled: bool,
+    ) -> None:
+        """Initialize."""
+        self._index = index
+        self._item_id = item_id
+        self._source = source
+        self._attr_device_info = obs_device_info(index._entry)
+        self._attr_is_on = enabled
+        self._set_scene(scene)
+
+    def _set_scene(self, scene: str) -> None:
+        self._scene = scene
+        self._attr_name = f"{scene} {self._source}"
+        self._attr_unique_id = (
+            f"{_unique_id_prefix(self._index._entry)}{scene}_{self._item_id}"
+        )
+        self._attr_extra_state_attributes = {
+            "scene_name": scene,
+            "source_name": self._source,
+            "scene_item_id": self._item_id,
+        }
+
+    @callback
+    def async_set_scene(self, scene: str) -> None:
+        """Follow a rename of the scene in OBS."""
+        self._set_scene(scene)
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    @property
+    def available(self) -> bool:
+        """Return if OBS is reachable."""
+        return self._index.coordinator.last_update_success
+
+    @callback
+    def async_set_enabled(self, enabled: bool) -> None:
+        """Update the state from OBS."""
+        if enabled == self._attr_is_on:
+            return
+        self._attr_is_on = enabled
+        if self.hass is not None:
+            self.async_write_ha_state()
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Show the scene item."""
+        await self._async_set(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Hide the scene item."""
+        await self._async_set(False)
+
+    async def _async_set(self, enabled: bool) -> None:
+        await self._index.connection.async_request(
+            "SetSceneItemEnabled",
+            {
+                "sceneName": self._scene,
+                "sceneItemId": self._item_id,
+                "sceneItemEnabled": enabled,
+            },
+        )
+
+
+class OBSStudioModeSwitch(OBSStudioEntity, SwitchEntity):
+    """Switch enabling studio mode."""
+
+    def __init__(self, entry: OBSConfigEntry) -> None:
+        """Initialize."""
+        super().__init__(entry, "studio_mode")
+
+    @property
+    def is_on(self) -> bool:
+        """Return if studio mode is enabled."""
+        return self._studio.studio_mode
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Enable studio mode."""
+        await self._async_set(True)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Disable studio mode."""
+        await self._async_set(False)
+
+    async def _async_set(self, enabled: bool) -> None:
+        await self._studio.connection.async_request(
+            "SetStudioModeEnabled", {"studioModeEnabled": enabled}
+        )
@@ -0,0 +1,122 @@
+"""Connection telemetry for OBS WebSocket."""
+
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Any
+
+from homeassistant.util import dt as dt_util
+
+# Upper bounds of the latency histogram buckets in milliseconds
+LATENCY_BUCKETS_MS: tuple[float, ...] = (
+    1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000
+)
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram; recording a sample is O(log buckets)."""
+
+    __slots__ = ("counts", "count", "total_ms", "max_ms")
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.counts = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        """Record a sample."""
+        self.counts[bisect_left(LATENCY_BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the histogram for diagnostics."""
+        buckets = {
+            f"<={bound:g}ms": count
+            for bound, count in zip(LATENCY_BUCKETS_MS, self.counts)
+            if count
+        }
+        if self.counts[-1]:
+            buckets[f">{LATENCY_BUCKETS_MS[-1]:g}ms"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "mean_ms": round(self.total_ms / self.count, 2) if self.count else None,
+            "total_ms": round(self.total_ms, 2),
+            "max_ms": round(self.max_ms, 2),
+            "buckets": buckets,
+        }
+
+
+class OBSTelemetry:
+    """Counters and timings collected by one OBS connection.
+
+    Requests are recorded while the request lock is held and events from the
+    single EventClient thread, so plain counters are enough.
+    """
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.requests: dict[str, LatencyHistogram] = {}
+        self.events: dict[str, int] = {}
+        self.refreshes = LatencyHistogram()
+        self.connects = 0
+        self.handshake_ms: float | None = None
+        self.last_rtt_ms: float | None = None
+        self.last_errors: dict[str, dict[str, str]] = {}
+
+    @property
+    def reconnects(self) -> int:
+        """Return how often the connection was re-established."""
+        return max(self.connects - 1, 0)
+
+    def record_request(self, request_type: str, seconds: float) -> None:
+        """Record the round trip time of a request."""
+        ms = seconds * 1000
+        if (histogram := self.requests.get(request_type)) is None:
+            histogram = self.requests[request_type] = LatencyHistogram()
+        histogram.add(ms)
+        self.last_rtt_ms = ms
+
+    def record_event(self, event_type: str) -> None:
+        """Count a received event."""
+        self.events[event_type] = self.events.get(event_type, 0) + 1
+
+    def record_connect(self, seconds: float) -> None:
+        """Record a successful connect and its handshake time."""
+        self.connects += 1
+        self.handshake_ms = seconds * 1000
+
+    def record_refresh(self, seconds: float) -> None:
+        """Record the duration of a coordinator refresh."""
+        self.refreshes.add(seconds * 1000)
+
+    def record_error(self, kind: str, err: BaseException) -> None:
+        """Remember when and why something last failed."""
+        self.last_errors[kind] = {
+            "time": dt_util.utcnow().isoformat(),
+            "error": f"{type(err).__name__}: {err}",
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the telemetry for diagnostics."""
+        return {
+            "connects": self.connects,
+            "reconnects": self.reconnects,
+            "handshake_ms": (
+                round(self.handshake_ms, 2) if self.handshake_ms is not None else None
+            ),
+            "last_rtt_ms": (
+                round(self.last_rtt_ms, 2) if self.last_rtt_ms is not None else None
+            ),
+            "requests": {
+                request_type: histogram.as_dict()
+                for request_type, histogram in sorted(self.requests.items())
+            },
+            "events": dict(sorted(self.events.items())),
+            "refreshes": self.refreshes.as_dict(),
+            "last_errors": self.last_errors,
+        }
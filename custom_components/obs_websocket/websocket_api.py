@@ -0,0 +1,74 @@
+"""Websocket API for the OBS WebSocket integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DOMAIN, MAX_STATS_INTERVAL, MIN_STATS_INTERVAL
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the OBS WebSocket websocket commands."""
+    websocket_api.async_register_command(hass, ws_subscribe_stats)
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe_stats",
+        vol.Required("config_entry_id"): str,
+        vol.Optional("interval", default=1.0): vol.All(
+            vol.Coerce(float), vol.Range(min=MIN_STATS_INTERVAL, max=MAX_STATS_INTERVAL)
+        ),
+    }
+)
+@callback
+def ws_subscribe_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Send stream status and OBS stats samples every interval seconds."""
+    entry = hass.config_entries.async_get_entry(msg["config_entry_id"])
+    if entry is None or entry.domain != DOMAIN:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Config entry not found"
+        )
+        return
+    if entry.state is not ConfigEntryState.LOADED:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_ALLOWED, "Config entry not loaded"
+        )
+        return
+    if (stats := entry.runtime_data.stats) is None:
+        connection.send_error(
+            msg["id"],
+            websocket_api.ERR_NOT_SUPPORTED,
+            "Live stats are not enabled for this config entry",
+        )
+        return
+
+    @callback
+    def _forward(sample: dict[str, Any]) -> None:
+        connection.send_message(websocket_api.event_message(msg["id"], sample))
+
+    @callback
+    def _stopped() -> None:
+        # The entry was unloaded; end the subscription on the client too
+        connection.subscriptions.pop(msg["id"], None)
+        connection.send_message(
+            websocket_api.error_message(
+                msg["id"], websocket_api.ERR_NOT_ALLOWED, "Config entry unloaded"
+            )
+        )
+
+    connection.subscriptions[msg["id"]] = stats.async_subscribe(
+        _forward, msg["interval"], _stopped
+    )
+    connection.send_result(msg["id"])
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pycares
 import pytest
 
 from homeassistant.core import HomeAssistant
@@ -14,6 +16,52 @@ from homeassistant import loader
 
 from custom_components.obs_websocket.const import DOMAIN
 
+from .fake_obs import FakeOBSServer
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the benchmark options."""
+    parser.addoption(
+        "--obs-benchmark",
+        action="store_true",
+        help="run the benchmarks against the fake OBS server",
+    )
+    parser.addoption(
+        "--obs-benchmark-json",
+        default="benchmark-results.json",
+        help="file the benchmark results are written to",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Register the benchmark marker."""
+    config.addinivalue_line(
+        "markers", "obs_benchmark: benchmark, only run with --obs-benchmark"
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip benchmarks unless they were asked for."""
+    if config.getoption("obs_benchmark"):
+        return
+    skip = pytest.mark.skip(reason="needs --obs-benchmark")
+    for item in items:
+        if "obs_benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+@pytest.fixture(autouse=True, scope="session")
+def dns_resolver_thread() -> None:
+    """Create a DNS channel before the first test.
+
+    pycares starts a process-wide cleanup thread with its first channel,
+    which would otherwise be reported as a thread leaked by the first test
+    using Home Assistant's client session.
+    """
+    pycares.Channel().close()
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(hass: HomeAssistant) -> None:
@@ -104,3 +152,15 @@ def mock_obsws(mock_req_client: MagicMock):
 
     with patch.dict("sys.modules", {"obsws_python": mock_obs}):
         yield mock_obs
+
+
+@pytest.fixture
+async def fake_obs(socket_enabled: None) -> AsyncGenerator[FakeOBSServer]:
+    """Run a local OBS WebSocket server using the mock password.
+
+    Sockets stay restricted to 127.0.0.1.
+    """
+    server = FakeOBSServer(password=MOCK_PASSWORD)
+    await server.start()
+    yield server
+    await server.stop()
@@ -0,0 +1,794 @@
+"""Local obs-websocket v5 server standing in for OBS Studio in tests.
+
+The server speaks the real protocol (Hello/Identify authentication,
+Request, RequestBatch, Reidentify and events), so the real ``obsws_python``
+clients can connect to it. Requests are answered from a small in-memory
+OBS state and further handlers can be registered per test. Faults such as
+request latency, failing requests, dropped connections, refused connects
+and password changes are set on the server while a test runs.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from collections.abc import Callable, Coroutine
+from dataclasses import dataclass, field
+import hashlib
+import secrets
+from typing import Any
+
+from aiohttp import WSCloseCode, WSMsgType, web
+
+# WebSocketOpCode values
+OP_HELLO = 0
+OP_IDENTIFY = 1
+OP_IDENTIFIED = 2
+OP_REIDENTIFY = 3
+OP_EVENT = 5
+OP_REQUEST = 6
+OP_REQUEST_RESPONSE = 7
+OP_REQUEST_BATCH = 8
+OP_REQUEST_BATCH_RESPONSE = 9
+
+# WebSocketCloseCode values
+CLOSE_NOT_IDENTIFIED = 4007
+CLOSE_AUTHENTICATION_FAILED = 4009
+
+# RequestStatus values
+STATUS_SUCCESS = 100
+STATUS_UNKNOWN_REQUEST_TYPE = 204
+STATUS_RESOURCE_NOT_FOUND = 600
+
+# EventSubscription values
+INTENT_GENERAL = 1 << 0
+INTENT_CONFIG = 1 << 1
+INTENT_SCENES = 1 << 2
+INTENT_INPUTS = 1 << 3
+INTENT_TRANSITIONS = 1 << 4
+INTENT_OUTPUTS = 1 << 6
+INTENT_SCENE_ITEMS = 1 << 7
+INTENT_UI = 1 << 10
+INTENT_INPUT_VOLUME_METERS = 1 << 16
+INTENT_ALL = 0x7FF
+
+EVENT_INTENTS: dict[str, int] = {
+    "CurrentSceneCollectionChanging": INTENT_CONFIG,
+    "CurrentProfileChanging": INTENT_CONFIG,
+    "CurrentProgramSceneChanged": INTENT_SCENES,
+    "SceneListChanged": INTENT_SCENES,
+    "SceneCreated": INTENT_SCENES,
+    "SceneRemoved": INTENT_SCENES,
+    "InputMuteStateChanged": INTENT_INPUTS,
+    "InputVolumeChanged": INTENT_INPUTS,
+    "InputVolumeMeters": INTENT_INPUT_VOLUME_METERS,
+    "CurrentSceneTransitionChanged": INTENT_TRANSITIONS,
+    "CurrentSceneTransitionDurationChanged": INTENT_TRANSITIONS,
+    "SceneTransitionStarted": INTENT_TRANSITIONS,
+    "SceneTransitionEnded": INTENT_TRANSITIONS,
+    "CurrentPreviewSceneChanged": INTENT_SCENES,
+    "StudioModeStateChanged": INTENT_UI,
+    "StreamStateChanged": INTENT_OUTPUTS,
+    "RecordStateChanged": INTENT_OUTPUTS,
+    "RecordFileChanged": INTENT_OUTPUTS,
+    "SceneItemCreated": INTENT_SCENE_ITEMS,
+    "SceneItemRemoved": INTENT_SCENE_ITEMS,
+    "SceneItemEnableStateChanged": INTENT_SCENE_ITEMS,
+}
+
+# A 1x1 transparent PNG returned for screenshots
+PIXEL_PNG = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAADUlEQVR42mNkYPhfDwAChwGA60e6kgAAAABJRU5ErkJggg=="
+)
+
+type RequestHandler = Callable[[dict[str, Any]], dict[str, Any] | None]
+
+
+class FakeRequestError(Exception):
+    """Raised by a request handler to fail the request."""
+
+    def __init__(self, code: int, comment: str | None = None) -> None:
+        """Initialize."""
+        super().__init__(comment)
+        self.code = code
+        self.comment = comment
+
+
+@dataclass
+class FakeSession:
+    """A client connected to the fake server."""
+
+    ws: web.WebSocketResponse
+    identified: bool = False
+    subscriptions: int = INTENT_ALL
+
+
+@dataclass
+class FakeOBSState:
+    """The parts of OBS the default request handlers read and change."""
+
+    stream_active: bool = False
+    stream_reconnecting: bool = False
+    stream_bytes: int = 0
+    stream_duration: int = 0
+    stream_skipped_frames: int = 0
+    stream_total_frames: int = 0
+    record_active: bool = False
+    record_path: str | None = None
+    record_files: int = 0
+    # Chapter names of the current recording, None for unnamed ones
+    record_chapters: list[str | None] = field(default_factory=list)
+    # Outputs besides the stream output, by name, e.g. multi-RTMP targets
+    outputs: dict[str, dict[str, Any]] = field(default_factory=dict)
+    program_scene: str = "Scene"
+    studio_mode: bool = False
+    preview_scene: str | None = None
+    transition: str = "Fade"
+    transition_duration: int = 300
+    # Scene name -> list of scene items
+    scenes: dict[str, list[dict[str, Any]]] = field(
+        default_factory=lambda: {
+            "Scene": [
+                {"sceneItemId": 1, "sourceName": "Camera", "sceneItemEnabled": True},
+                {"sceneItemId": 2, "sourceName": "Overlay", "sceneItemEnabled": False},
+            ]
+        }
+    )
+    hotkeys: list[str] = field(
+        default_factory=lambda: [
+            "OBSBasic.StartStreaming",
+            "OBSBasic.StopStreaming",
+            "OBSBasic.Screenshot",
+        ]
+    )
+    # Hotkey names and key sequences triggered, in order
+    triggered_hotkeys: list[Any] = field(default_factory=list)
+    # Vendors registered by plugins; their requests echo the request data
+    vendors: set[str] = field(default_factory=lambda: {"AdvancedSceneSwitcher"})
+    service_type: str = "rtmp_common"
+    service_settings: dict[str, Any] = field(
+        default_factory=lambda: {
+            "server": "rtmp://live.twitch.tv/app",
+            "key": "live_abc123",
+        }
+    )
+
+
+class FakeOBSServer:
+    """An obs-websocket v5 server on 127.0.0.1 with scriptable faults."""
+
+    def __init__(
+        self,
+        *,
+        password: str | None = None,
+        obs_version: str = "30.2.0",
+        websocket_version: str = "5.5.0",
+    ) -> None:
+        """Initialize."""
+        self.password = password
+        self.obs_version = obs_version
+        self.websocket_version = websocket_version
+        self.state = FakeOBSState()
+        self.sessions: list[FakeSession] = []
+        # Every request type received, in order, including batched requests
+        self.requests: list[str] = []
+        self.connects = 0
+        self.batches = 0
+        # Faults
+        self.latency = 0.0
+        self.refuse_connections = False
+        self.drop_next_requests = 0
+        self.failing_requests: dict[str, tuple[int, str | None]] = {}
+        self._handlers: dict[str, RequestHandler] = {
+            "GetVersion": self._get_version,
+            "GetStats": self._get_stats,
+            "GetStreamStatus": self._get_stream_status,
+            "GetStreamServiceSettings": self._get_stream_service_settings,
+            "GetRecordStatus": self._get_record_status,
+            "GetOutputList": self._get_output_list,
+            "GetOutputStatus": self._get_output_status,
+            "GetCurrentProgramScene": self._get_current_program_scene,
+            "SetCurrentProgramScene": self._set_current_program_scene,
+            "GetSceneList": self._get_scene_list,
+            "GetSceneItemList": self._get_scene_item_list,
+            "GetSceneItemEnabled": self._get_scene_item_enabled,
+            "SetSceneItemEnabled": self._set_scene_item_enabled,
+            "GetSourceScreenshot": self._get_source_screenshot,
+            "GetStudioModeEnabled": self._get_studio_mode_enabled,
+            "SetStudioModeEnabled": self._set_studio_mode_enabled,
+            "GetCurrentPreviewScene": self._get_current_preview_scene,
+            "SetCurrentPreviewScene": self._set_current_preview_scene,
+            "GetSceneTransitionList": self._get_scene_transition_list,
+            "GetCurrentSceneTransition": self._get_current_scene_transition,
+            "SetCurrentSceneTransition": self._set_current_scene_transition,
+            "SetCurrentSceneTransitionDuration": (
+                self._set_current_scene_transition_duration
+            ),
+            "TriggerStudioModeTransition": self._trigger_studio_mode_transition,
+            "GetHotkeyList": self._get_hotkey_list,
+            "TriggerHotkeyByName": self._trigger_hotkey_by_name,
+            "TriggerHotkeyByKeySequence": self._trigger_hotkey_by_key_sequence,
+            "CallVendorRequest": self._call_vendor_request,
+            "StartRecord": self._start_record,
+            "StopRecord": self._stop_record,
+            "SplitRecordFile": self._split_record_file,
+            "CreateRecordChapter": self._create_record_chapter,
+            "StartStream": self._start_stream,
+            "StopStream": self._stop_stream,
+        }
+        self._runner: web.AppRunner | None = None
+        self._tasks: set[asyncio.Task[Any]] = set()
+        self.host = "127.0.0.1"
+        self.port = 0
+
+    async def start(self) -> None:
+        """Start listening on a free port."""
+        app = web.Application()
+        app.router.add_get("/", self._handle)
+        self._runner = web.AppRunner(app, handle_signals=False)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, 0)
+        await site.start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Close all sessions and stop listening."""
+        for task in self._tasks:
+            task.cancel()
+        await self.drop_connections()
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def set_handler(self, request_type: str, handler: RequestHandler) -> None:
+        """Answer a request type with a custom handler."""
+        self._handlers[request_type] = handler
+
+    def fail_request(
+        self, request_type: str, code: int, comment: str | None = None
+    ) -> None:
+        """Fail every following request of a type with a status code."""
+        self.failing_requests[request_type] = (code, comment)
+
+    async def drop_connections(self) -> None:
+        """Close every client connection, like OBS quitting."""
+        sessions, self.sessions = self.sessions, []
+        await asyncio.gather(
+            *(session.ws.close(code=WSCloseCode.GOING_AWAY) for session in sessions)
+        )
+
+    async def emit(
+        self,
+        event_type: str,
+        data: dict[str, Any] | None = None,
+        intent: int | None = None,
+    ) -> int:
+        """Send an event to the subscribed clients and return their count."""
+        if intent is None:
+            intent = EVENT_INTENTS.get(event_type, INTENT_GENERAL)
+        message: dict[str, Any] = {
+            "op": OP_EVENT,
+            "d": {"eventType": event_type, "eventIntent": intent},
+        }
+        if data:
+            message["d"]["eventData"] = data
+        sent = 0
+        for session in list(self.sessions):
+            if session.identified and session.subscriptions & intent:
+                await session.ws.send_json(message)
+                sent += 1
+        return sent
+
+    async def emit_many(
+        self,
+        event_type: str,
+        data: Callable[[int], dict[str, Any]] | dict[str, Any] | None = None,
+        *,
+        count: int,
+        rate: float,
+    ) -> None:
+        """Send ``count`` events spread evenly at ``rate`` events per second."""
+        interval = 1 / rate
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        for index in range(count):
+            await self.emit(event_type, data(index) if callable(data) else data)
+            if (delay := start + (index + 1) * interval - loop.time()) > 0:
+                await asyncio.sleep(delay)
+
+    def emit_background(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task[Any]:
+        """Run an emission in the background; it is cancelled on stop."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def set_stream_active(self, active: bool) -> None:
+        """Start or stop the stream and emit the state change."""
+        self.state.stream_active = active
+        await self.emit(
+            "StreamStateChanged",
+            {
+                "outputActive": active,
+                "outputState": (
+                    "OBS_WEBSOCKET_OUTPUT_STARTED"
+                    if active
+                    else "OBS_WEBSOCKET_OUTPUT_STOPPED"
+                ),
+            },
+        )
+
+    async def set_record_active(self, active: bool) -> None:
+        """Start or stop recording to a new file and emit the state change."""
+        state = self.state
+        state.record_active = active
+        path = state.record_path
+        if active:
+            state.record_files += 1
+            state.record_chapters = []
+            path = state.record_path = f"/recordings/{state.record_files}.mp4"
+        else:
+            state.record_path = None
+        await self.emit(
+            "RecordStateChanged",
+            {
+                "outputActive": active,
+                "outputState": (
+                    "OBS_WEBSOCKET_OUTPUT_STARTED"
+                    if active
+                    else "OBS_WEBSOCKET_OUTPUT_STOPPED"
+                ),
+                "outputPath": path,
+            },
+        )
+
+    async def _handle(self, request: web.Request) -> web.WebSocketResponse:
+        # Idle request clients only answer a close frame on their next
+        # request, so don't wait long for it
+        ws = web.WebSocketResponse(protocols=("obswebsocket.json",), timeout=1.0)
+        await ws.prepare(request)
+        if self.refuse_connections:
+            await ws.close(code=WSCloseCode.TRY_AGAIN_LATER)
+            return ws
+
+        self.connects += 1
+        session = FakeSession(ws)
+        self.sessions.append(session)
+        challenge = salt = None
+        hello: dict[str, Any] = {
+            "obsWebSocketVersion": self.websocket_version,
+            "rpcVersion": 1,
+        }
+        if self.password:
+            challenge = secrets.token_urlsafe(16)
+            salt = secrets.token_urlsafe(16)
+            hello["authentication"] = {"challenge": challenge, "salt": salt}
+        await ws.send_json({"op": OP_HELLO, "d": hello})
+
+        try:
+            async for msg in ws:
+                if msg.type is not WSMsgType.TEXT:
+                    break
+                message = msg.json()
+                op, data = message["op"], message["d"]
+                if op == OP_IDENTIFY:
+                    if not self._check_auth(data, challenge, salt):
+                        await ws.close(code=CLOSE_AUTHENTICATION_FAILED)
+                        break
+                    session.identified = True
+                    session.subscriptions = data.get("eventSubscriptions", INTENT_ALL)
+                    await ws.send_json(
+                        {"op": OP_IDENTIFIED, "d": {"negotiatedRpcVersion": 1}}
+                    )
+                elif not session.identified:
+                    await ws.close(code=CLOSE_NOT_IDENTIFIED)
+                    break
+                elif op == OP_REIDENTIFY:
+                    if "eventSubscriptions" in data:
+                        session.subscriptions = data["eventSubscriptions"]
+                    await ws.send_json(
+                        {"op": OP_IDENTIFIED, "d": {"negotiatedRpcVersion": 1}}
+                    )
+                elif op in (OP_REQUEST, OP_REQUEST_BATCH):
+                    if self.drop_next_requests:
+                        self.drop_next_requests -= 1
+                        await ws.close(code=WSCloseCode.GOING_AWAY)
+                        break
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    if op == OP_REQUEST:
+                        response = await self._process(data)
+                        response["requestId"] = data["requestId"]
+                        await ws.send_json({"op": OP_REQUEST_RESPONSE, "d": response})
+                    else:
+                        await ws.send_json(
+                            {
+                                "op": OP_REQUEST_BATCH_RESPONSE,
+                                "d": {
+                                    "requestId": data["requestId"],
+                                    "results": await self._process_batch(data),
+                                },
+                            }
+                        )
+        finally:
+            if session in self.sessions:
+                self.sessions.remove(session)
+        return ws
+
+    def _check_auth(
+        self, data: dict[str, Any], challenge: str | None, salt: str | None
+    ) -> bool:
+        if challenge is None or salt is None:
+            return True
+        if self.password is None:
+            # Password removed since Hello; OBS would accept the session
+            return True
+        secret = base64.b64encode(
+            hashlib.sha256((self.password + salt).encode()).digest()
+        )
+        expected = base64.b64encode(
+            hashlib.sha256(secret + challenge.encode()).digest()
+        ).decode()
+        return data.get("authentication") == expected
+
+    async def _process(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Run one request and return its RequestResponse fields."""
+        request_type = data["requestType"]
+        self.requests.append(request_type)
+        response: dict[str, Any] = {"requestType": request_type}
+        try:
+            if request_type in self.failing_requests:
+                raise FakeRequestError(*self.failing_requests[request_type])
+            if request_type == "Sleep":
+                request_data = data.get("requestData", {})
+                await asyncio.sleep(
+                    request_data.get("sleepMillis", 0) / 1000
+                    + request_data.get("sleepFrames", 0) / 60
+                )
+                response_data = None
+            elif (handler := self._handlers.get(request_type)) is None:
+                raise FakeRequestError(
+                    STATUS_UNKNOWN_REQUEST_TYPE,
+                    f"Your request type is not valid: {request_type}",
+                )
+            else:
+                response_data = handler(data.get("requestData", {}))
+        except FakeRequestError as err:
+            response["requestStatus"] = {"result": False, "code": err.code}
+            if err.comment:
+                response["requestStatus"]["comment"] = err.comment
+            return response
+        response["requestStatus"] = {"result": True, "code": STATUS_SUCCESS}
+        if response_data is not None:
+            response["responseData"] = response_data
+        return response
+
+    async def _process_batch(self, data: dict[str, Any]) -> list[dict[str, Any]]:
+        """Run a RequestBatch in order and return the results."""
+        self.batches += 1
+        results = []
+        for request in data["requests"]:
+            result = await self._process(request)
+            if "requestId" in request:
+                result["requestId"] = request["requestId"]
+            results.append(result)
+            if data.get("haltOnFailure") and not result["requestStatus"]["result"]:
+                break
+        return results
+
+    def _scene_items(self, request_data: dict[str, Any]) -> list[dict[str, Any]]:
+        if (items := self.state.scenes.get(request_data.get("sceneName"))) is None:
+            raise FakeRequestError(
+                STATUS_RESOURCE_NOT_FOUND, "No source was found by the name of"
+            )
+        return items
+
+    def _scene_item(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        for item in self._scene_items(request_data):
+            if item["sceneItemId"] == request_data.get("sceneItemId"):
+                return item
+        raise FakeRequestError(STATUS_RESOURCE_NOT_FOUND, "Scene item not found")
+
+    def _get_version(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "obsVersion": self.obs_version,
+            "obsWebSocketVersion": self.websocket_version,
+            "rpcVersion": 1,
+            "availableRequests": sorted({*self._handlers, "Sleep"}),
+            "supportedImageFormats": ["jpg", "png"],
+            "platform": "linux",
+            "platformDescription": "Fake OBS",
+        }
+
+    def _get_stats(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "cpuUsage": 1.5,
+            "memoryUsage": 250.0,
+            "availableDiskSpace": 100000.0,
+            "activeFps": 60.0,
+            "averageFrameRenderTime": 0.5,
+            "renderSkippedFrames": 0,
+            "renderTotalFrames": 1000,
+            "outputSkippedFrames": self.state.stream_skipped_frames,
+            "outputTotalFrames": self.state.stream_total_frames,
+            "webSocketSessionIncomingMessages": len(self.requests),
+            "webSocketSessionOutgoingMessages": len(self.requests),
+        }
+
+    def _get_stream_status(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        state = self.state
+        return {
+            "outputActive": state.stream_active,
+            "outputReconnecting": state.stream_reconnecting,
+            "outputTimecode": "00:00:00.000",
+            "outputDuration": state.stream_duration,
+            "outputCongestion": 0.0,
+            "outputBytes": state.stream_bytes,
+            "outputSkippedFrames": state.stream_skipped_frames,
+            "outputTotalFrames": state.stream_total_frames,
+        }
+
+    def _get_stream_service_settings(
+        self, request_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "streamServiceType": self.state.service_type,
+            "streamServiceSettings": dict(self.state.service_settings),
+        }
+
+    def _output_statuses(self) -> dict[str, dict[str, Any]]:
+        state = self.state
+        return {
+            "simple_stream": {
+                "outputKind": "rtmp_output",
+                "outputActive": state.stream_active,
+                "outputBytes": state.stream_bytes,
+                "outputDuration": state.stream_duration,
+            },
+            **state.outputs,
+        }
+
+    def _get_output_list(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "outputs": [
+                {
+                    "outputName": name,
+                    "outputKind": output.get("outputKind", "rtmp_output"),
+                    "outputActive": output.get("outputActive", False),
+                }
+                for name, output in self._output_statuses().items()
+            ]
+        }
+
+    def _get_output_status(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        if (output := self._output_statuses().get(request_data["outputName"])) is None:
+            raise FakeRequestError(600, "No output was found")
+        return {
+            "outputActive": output.get("outputActive", False),
+            "outputReconnecting": output.get("outputReconnecting", False),
+            "outputTimecode": "00:00:00.000",
+            "outputDuration": output.get("outputDuration", 0),
+            "outputCongestion": 0.0,
+            "outputBytes": output.get("outputBytes", 0),
+            "outputSkippedFrames": 0,
+            "outputTotalFrames": 0,
+        }
+
+    def _get_record_status(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "outputActive": self.state.record_active,
+            "outputPaused": False,
+            "outputTimecode": "00:00:00.000",
+            "outputDuration": 0,
+            "outputBytes": 0,
+        }
+
+    def _get_current_program_scene(
+        self, request_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "currentProgramSceneName": self.state.program_scene,
+            "sceneName": self.state.program_scene,
+        }
+
+    def _set_current_program_scene(self, request_data: dict[str, Any]) -> None:
+        self._scene_items(request_data)
+        self.state.program_scene = request_data["sceneName"]
+
+    def _get_scene_list(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {
+            "currentProgramSceneName": self.state.program_scene,
+            "currentPreviewSceneName": self.state.preview_scene,
+            "scenes": [
+                {"sceneIndex": index, "sceneName": name}
+                for index, name in enumerate(self.state.scenes)
+            ],
+        }
+
+    def _get_scene_item_list(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {"sceneItems": [dict(item) for item in self._scene_items(request_data)]}
+
+    def _get_scene_item_enabled(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {"sceneItemEnabled": self._scene_item(request_data)["sceneItemEnabled"]}
+
+    def _set_scene_item_enabled(self, request_data: dict[str, Any]) -> None:
+        item = self._scene_item(request_data)
+        item["sceneItemEnabled"] = request_data["sceneItemEnabled"]
+        self.emit_background(
+            self.emit(
+                "SceneItemEnableStateChanged",
+                {
+                    "sceneName": request_data["sceneName"],
+                    "sceneItemId": item["sceneItemId"],
+                    "sceneItemEnabled": item["sceneItemEnabled"],
+                },
+            )
+        )
+
+    def _get_hotkey_list(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {"hotkeys": list(self.state.hotkeys)}
+
+    def _trigger_hotkey_by_name(self, request_data: dict[str, Any]) -> None:
+        # OBS answers unknown names with success, doing nothing
+        if request_data["hotkeyName"] in self.state.hotkeys:
+            self.state.triggered_hotkeys.append(request_data["hotkeyName"])
+
+    def _trigger_hotkey_by_key_sequence(self, request_data: dict[str, Any]) -> None:
+        self.state.triggered_hotkeys.append(request_data)
+
+    def _call_vendor_request(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        if request_data["vendorName"] not in self.state.vendors:
+            raise FakeRequestError(
+                STATUS_RESOURCE_NOT_FOUND, "No vendor was found by that name."
+            )
+        return {
+            "vendorName": request_data["vendorName"],
+            "requestType": request_data["requestType"],
+            "responseData": {"received": request_data.get("requestData", {})},
+        }
+
+    def _get_studio_mode_enabled(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        return {"studioModeEnabled": self.state.studio_mode}
+
+    def _set_studio_mode_enabled(self, request_data: dict[str, Any]) -> None:
+        state = self.state
+        state.studio_mode = request_data["studioModeEnabled"]
+        state.preview_scene = state.program_scene if state.studio_mode else None
+        self.emit_background(
+            self.emit(
+                "StudioModeStateChanged", {"studioModeEnabled": state.studio_mode}
+            )
+        )
+
+    def _check_studio_mode(self) -> None:
+        if not self.state.studio_mode:
+            raise FakeRequestError(506, "Studio mode is not active")
+
+    def _get_current_preview_scene(
+        self, request_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        self._check_studio_mode()
+        return {"currentPreviewSceneName": self.state.preview_scene}
+
+    def _set_current_preview_scene(self, request_data: dict[str, Any]) -> None:
+        self._check_studio_mode()
+        self._scene_items(request_data)
+        self.state.preview_scene = request_data["sceneName"]
+        self.emit_background(
+            self.emit(
+                "CurrentPreviewSceneChanged", {"sceneName": request_data["sceneName"]}
+            )
+        )
+
+    def _get_scene_transition_list(
+        self, request_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "currentSceneTransitionName": self.state.transition,
+            "currentSceneTransitionKind": "fade_transition",
+            "transitions": [
+                {
+                    "transitionName": "Cut",
+                    "transitionKind": "cut_transition",
+                    "transitionFixed": True,
+                    "transitionConfigurable": False,
+                },
+                {
+                    "transitionName": "Fade",
+                    "transitionKind": "fade_transition",
+                    "transitionFixed": False,
+                    "transitionConfigurable": False,
+                },
+            ],
+        }
+
+    def _get_current_scene_transition(
+        self, request_data: dict[str, Any]
+    ) -> dict[str, Any]:
+        return {
+            "transitionName": self.state.transition,
+            "transitionDuration": self.state.transition_duration,
+        }
+
+    def _set_current_scene_transition(self, request_data: dict[str, Any]) -> None:
+        self.state.transition = request_data["transitionName"]
+        self.emit_background(
+            self.emit(
+                "CurrentSceneTransitionChanged",
+                {"transitionName": self.state.transition},
+            )
+        )
+
+    def _set_current_scene_transition_duration(
+        self, request_data: dict[str, Any]
+    ) -> None:
+        self.state.transition_duration = request_data["transitionDuration"]
+        self.emit_background(
+            self.emit(
+                "CurrentSceneTransitionDurationChanged",
+                {"transitionDuration": self.state.transition_duration},
+            )
+        )
+
+    def _trigger_studio_mode_transition(self, request_data: dict[str, Any]) -> None:
+        self._check_studio_mode()
+        self.emit_background(self._transition())
+
+    async def _transition(self) -> None:
+        """Swap the preview and program scenes over the transition duration."""
+        state = self.state
+        transition = {"transitionName": state.transition}
+        await self.emit("SceneTransitionStarted", transition)
+        state.program_scene, state.preview_scene = (
+            state.preview_scene or state.program_scene,
+            state.program_scene,
+        )
+        await self.emit(
+            "CurrentProgramSceneChanged", {"sceneName": state.program_scene}
+        )
+        await self.emit(
+            "CurrentPreviewSceneChanged", {"sceneName": state.preview_scene}
+        )
+        await asyncio.sleep(state.transition_duration / 1000)
+        await self.emit("SceneTransitionEnded", transition)
+
+    def _get_source_screenshot(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        image_format = request_data.get("imageFormat", "png")
+        return {
+            "imageData": f"data:image/{image_format};base64,"
+            + base64.b64encode(PIXEL_PNG).decode()
+        }
+
+    def _check_recording(self) -> None:
+        if not self.state.record_active:
+            raise FakeRequestError(501, "Recording is not active")
+
+    def _start_record(self, request_data: dict[str, Any]) -> None:
+        if self.state.record_active:
+            raise FakeRequestError(500, "Recording is already active")
+        self.emit_background(self.set_record_active(True))
+
+    def _stop_record(self, request_data: dict[str, Any]) -> dict[str, Any]:
+        self._check_recording()
+        path = self.state.record_path
+        self.emit_background(self.set_record_active(False))
+        return {"outputPath": path}
+
+    def _split_record_file(self, request_data: dict[str, Any]) -> None:
+        self._check_recording()
+        state = self.state
+        state.record_files += 1
+        state.record_path = f"/recordings/{state.record_files}.mp4"
+        self.emit_background(
+            self.emit("RecordFileChanged", {"newOutputPath": state.record_path})
+        )
+
+    def _create_record_chapter(self, request_data: dict[str, Any]) -> None:
+        self._check_recording()
+        self.state.record_chapters.append(request_data.get("chapterName"))
+
+    def _start_stream(self, request_data: dict[str, Any]) -> None:
+        self.emit_background(self.set_stream_active(True))
+
+    def _stop_stream(self, request_data: dict[str, Any]) -> None:
+        self.emit_background(self.set_stream_active(False))
@@ -0,0 +1,282 @@
+"""Benchmarks of the integration against the local fake OBS server.
+
+Skipped unless pytest runs with ``--obs-benchmark``. Results are collected
+per benchmark and written as JSON to ``--obs-benchmark-json`` (default
+``benchmark-results.json``) when the session ends.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable, Generator, Mapping
+from datetime import timedelta
+import functools
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Any
+
+import pytest
+
+from homeassistant.const import EVENT_STATE_CHANGED, EVENT_STATE_REPORTED
+from homeassistant.core import Event, HomeAssistant, callback
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.obs_websocket.const import DOMAIN
+
+from .conftest import MOCK_PASSWORD
+from .fake_obs import FakeOBSServer
+
+pytestmark = pytest.mark.obs_benchmark
+
+STATUS_ENTITY_ID = "sensor.obs_studio_127_0_0_1_none"
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request: pytest.FixtureRequest) -> Generator[dict[str, Any]]:
+    """Collect benchmark results and write them as JSON at session end."""
+    results: dict[str, Any] = {}
+    yield results
+    path = request.config.getoption("obs_benchmark_json")
+    with open(path, "w", encoding="utf-8") as file:
+        json.dump(
+            {
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "results": results,
+            },
+            file,
+            indent=2,
+        )
+        file.write("\n")
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    """Summarize latency samples in milliseconds."""
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)], 3),
+        "max_ms": round(ordered[-1], 3),
+    }
+
+
+async def _add_entries(
+    hass: HomeAssistant, server: FakeOBSServer, count: int
+) -> list[MockConfigEntry]:
+    """Set up ``count`` entries connected to the fake server."""
+    entries = []
+    for index in range(count):
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=f"{server.host} #{index}",
+            data={"host": server.host, "port": server.port, "password": MOCK_PASSWORD},
+            unique_id=f"{server.host}:{server.port}:{index}",
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        entries.append(entry)
+    await hass.async_block_till_done()
+    return entries
+
+
+async def _unload(hass: HomeAssistant, entries: list[MockConfigEntry]) -> None:
+    """Unload entries so that their event threads stop."""
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+class _ExecutorMeter:
+    """Measure time spent running executor jobs."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        self.busy = 0.0
+        self.jobs = 0
+        self._hass = hass
+        self._orig = hass.async_add_executor_job
+
+    def __enter__(self) -> _ExecutorMeter:
+        def _timed(target: Callable[..., Any], *args: Any) -> Any:
+            start = time.perf_counter()
+            try:
+                return target(*args)
+            finally:
+                self.busy += time.perf_counter() - start
+                self.jobs += 1
+
+        def _add_job(target: Callable[..., Any], *args: Any) -> Any:
+            return self._orig(functools.partial(_timed, target), *args)
+
+        self._hass.async_add_executor_job = _add_job  # type: ignore[method-assign]
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self._hass.async_add_executor_job = self._orig  # type: ignore[method-assign]
+
+
+async def _loop_lag(stop: asyncio.Event, interval: float = 0.01) -> list[float]:
+    """Sample how late the event loop runs a callback, in milliseconds."""
+    lags = []
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + interval
+        await asyncio.sleep(interval)
+        lags.append(max(loop.time() - expected, 0) * 1000)
+    return lags
+
+
+async def test_event_to_state_latency(
+    hass: HomeAssistant, fake_obs: FakeOBSServer, benchmark_results: dict[str, Any]
+) -> None:
+    """Measure the time from an OBS event to the entity state change."""
+    entries = await _add_entries(hass, fake_obs, 1)
+    changed = asyncio.Event()
+
+    @callback
+    def _state_changed(event: Event) -> None:
+        if event.data["entity_id"] == STATUS_ENTITY_ID:
+            changed.set()
+
+    unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, _state_changed)
+    samples = []
+    for index in range(40):
+        changed.clear()
+        start = time.perf_counter()
+        await fake_obs.set_stream_active(index % 2 == 0)
+        async with asyncio.timeout(5):
+            await changed.wait()
+        samples.append((time.perf_counter() - start) * 1000)
+        # Reset the refresh debouncer's cooldown so every event refreshes
+        await hass.async_block_till_done()
+        entries[0].runtime_data.coordinator._debounced_refresh.async_cancel()
+    unsub()
+
+    benchmark_results["event_to_state_latency"] = _summary(samples)
+    await _unload(hass, entries)
+
+
+async def test_refresh_round_trip(
+    hass: HomeAssistant, fake_obs: FakeOBSServer, benchmark_results: dict[str, Any]
+) -> None:
+    """Measure coordinator refresh round trips."""
+    entries = await _add_entries(hass, fake_obs, 1)
+    coordinator = entries[0].runtime_data.coordinator
+
+    samples = []
+    for _ in range(100):
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        samples.append((time.perf_counter() - start) * 1000)
+    assert coordinator.last_update_success
+
+    benchmark_results["refresh_round_trip"] = _summary(samples)
+    await _unload(hass, entries)
+
+
+async def test_state_writes_fast_polling(
+    hass: HomeAssistant, fake_obs: FakeOBSServer, benchmark_results: dict[str, Any]
+) -> None:
+    """Count state writes while polling every 100 ms with changing stats."""
+    fake_obs.state.stream_active = True
+    entries = await _add_entries(hass, fake_obs, 1)
+    coordinator = entries[0].runtime_data.coordinator
+
+    def _stream_status(request_data: dict[str, Any]) -> dict[str, Any]:
+        fake_obs.state.stream_bytes += 1000
+        fake_obs.state.stream_total_frames += 6
+        return fake_obs._get_stream_status(request_data)
+
+    fake_obs.set_handler("GetStreamStatus", _stream_status)
+    writes = {"changed": 0, "reported": 0}
+
+    @callback
+    def _is_obs_sensor(event_data: Mapping[str, Any]) -> bool:
+        return event_data["entity_id"].startswith("sensor.obs_studio")
+
+    @callback
+    def _count(event: Event) -> None:
+        key = "changed" if event.event_type == EVENT_STATE_CHANGED else "reported"
+        writes[key] += 1
+
+    unsubs = [
+        hass.bus.async_listen(event_type, _count, event_filter=_is_obs_sensor)
+        for event_type in (EVENT_STATE_CHANGED, EVENT_STATE_REPORTED)
+    ]
+    window = 3.0
+    coordinator.update_interval = timedelta(seconds=0.1)
+    await coordinator.async_refresh()
+    await asyncio.sleep(window)
+    coordinator.update_interval = None
+    for unsub in unsubs:
+        unsub()
+
+    benchmark_results["state_writes_fast_polling"] = {
+        "poll_interval_s": 0.1,
+        "state_changed_per_minute": round(writes["changed"] * 60 / window),
+        "state_reported_per_minute": round(writes["reported"] * 60 / window),
+    }
+    await _unload(hass, entries)
+
+
+@pytest.mark.parametrize("hosts", [1, 10, 100])
+async def test_scaling(
+    hass: HomeAssistant,
+    fake_obs: FakeOBSServer,
+    benchmark_results: dict[str, Any],
+    hosts: int,
+) -> None:
+    """Measure memory, loop and executor load for many connections."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    setup_start = time.perf_counter()
+    entries = await _add_entries(hass, fake_obs, hosts)
+    setup_time = time.perf_counter() - setup_start
+    memory = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+
+    # Every host gets 20 events per second and a refresh per second
+    window = 3.0
+    stop = asyncio.Event()
+    lag_task = hass.async_create_task(_loop_lag(stop))
+    with _ExecutorMeter(hass) as executor:
+        cpu_start = time.thread_time()
+        wall_start = time.perf_counter()
+        emitter = fake_obs.emit_background(
+            fake_obs.emit_many(
+                "InputMuteStateChanged",
+                {"inputName": "Mic", "inputMuted": True},
+                count=int(20 * window),
+                rate=20,
+            )
+        )
+        for _ in range(int(window)):
+            await asyncio.gather(
+                *(entry.runtime_data.coordinator.async_refresh() for entry in entries)
+            )
+            await asyncio.sleep(1)
+        await emitter
+        wall = time.perf_counter() - wall_start
+        loop_cpu = time.thread_time() - cpu_start
+    stop.set()
+    lags = await lag_task
+
+    events = sum(
+        entry.runtime_data.connection.telemetry.events.get("InputMuteStateChanged", 0)
+        for entry in entries
+    )
+    benchmark_results[f"scaling_{hosts}_hosts"] = {
+        "hosts": hosts,
+        "setup_s": round(setup_time, 3),
+        "memory_per_host_kib": round(memory / hosts / 1024, 1),
+        "events_received_per_s": round(events / wall),
+        "loop_cpu_utilization": round(loop_cpu / wall, 3),
+        "loop_lag": _summary(lags),
+        "executor_jobs": executor.jobs,
+        "executor_busy_s_per_s": round(executor.busy / wall, 3),
+    }
+    await _unload(hass, entries)
@@ -0,0 +1,85 @@
+"""Tests for OBS WebSocket binary sensor platform."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.obs_websocket.const import DOMAIN
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient for an idle stream."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.disconnect.return_value = None
+    return client
+
+
+async def _setup_integration(
+    hass: HomeAssistant, req_client: MagicMock
+) -> MockConfigEntry:
+    """Set up the integration with a mock client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(req_client)}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return entry
+
+
+async def test_stream_degraded(hass: HomeAssistant) -> None:
+    """Test the sensor turns on while congestion is high and off after."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    coordinator = entry.runtime_data.coordinator
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "binary_sensor", DOMAIN, f"{entry.entry_id}_stream_degraded"
+    )
+    assert entity_id is not None
+    state = hass.states.get(entity_id)
+    assert state.state == STATE_OFF
+    assert state.attributes["device_class"] == "problem"
+    assert state.attributes["score"] == 0
+
+    for _ in range(3):
+        req_client.get_stream_status.return_value = make_stream_status(
+            active=True, output_congestion=0.9
+        )
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    state = hass.states.get(entity_id)
+    assert state.state == STATE_ON
+    assert state.attributes["score"] >= 1
+    assert state.attributes["congestion"] > 0.3
+
+    req_client.get_stream_status.return_value = make_stream_status()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id).state == STATE_OFF
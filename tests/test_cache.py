@@ -0,0 +1,92 @@
+"""Tests for the OBS WebSocket response cache."""
+
+from __future__ import annotations
+
+from custom_components.obs_websocket.cache import OBSResponseCache
+
+
+def test_cacheable() -> None:
+    """Test only event-invalidated requests are cacheable."""
+    cache = OBSResponseCache(8)
+    assert cache.cacheable("GetSceneList")
+    assert cache.cacheable("GetInputList")
+    assert not cache.cacheable("GetStreamStatus")
+    assert not cache.cacheable("SetCurrentProgramScene")
+
+
+def test_transforms_only_cached_while_followed() -> None:
+    """Test scene item lists are only cached while transform events arrive."""
+    cache = OBSResponseCache(8)
+    assert not cache.cacheable("GetSceneItemList")
+    assert not cache.cacheable("GetSceneItemTransform")
+    assert cache.cacheable("GetSceneItemEnabled")
+
+    cache.follow_transforms(True)
+    assert cache.cacheable("GetSceneItemList")
+    cache.set("GetSceneItemList", {"sceneName": "A"}, {"n": 1}, cache.generation)
+    cache.invalidate_for_event("SceneItemTransformChanged")
+    assert cache.get("GetSceneItemList", {"sceneName": "A"}) is None
+
+    # Unsubscribing drops the lists, as their transforms go stale
+    cache.set("GetSceneItemList", {"sceneName": "A"}, {"n": 1}, cache.generation)
+    cache.follow_transforms(False)
+    assert len(cache) == 0
+
+
+def test_keyed_by_parameters() -> None:
+    """Test responses are keyed by request type and parameters."""
+    cache = OBSResponseCache(8)
+    cache.set("GetSceneItemList", {"sceneName": "A"}, {"sceneItems": [1]}, cache.generation)
+    cache.set("GetSceneItemList", {"sceneName": "B"}, {"sceneItems": [2]}, cache.generation)
+
+    assert cache.get("GetSceneItemList", {"sceneName": "A"}) == {"sceneItems": [1]}
+    assert cache.get("GetSceneItemList", {"sceneName": "B"}) == {"sceneItems": [2]}
+    assert cache.get("GetSceneItemList", {"sceneName": "C"}) is None
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_returns_copies() -> None:
+    """Test callers cannot mutate cached responses."""
+    cache = OBSResponseCache(8)
+    cache.set("GetSceneList", None, {"scenes": []}, cache.generation)
+    cache.get("GetSceneList", None)["scenes"].append("mutated")
+
+    assert cache.get("GetSceneList", None) == {"scenes": []}
+
+
+def test_lru_eviction() -> None:
+    """Test the least recently used response is evicted first."""
+    cache = OBSResponseCache(2)
+    cache.set("GetSceneList", None, {"n": 1}, cache.generation)
+    cache.set("GetInputList", None, {"n": 2}, cache.generation)
+    cache.get("GetSceneList", None)
+    cache.set("GetProfileList", None, {"n": 3}, cache.generation)
+
+    assert len(cache) == 2
+    assert cache.get("GetInputList", None) is None
+    assert cache.get("GetSceneList", None) == {"n": 1}
+
+
+def test_event_invalidation() -> None:
+    """Test events drop only the request types they affect."""
+    cache = OBSResponseCache(8)
+    cache.set("GetSceneList", None, {"n": 1}, cache.generation)
+    cache.set("GetInputList", None, {"n": 2}, cache.generation)
+
+    cache.invalidate_for_event("CurrentProgramSceneChanged")
+
+    assert cache.get("GetSceneList", None) is None
+    assert cache.get("GetInputList", None) == {"n": 2}
+
+    cache.invalidate_for_event("CurrentSceneCollectionChanging")
+    assert len(cache) == 0
+
+
+def test_stale_response_not_stored() -> None:
+    """Test a response fetched across an invalidation is not stored."""
+    cache = OBSResponseCache(8)
+    generation = cache.generation
+    cache.invalidate_for_event("SceneCreated")
+    cache.set("GetSceneList", None, {"n": 1}, generation)
+
+    assert cache.get("GetSceneList", None) is None
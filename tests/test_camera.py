@@ -0,0 +1,190 @@
+"""Tests for OBS WebSocket program camera."""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.camera import async_get_image
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.obs_websocket.camera import _decode_image
+from custom_components.obs_websocket.const import DOMAIN
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status, make_service_settings
+
+CAMERA_ENTITY_ID = "camera.obs_studio_192_168_1_100_none"
+IMAGE = b"\xff\xd8fake-jpeg\xff\xd9"
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient that returns screenshots."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.get_stream_service_settings.return_value = make_service_settings()
+    client.disconnect.return_value = None
+
+    def _send(request_type: str, data: dict | None = None, raw: bool = False) -> Any:
+        if request_type == "GetCurrentProgramScene":
+            return {"currentProgramSceneName": "Live"}
+        if request_type == "GetSourceScreenshot":
+            if data["sourceName"] == "Missing":
+                raise RuntimeError("No source with this name")
+            return {
+                "imageData": "data:image/jpeg;base64,"
+                + base64.b64encode(IMAGE).decode()
+            }
+        return None
+
+    client.send.side_effect = _send
+    return client
+
+
+async def _setup_integration(
+    hass: HomeAssistant, req_client: MagicMock, options: dict | None = None
+) -> MockConfigEntry:
+    """Set up the integration with a mock client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        options=options or {},
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(req_client)}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return entry
+
+
+def _screenshot_calls(req_client: MagicMock) -> list[dict]:
+    return [c.args[1] for c in req_client.send.call_args_list if c.args[0] == "GetSourceScreenshot"]
+
+
+def test_decode_image() -> None:
+    """Test data URIs are decoded to raw bytes."""
+    data_uri = "data:image/png;base64," + base64.b64encode(b"png-bytes").decode()
+    assert _decode_image(data_uri) == b"png-bytes"
+
+
+async def test_camera_image(hass: HomeAssistant) -> None:
+    """Test the camera returns the program scene screenshot."""
+    req_client = _make_req_client()
+    await _setup_integration(hass, req_client)
+
+    state = hass.states.get(CAMERA_ENTITY_ID)
+    assert state is not None
+    assert state.attributes["scene_name"] == "Live"
+
+    image = await async_get_image(hass, CAMERA_ENTITY_ID)
+    assert image.content == IMAGE
+    assert image.content_type == "image/jpeg"
+    assert _screenshot_calls(req_client) == [
+        {
+            "sourceName": "Live",
+            "imageFormat": "jpg",
+            "imageCompressionQuality": 80,
+            "imageWidth": 1280,
+        }
+    ]
+
+
+async def test_concurrent_viewers_share_one_fetch(hass: HomeAssistant) -> None:
+    """Test concurrent and repeated viewers cost one screenshot per interval."""
+    req_client = _make_req_client()
+    await _setup_integration(hass, req_client)
+
+    images = await asyncio.gather(
+        *(async_get_image(hass, CAMERA_ENTITY_ID) for _ in range(5))
+    )
+    assert all(image.content == IMAGE for image in images)
+    await async_get_image(hass, CAMERA_ENTITY_ID)
+
+    assert len(_screenshot_calls(req_client)) == 1
+
+
+async def test_rate_limit_returns_cached_image(hass: HomeAssistant) -> None:
+    """Test the per-host rate limit is applied even when the TTL expired."""
+    req_client = _make_req_client()
+    await _setup_integration(
+        hass, req_client, {"screenshot_ttl": 0, "screenshot_max_rate": 1}
+    )
+
+    await async_get_image(hass, CAMERA_ENTITY_ID)
+    await async_get_image(hass, CAMERA_ENTITY_ID)
+    assert len(_screenshot_calls(req_client)) == 1
+
+
+async def test_rate_limit_applies_to_failures(hass: HomeAssistant) -> None:
+    """Test failing screenshots are not retried by every viewer."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client, {"screenshot_max_rate": 1})
+    screenshots = entry.runtime_data.screenshots
+
+    assert await screenshots.async_get("Missing") is None
+    assert await screenshots.async_get("Missing") is None
+    assert len(_screenshot_calls(req_client)) == 1
+
+
+async def test_program_scene_event_changes_source(hass: HomeAssistant) -> None:
+    """Test CurrentProgramSceneChanged switches the screenshot source."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(
+        hass, req_client, {"screenshot_ttl": 0, "screenshot_max_rate": 0}
+    )
+
+    await hass.async_add_executor_job(
+        entry.runtime_data.connection._on_obs_event,
+        "CurrentProgramSceneChanged",
+        {"sceneName": "Break"},
+    )
+    await hass.async_block_till_done()
+
+    assert hass.states.get(CAMERA_ENTITY_ID).attributes["scene_name"] == "Break"
+    await async_get_image(hass, CAMERA_ENTITY_ID)
+    assert _screenshot_calls(req_client)[-1]["sourceName"] == "Break"
+
+
+async def test_options_apply_without_reload(hass: HomeAssistant) -> None:
+    """Test changed screenshot options apply to the next screenshot."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client, {"screenshot_ttl": 0})
+    await async_get_image(hass, CAMERA_ENTITY_ID)
+
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            "screenshot_ttl": 0,
+            "screenshot_max_rate": 0,
+            "screenshot_format": "png",
+            "screenshot_width": 640,
+        },
+    )
+    await hass.async_block_till_done()
+    image = await async_get_image(hass, CAMERA_ENTITY_ID)
+
+    # The entry's own update listener applies them
+    assert len(entry.update_listeners) == 1
+    assert image.content_type == "image/png"
+    assert _screenshot_calls(req_client)[-1] == {
+        "sourceName": "Live",
+        "imageFormat": "png",
+        "imageCompressionQuality": 80,
+        "imageWidth": 640,
+    }
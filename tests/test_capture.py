@@ -0,0 +1,237 @@
+"""Tests for OBS WebSocket traffic capture and replay."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_capture_events
+
+from custom_components.obs_websocket.capture import OBSCapture, read_capture
+from custom_components.obs_websocket.const import DOMAIN, EVENT_OBS
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PASSWORD, MOCK_PORT, make_service_settings, make_stream_status
+from .fake_obs import FakeOBSServer
+
+STATUS_ENTITY_ID = "sensor.obs_studio_192_168_1_100_none"
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.get_stream_service_settings.return_value = make_service_settings()
+    client.disconnect.return_value = None
+    return client
+
+
+async def _setup_integration(
+    hass: HomeAssistant, req_client: MagicMock
+) -> MockConfigEntry:
+    """Set up the integration with a mock client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(req_client)}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return entry
+
+
+def test_capture_rotates(tmp_path: Path) -> None:
+    """Test capture files rotate by size and are read back in order."""
+    path = tmp_path / "capture.jsonl"
+    capture = OBSCapture(path, max_bytes=200, backups=2)
+    capture.open("obs.local")
+    for index in range(20):
+        capture.write("event", "InputMuteStateChanged", {"index": index})
+    capture.close()
+
+    assert sorted(file.name for file in tmp_path.iterdir()) == [
+        "capture.jsonl",
+        "capture.jsonl.1",
+        "capture.jsonl.2",
+    ]
+    indexes = [
+        record["data"]["index"]
+        for record in read_capture(path)
+        if record["kind"] == "event"
+    ]
+    # The oldest records were rotated away, the rest stay in order
+    assert indexes == list(range(indexes[0], 20))
+    assert capture.records == 21
+
+
+async def test_capture_fake_obs_session(
+    hass: HomeAssistant, fake_obs: FakeOBSServer, tmp_path: Path
+) -> None:
+    """Test events, responses and refreshes of a live session are captured."""
+    hass.config.config_dir = str(tmp_path)
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=fake_obs.host,
+        data={"host": fake_obs.host, "port": fake_obs.port, "password": MOCK_PASSWORD},
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "start_capture",
+        {"config_entry_id": entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    path = Path(response["path"])
+    assert path.parent == tmp_path / "obs_websocket_captures"
+
+    await entry.runtime_data.connection.async_request("GetSceneList")
+    await fake_obs.set_stream_active(True)
+    async with asyncio.timeout(5):
+        while hass.states.get("sensor.obs_studio_127_0_0_1_none").state != "streaming":
+            await asyncio.sleep(0.01)
+            await hass.async_block_till_done()
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "stop_capture",
+        {"config_entry_id": entry.entry_id},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["bytes"] > 0
+
+    records = await hass.async_add_executor_job(read_capture, path)
+    assert records[0]["kind"] == "start"
+    kinds = {(record["kind"], record["type"]) for record in records}
+    assert ("response", "GetSceneList") in kinds
+    assert ("event", "StreamStateChanged") in kinds
+    refreshes = [record for record in records if record["kind"] == "refresh"]
+    assert refreshes[-1]["data"]["stream_status"]["output_active"] is True
+    assert response["records"] == len(records)
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_replay_capture(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a capture is replayed into the entry without leaving it."""
+    hass.config.config_dir = str(tmp_path)
+    entry = await _setup_integration(hass, _make_req_client())
+    coordinator = entry.runtime_data.coordinator
+    health = coordinator.health
+    live_health = health.as_dict()
+    live_data = coordinator.data
+    events = async_capture_events(hass, EVENT_OBS)
+    states = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    capture_dir = tmp_path / "obs_websocket_captures"
+    capture_dir.mkdir()
+    status = vars(make_stream_status(active=True))
+    service = vars(make_service_settings())
+    records = [
+        {
+            "t": 0,
+            "kind": "start",
+            "type": None,
+            "data": {"time": "2025-01-01T00:00:00+00:00", "host": MOCK_HOST},
+        },
+        {
+            "t": 0.01,
+            "kind": "event",
+            "type": "StreamStateChanged",
+            "data": {"outputActive": True, "outputState": "OBS_WEBSOCKET_OUTPUT_STARTED"},
+        },
+        {"t": 0.02, "kind": "response", "type": "GetSceneList", "data": {}},
+        {
+            "t": 0.03,
+            "kind": "refresh",
+            "type": None,
+            "data": {"stream_status": status, "service_settings": service},
+        },
+    ]
+    (capture_dir / "session.jsonl").write_text(
+        "".join(json.dumps(record) + "\n" for record in records)
+    )
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "replay_capture",
+        {"config_entry_id": entry.entry_id, "file": "session.jsonl", "speed": 0},
+        blocking=True,
+        return_response=True,
+    )
+    await hass.async_block_till_done()
+
+    assert response["events"] == 1
+    assert response["refreshes"] == 1
+    # The entities followed the replay, and went back to the live data
+    assert [
+        state.data["new_state"].state
+        for state in states
+        if state.data["entity_id"] == STATUS_ENTITY_ID
+    ] == ["streaming", "idle"]
+    assert coordinator.data is live_data
+    assert coordinator.health is health
+    assert health.as_dict() == live_health
+    # Replayed events are not forwarded to the event bus
+    assert events == []
+
+
+async def test_replay_capture_path_checks(
+    hass: HomeAssistant, tmp_path: Path
+) -> None:
+    """Test replay refuses missing files and paths outside the capture folder."""
+    hass.config.config_dir = str(tmp_path)
+    entry = await _setup_integration(hass, _make_req_client())
+
+    with pytest.raises(ServiceValidationError, match="capture_not_found"):
+        await hass.services.async_call(
+            DOMAIN,
+            "replay_capture",
+            {"config_entry_id": entry.entry_id, "file": "missing.jsonl"},
+            blocking=True,
+        )
+    with pytest.raises(ServiceValidationError, match="path_not_allowed"):
+        await hass.services.async_call(
+            DOMAIN,
+            "replay_capture",
+            {"config_entry_id": entry.entry_id, "file": "../secrets.yaml"},
+            blocking=True,
+        )
+
+
+async def test_stop_capture_not_running(hass: HomeAssistant) -> None:
+    """Test stopping without a running capture fails."""
+    entry = await _setup_integration(hass, _make_req_client())
+
+    with pytest.raises(ServiceValidationError, match="capture_not_running"):
+        await hass.services.async_call(
+            DOMAIN,
+            "stop_capture",
+            {"config_entry_id": entry.entry_id},
+            blocking=True,
+        )
@@ -0,0 +1,78 @@
+"""Tests for the OBS WebSocket stream clock."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+import time
+
+from homeassistant.util import dt as dt_util
+
+from custom_components.obs_websocket.clock import OBSStreamClock
+from custom_components.obs_websocket.const import (
+    OUTPUT_RECONNECTED,
+    OUTPUT_RECONNECTING,
+    OUTPUT_STARTED,
+    OUTPUT_STOPPED,
+)
+
+from .conftest import make_stream_status
+
+
+def test_interpolates_between_polls() -> None:
+    """Test the duration advances from the last poll."""
+    clock = OBSStreamClock()
+    assert clock.duration_ms() is None
+    assert clock.timecode() is None
+
+    at = time.monotonic()
+    clock.sync(make_stream_status(active=True, output_duration=3_599_500), at)
+    assert clock.duration_ms(at) == 3_599_500
+    assert clock.duration_ms(at + 1.25) == 3_600_750
+    assert clock.timecode(at + 1.25) == "01:00:00.750"
+
+    started = clock.started
+    assert abs(dt_util.utcnow() - timedelta(seconds=3599.5) - started) < timedelta(
+        seconds=1
+    )
+    # A poll agreeing with the clock keeps the timestamp
+    clock.sync(make_stream_status(active=True, output_duration=3_600_000), at + 0.6)
+    assert clock.started == started
+
+    clock.sync(make_stream_status(), at + 2)
+    assert clock.duration_ms() is None
+    assert clock.started is None
+
+
+def test_stands_still_while_reconnecting() -> None:
+    """Test reconnects freeze the duration until the stream is back."""
+    clock = OBSStreamClock()
+    at = time.monotonic()
+    clock.sync(
+        make_stream_status(active=True, reconnecting=True, output_duration=5000), at
+    )
+    assert clock.duration_ms(at + 10) == 5000
+
+    clock.sync(make_stream_status(active=True, output_duration=5000), at)
+    assert clock.duration_ms(at + 10) == 15000
+
+
+def test_events_move_the_anchor() -> None:
+    """Test stream state events re-sync the clock without a poll."""
+    clock = OBSStreamClock()
+    clock.async_handle_state_changed({"outputState": OUTPUT_RECONNECTING})
+    assert clock.duration_ms() is None
+
+    clock.async_handle_state_changed({"outputState": OUTPUT_STARTED})
+    assert 0 <= clock.duration_ms() < 1000
+    assert clock.started is not None
+
+    clock.async_handle_state_changed({"outputState": OUTPUT_RECONNECTING})
+    frozen = clock.duration_ms()
+    assert clock.duration_ms(time.monotonic() + 60) == frozen
+
+    clock.async_handle_state_changed({"outputState": OUTPUT_RECONNECTED})
+    assert clock.duration_ms(time.monotonic() + 60) >= frozen + 60000
+
+    clock.async_handle_state_changed({"outputState": OUTPUT_STOPPED})
+    assert clock.duration_ms() is None
+    assert clock.started is None
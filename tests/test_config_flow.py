@@ -2,34 +2,60 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from homeassistant import config_entries
+from homeassistant.config_entries import ConfigEntryState, ConfigFlowResult
 from homeassistant.core import HomeAssistant
-from homeassistant.data_entry_flow import FlowResultType
-from pytest_homeassistant_custom_component.common import MockConfigEntry
-
-from custom_components.obs_websocket.const import DOMAIN
+from homeassistant.data_entry_flow import FlowResultType, InvalidData
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_fire_time_changed,
+)
+
+from custom_components.obs_websocket.const import DOMAIN, SESSION_HANDOFF_TIMEOUT
+from custom_components.obs_websocket.discovery import OBSServer
+from custom_components.obs_websocket.session import (
+    async_discard_session,
+    async_take_session,
+)
 
 from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD
+from .fake_obs import FakeOBSServer
+
+
+async def _async_start_manual(hass: HomeAssistant) -> ConfigFlowResult:
+    """Start a user flow and pick manual entry from the menu."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "manual"}
+    )
 
 
 async def test_user_flow_shows_form(hass: HomeAssistant) -> None:
-    """Test that the user flow shows a form initially."""
+    """Test that the user flow offers a menu, then the manual form."""
     result = await hass.config_entries.flow.async_init(
         DOMAIN, context={"source": config_entries.SOURCE_USER}
     )
+    assert result["type"] is FlowResultType.MENU
+    assert result["menu_options"] == ["manual", "discover"]
+
+    result = await _async_start_manual(hass)
     assert result["type"] is FlowResultType.FORM
-    assert result["step_id"] == "user"
+    assert result["step_id"] == "manual"
     assert result["errors"] == {}
 
 
 async def test_user_flow_success(hass: HomeAssistant) -> None:
     """Test successful user config flow creates entry."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    result = await _async_start_manual(hass)
 
     with patch(
         "custom_components.obs_websocket.config_flow._test_connection",
@@ -47,9 +73,7 @@ async def test_user_flow_success(hass: HomeAssistant) -> None:
 
 async def test_user_flow_cannot_connect(hass: HomeAssistant) -> None:
     """Test user config flow with connection failure shows error."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    result = await _async_start_manual(hass)
 
     with patch(
         "custom_components.obs_websocket.config_flow._test_connection",
@@ -68,9 +92,7 @@ async def test_user_flow_already_configured(
     hass: HomeAssistant, mock_config_entry: MockConfigEntry
 ) -> None:
     """Test user flow aborts when already configured."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    result = await _async_start_manual(hass)
 
     with patch(
         "custom_components.obs_websocket.config_flow._test_connection",
@@ -172,9 +194,7 @@ async def test_reconfigure_flow_cannot_connect(
 
 async def test_user_flow_no_password(hass: HomeAssistant) -> None:
     """Test user flow without password."""
-    result = await hass.config_entries.flow.async_init(
-        DOMAIN, context={"source": config_entries.SOURCE_USER}
-    )
+    result = await _async_start_manual(hass)
 
     config_no_pass = {"host": MOCK_HOST, "port": MOCK_PORT, "password": ""}
 
@@ -201,13 +221,20 @@ async def test_test_connection_with_password(hass: HomeAssistant) -> None:
     with patch.dict("sys.modules", {"obsws_python": mock_obs}):
         from custom_components.obs_websocket.config_flow import _test_connection
 
-        await _test_connection(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD)
+        version = await _test_connection(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD)
 
     mock_obs.ReqClient.assert_called_once_with(
         host=MOCK_HOST, port=MOCK_PORT, timeout=5, password=MOCK_PASSWORD
     )
     mock_client.get_version.assert_called_once()
-    mock_client.disconnect.assert_called_once()
+    assert version == {"obs_version": "30.0.0"}
+    # The session is kept open for the entry setup to adopt
+    mock_client.disconnect.assert_not_called()
+
+    session = async_take_session(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD)
+    assert session.req_client is mock_client
+    assert session.version == version
+    assert async_take_session(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD) is None
 
 
 async def test_test_connection_without_password(hass: HomeAssistant) -> None:
@@ -225,6 +252,8 @@ async def test_test_connection_without_password(hass: HomeAssistant) -> None:
     mock_obs.ReqClient.assert_called_once_with(
         host=MOCK_HOST, port=MOCK_PORT, timeout=5
     )
+    await async_discard_session(hass, MOCK_HOST, MOCK_PORT, "")
+    mock_client.disconnect.assert_called_once()
 
 
 async def test_test_connection_failure(hass: HomeAssistant) -> None:
@@ -240,3 +269,234 @@ async def test_test_connection_failure(hass: HomeAssistant) -> None:
             assert False, "Should have raised"
         except ConnectionRefusedError:
             pass
+
+
+async def test_test_connection_get_version_failure(hass: HomeAssistant) -> None:
+    """Test a session failing GetVersion is closed and not kept."""
+    mock_client = MagicMock()
+    mock_client.get_version.side_effect = TimeoutError
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = mock_client
+
+    with patch.dict("sys.modules", {"obsws_python": mock_obs}):
+        from custom_components.obs_websocket.config_flow import _test_connection
+
+        try:
+            await _test_connection(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD)
+            assert False, "Should have raised"
+        except TimeoutError:
+            pass
+
+    mock_client.disconnect.assert_called_once()
+    assert async_take_session(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD) is None
+
+
+async def test_unclaimed_session_expires(hass: HomeAssistant) -> None:
+    """Test a validated session nothing adopts is closed after the timeout."""
+    mock_client = MagicMock()
+    mock_client.get_version.return_value = SimpleNamespace(obs_version="30.0.0")
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = mock_client
+
+    with patch.dict("sys.modules", {"obsws_python": mock_obs}):
+        from custom_components.obs_websocket.config_flow import _test_connection
+
+        await _test_connection(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=SESSION_HANDOFF_TIMEOUT + 1)
+    )
+    await hass.async_block_till_done()
+
+    mock_client.disconnect.assert_called_once()
+    assert async_take_session(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD) is None
+
+
+async def _async_start_discover(hass: HomeAssistant) -> ConfigFlowResult:
+    """Start a user flow and pick network discovery from the menu."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    return await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "discover"}
+    )
+
+
+async def test_discover_flow_adds_selected_servers(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test discovered servers are added through discovery flows."""
+    result = await _async_start_discover(hass)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "discover"
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {"network": f"{fake_obs.host}/32", "ports": f"{fake_obs.port}"},
+    )
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "discover_select"
+    key = f"{fake_obs.host}:{fake_obs.port}"
+    assert result["description_placeholders"] == {"count": "1"}
+
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"servers": [key], "password": MOCK_PASSWORD}
+    )
+    assert result["type"] is FlowResultType.ABORT
+    assert result["reason"] == "discovery_started"
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    entry = hass.config_entries.async_entry_for_domain_unique_id(DOMAIN, key)
+    assert entry.data == {
+        "host": fake_obs.host,
+        "port": fake_obs.port,
+        "password": MOCK_PASSWORD,
+        "capabilities": entry.data["capabilities"],
+    }
+    assert entry.state is ConfigEntryState.LOADED
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_discover_flow_wrong_password(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test a server rejecting the password waits in a discovery flow."""
+    result = await _async_start_discover(hass)
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        {"network": fake_obs.host, "ports": f"{fake_obs.port}"},
+    )
+    key = f"{fake_obs.host}:{fake_obs.port}"
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"servers": [key], "password": "wrong"}
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    flows = hass.config_entries.flow.async_progress_by_handler(DOMAIN)
+    assert len(flows) == 1
+    assert flows[0]["step_id"] == "discovery_confirm"
+    assert flows[0]["context"]["unique_id"] == key
+
+    result = await hass.config_entries.flow.async_configure(
+        flows[0]["flow_id"], {"password": MOCK_PASSWORD}
+    )
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    await hass.async_block_till_done()
+    await hass.config_entries.async_unload(result["result"].entry_id)
+
+
+async def test_discover_flow_errors(hass: HomeAssistant) -> None:
+    """Test invalid and oversized scans and empty results are reported."""
+    result = await _async_start_discover(hass)
+
+    for user_input, error in (
+        ({"network": "obs.local", "ports": "4455"}, "invalid_network"),
+        ({"network": "10.0.0.0/16", "ports": "4455"}, "too_many_hosts"),
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], user_input
+        )
+        assert result["type"] is FlowResultType.FORM
+        assert result["errors"] == {"base": error}
+
+    with patch(
+        "custom_components.obs_websocket.config_flow.async_discover",
+        return_value=[],
+    ) as mock_discover:
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"network": "10.0.0.0/30", "ports": "4455-4456"}
+        )
+
+    assert result["errors"] == {"base": "no_servers_found"}
+    assert len(mock_discover.call_args.args[1]) == 4
+
+
+async def test_discover_flow_skips_configured(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test servers that are already configured are not offered."""
+    result = await _async_start_discover(hass)
+
+    with patch(
+        "custom_components.obs_websocket.config_flow.async_discover",
+        return_value=[
+            OBSServer(MOCK_HOST, MOCK_PORT, "5.5.0", True),
+            OBSServer("192.168.1.101", MOCK_PORT, "5.5.0", False),
+        ],
+    ):
+        result = await hass.config_entries.flow.async_configure(
+            result["flow_id"], {"network": "192.168.1.0/24", "ports": "4455"}
+        )
+
+    assert result["step_id"] == "discover_select"
+    assert result["description_placeholders"] == {"count": "1"}
+
+
+async def test_options_flow(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test the options flow saves the tuning options and keeps the others."""
+    hass.config_entries.async_update_entry(
+        mock_config_entry, options={"screenshot_width": 640}
+    )
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+    assert result["type"] is FlowResultType.FORM
+    assert result["step_id"] == "init"
+
+    options = {
+        "idle_interval": 120,
+        "active_interval": 5,
+        "request_timeout": 3.0,
+        "event_subscriptions": ["general", "vendors"],
+        "state_throttle": 2.0,
+        "forward_events": ["StreamStateChanged"],
+        "event_coalesce_interval": 0.5,
+    }
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], options
+    )
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    assert mock_config_entry.options == {
+        "screenshot_width": 640,
+        **options,
+        "features": [
+            "camera",
+            "media_inputs",
+            "scene_items",
+            "studio_mode",
+            "hotkeys",
+            "live_stats",
+            "event_forwarding",
+        ],
+        "health_congestion": 0.3,
+        "health_skipped_ratio": 0.02,
+        "health_bitrate_drop": 0.5,
+        "health_hysteresis": 0.2,
+        "screenshot_height": 0,
+        "screenshot_format": "jpg",
+        "screenshot_quality": 80,
+        "screenshot_ttl": 2.0,
+        "screenshot_max_rate": 30,
+    }
+
+
+async def test_options_flow_rejects_out_of_range(
+    hass: HomeAssistant, mock_config_entry: MockConfigEntry
+) -> None:
+    """Test intervals outside their range are rejected."""
+    result = await hass.config_entries.options.async_init(mock_config_entry.entry_id)
+
+    with pytest.raises(InvalidData):
+        await hass.config_entries.options.async_configure(
+            result["flow_id"],
+            {
+                "idle_interval": 1,
+                "active_interval": 5,
+                "request_timeout": 10,
+                "event_subscriptions": ["general"],
+                "state_throttle": 0,
+                "forward_events": [],
+                "event_coalesce_interval": 1,
+            },
+        )
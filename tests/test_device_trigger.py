@@ -0,0 +1,168 @@
+"""Tests for OBS WebSocket device triggers."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from homeassistant.components import automation
+from homeassistant.components.device_automation import DeviceAutomationType
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr
+from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_get_device_automations,
+)
+
+from custom_components.obs_websocket.const import DOMAIN
+from custom_components.obs_websocket.device_trigger import (
+    TRIGGERS,
+    async_get_trigger_registry,
+)
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status, make_service_settings
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.get_stream_service_settings.return_value = make_service_settings()
+    client.disconnect.return_value = None
+    return client
+
+
+async def _setup_integration(hass: HomeAssistant) -> MockConfigEntry:
+    """Set up the integration with a mock client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(_make_req_client())}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return entry
+
+
+def _device_id(hass: HomeAssistant, entry: MockConfigEntry) -> str:
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device is not None
+    return device.id
+
+
+async def _setup_automation(hass: HomeAssistant, device_id: str, trigger_type: str) -> None:
+    assert await async_setup_component(
+        hass,
+        automation.DOMAIN,
+        {
+            automation.DOMAIN: {
+                "trigger": {
+                    "platform": "device",
+                    "domain": DOMAIN,
+                    "device_id": device_id,
+                    "type": trigger_type,
+                },
+                "action": {
+                    "event": "obs_test_triggered",
+                    "event_data": {"description": "{{ trigger.description }}"},
+                },
+            }
+        },
+    )
+
+
+async def _fire(hass: HomeAssistant, entry: MockConfigEntry, event_type: str, data: dict) -> None:
+    """Deliver an OBS event as the EventClient thread would."""
+    await hass.async_add_executor_job(
+        entry.runtime_data.connection._on_obs_event, event_type, data
+    )
+    await hass.async_block_till_done()
+
+
+async def test_get_triggers(hass: HomeAssistant) -> None:
+    """Test all trigger types are offered for the OBS device."""
+    entry = await _setup_integration(hass)
+    device_id = _device_id(hass, entry)
+
+    triggers = await async_get_device_automations(
+        hass, DeviceAutomationType.TRIGGER, device_id
+    )
+
+    # Entity triggers of the device, such as the stream degraded binary
+    # sensor's, come from their own platforms
+    assert sorted(t["type"] for t in triggers if t["domain"] == DOMAIN) == sorted(
+        TRIGGERS
+    )
+
+
+@pytest.mark.parametrize(
+    ("trigger_type", "event_type", "data"),
+    [
+        ("stream_started", "StreamStateChanged", {"outputActive": True, "outputState": "OBS_WEBSOCKET_OUTPUT_STARTED"}),
+        ("stream_stopped", "StreamStateChanged", {"outputActive": False, "outputState": "OBS_WEBSOCKET_OUTPUT_STOPPED"}),
+        ("stream_reconnecting", "StreamStateChanged", {"outputActive": True, "outputState": "OBS_WEBSOCKET_OUTPUT_RECONNECTING"}),
+        ("recording_started", "RecordStateChanged", {"outputActive": True, "outputState": "OBS_WEBSOCKET_OUTPUT_STARTED"}),
+        ("scene_switched", "CurrentProgramSceneChanged", {"sceneName": "Live"}),
+    ],
+)
+async def test_trigger_fires(
+    hass: HomeAssistant, trigger_type: str, event_type: str, data: dict
+) -> None:
+    """Test each trigger fires on its OBS event."""
+    entry = await _setup_integration(hass)
+    events = async_capture_events(hass, "obs_test_triggered")
+    await _setup_automation(hass, _device_id(hass, entry), trigger_type)
+
+    await _fire(hass, entry, event_type, data)
+
+    assert len(events) == 1
+    assert events[0].data["description"] == f"OBS {trigger_type.replace('_', ' ')}"
+
+
+async def test_trigger_ignores_other_output_states(hass: HomeAssistant) -> None:
+    """Test stream_started does not fire on intermediate output states."""
+    entry = await _setup_integration(hass)
+    events = async_capture_events(hass, "obs_test_triggered")
+    await _setup_automation(hass, _device_id(hass, entry), "stream_started")
+
+    await _fire(
+        hass,
+        entry,
+        "StreamStateChanged",
+        {"outputActive": False, "outputState": "OBS_WEBSOCKET_OUTPUT_STARTING"},
+    )
+
+    assert events == []
+
+
+async def test_trigger_index_by_entry_and_event(hass: HomeAssistant) -> None:
+    """Test triggers are indexed by entry and event type and detach cleanly."""
+    entry = await _setup_integration(hass)
+    await _setup_automation(hass, _device_id(hass, entry), "scene_switched")
+    registry = async_get_trigger_registry(hass)
+
+    assert list(registry._triggers) == [(entry.entry_id, "CurrentProgramSceneChanged")]
+
+    await hass.services.async_call(
+        automation.DOMAIN, "turn_off", {"entity_id": "all"}, blocking=True
+    )
+
+    assert registry._triggers == {}
@@ -73,6 +73,13 @@ async def test_diagnostics(hass: HomeAssistant) -> None:
     assert service_settings["key"] == "**REDACTED**"
     assert service_settings["server"] == "rtmp://live.twitch.tv/app"
 
+    # Telemetry from setup
+    telemetry = result["telemetry"]
+    assert telemetry["connects"] == 1
+    assert telemetry["reconnects"] == 0
+    assert telemetry["requests"]["GetStreamStatus"]["count"] >= 1
+    assert telemetry["refreshes"]["count"] >= 1
+
 
 async def test_diagnostics_no_data(hass: HomeAssistant) -> None:
     """Test diagnostics when coordinator has no data."""
@@ -0,0 +1,67 @@
+"""Tests for OBS WebSocket network discovery."""
+
+from __future__ import annotations
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.obs_websocket.discovery import (
+    OBSServer,
+    async_discover,
+    parse_targets,
+)
+
+from .fake_obs import FakeOBSServer
+
+
+def test_parse_targets() -> None:
+    """Test networks and port ranges expand to host and port pairs."""
+    assert parse_targets("10.0.0.5", "4455") == [("10.0.0.5", 4455)]
+    assert parse_targets("10.0.0.0/30", "4455-4456") == [
+        ("10.0.0.1", 4455),
+        ("10.0.0.1", 4456),
+        ("10.0.0.2", 4455),
+        ("10.0.0.2", 4456),
+    ]
+    assert len(parse_targets("192.168.1.17/24", "4455")) == 254
+
+    for network, ports in (
+        ("not a network", "4455"),
+        ("10.0.0.0/24", "port"),
+        ("10.0.0.0/24", "4460-4455"),
+        ("10.0.0.0/24", "0"),
+    ):
+        with pytest.raises(ValueError):
+            parse_targets(network, ports)
+    with pytest.raises(OverflowError):
+        parse_targets("10.0.0.0/16", "4455")
+
+
+async def test_discover_fake_obs(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test OBS is recognised by its Hello and closed ports are skipped."""
+    servers = await async_discover(
+        hass,
+        [(fake_obs.host, fake_obs.port), (fake_obs.host, fake_obs.port + 1)],
+    )
+
+    assert servers == [
+        OBSServer(fake_obs.host, fake_obs.port, fake_obs.websocket_version, True)
+    ]
+    # The probe closes after the Hello without identifying
+    assert fake_obs.connects == 1
+    assert fake_obs.requests == []
+
+
+async def test_discover_without_auth(hass: HomeAssistant, socket_enabled: None) -> None:
+    """Test servers without a password are reported as such."""
+    server = FakeOBSServer()
+    await server.start()
+    try:
+        servers = await async_discover(hass, [(server.host, server.port)])
+    finally:
+        await server.stop()
+
+    assert [found.auth_required for found in servers] == [False]
@@ -0,0 +1,596 @@
+"""Tests running the integration against the local fake OBS server."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import timedelta
+
+import pytest
+
+from homeassistant import config_entries
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import HomeAssistant
+from homeassistant.data_entry_flow import FlowResultType
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.obs_websocket.const import DOMAIN
+
+from .conftest import MOCK_PASSWORD
+from .fake_obs import FakeOBSServer
+
+STATUS_ENTITY_ID = "sensor.obs_studio_127_0_0_1_none"
+
+
+async def _setup_integration(
+    hass: HomeAssistant, server: FakeOBSServer, password: str = MOCK_PASSWORD
+) -> MockConfigEntry:
+    """Set up the integration against the fake server."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=server.host,
+        data={"host": server.host, "port": server.port, "password": password},
+        unique_id=f"{server.host}:{server.port}",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def _wait_for(hass: HomeAssistant, condition: Callable[[], bool]) -> None:
+    """Wait until events from the client threads have been processed."""
+    async with asyncio.timeout(5):
+        while not condition():
+            await asyncio.sleep(0.01)
+            await hass.async_block_till_done()
+
+
+async def test_setup_and_push_update(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test the sensor follows stream state pushed by OBS."""
+    entry = await _setup_integration(hass, fake_obs)
+    assert entry.state is ConfigEntryState.LOADED
+    assert hass.states.get(STATUS_ENTITY_ID).state == "idle"
+    # One session for requests and one for events
+    assert fake_obs.connects == 2
+
+    await fake_obs.set_stream_active(True)
+    await _wait_for(
+        hass, lambda: hass.states.get(STATUS_ENTITY_ID).state == "streaming"
+    )
+
+    assert entry.runtime_data.connection.telemetry.events["StreamStateChanged"] == 1
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_config_flow_session_handed_to_setup(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test the flow's validated session becomes the request connection."""
+    result = await hass.config_entries.flow.async_init(
+        DOMAIN, context={"source": config_entries.SOURCE_USER}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"], {"next_step_id": "manual"}
+    )
+    result = await hass.config_entries.flow.async_configure(
+        result["flow_id"],
+        user_input={
+            "host": fake_obs.host,
+            "port": fake_obs.port,
+            "password": MOCK_PASSWORD,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert result["type"] is FlowResultType.CREATE_ENTRY
+    entry = result["result"]
+    assert entry.state is ConfigEntryState.LOADED
+    # The flow's session is adopted, only the event session is new
+    assert fake_obs.connects == 2
+    capabilities = entry.data["capabilities"]
+    assert capabilities["obs_web_socket_version"] == fake_obs.websocket_version
+    assert "GetStreamStatus" in capabilities["available_requests"]
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_capabilities_cached_across_reconnects(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test GetVersion is only sent again when the Hello reports a new version."""
+    entry = await _setup_integration(hass, fake_obs)
+    connection = entry.runtime_data.connection
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device.sw_version == "30.2.0"
+    assert fake_obs.requests.count("GetVersion") == 1
+
+    await connection.async_disconnect()
+    await connection.async_connect()
+    assert fake_obs.requests.count("GetVersion") == 1
+
+    fake_obs.obs_version = "31.0.0"
+    fake_obs.websocket_version = "5.6.0"
+    await connection.async_disconnect()
+    await connection.async_connect()
+    assert fake_obs.requests.count("GetVersion") == 2
+    assert entry.data["capabilities"]["obs_web_socket_version"] == "5.6.0"
+    device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, entry.entry_id)})
+    assert device.sw_version == "31.0.0"
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_wrong_password(hass: HomeAssistant, fake_obs: FakeOBSServer) -> None:
+    """Test a rejected Identify leaves the entry retrying."""
+    entry = await _setup_integration(hass, fake_obs, password="wrong")
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+
+
+async def test_password_changed_after_setup(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test reconnecting fails once the OBS password changes."""
+    entry = await _setup_integration(hass, fake_obs)
+    coordinator = entry.runtime_data.coordinator
+
+    fake_obs.password = "changed"
+    await fake_obs.drop_connections()
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert "refresh" in entry.runtime_data.connection.telemetry.last_errors
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_reconnect_after_drop(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test the coordinator reconnects after OBS drops the connection."""
+    entry = await _setup_integration(hass, fake_obs)
+    coordinator = entry.runtime_data.coordinator
+    telemetry = entry.runtime_data.connection.telemetry
+
+    await fake_obs.drop_connections()
+    await coordinator.async_refresh()
+    assert not coordinator.last_update_success
+    assert hass.states.get(STATUS_ENTITY_ID).state == "unavailable"
+
+    await coordinator.async_refresh()
+    assert coordinator.last_update_success
+    assert hass.states.get(STATUS_ENTITY_ID).state == "idle"
+    assert telemetry.reconnects == 1
+    assert fake_obs.connects == 4
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_request_latency_and_failures(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test scripted latency and request failures reach the caller."""
+    entry = await _setup_integration(hass, fake_obs)
+    connection = entry.runtime_data.connection
+
+    fake_obs.latency = 0.05
+    response = await connection.async_request("GetVersion")
+    assert response["obsVersion"] == "30.2.0"
+    assert connection.telemetry.last_rtt_ms >= 50
+
+    fake_obs.latency = 0
+    response = await hass.services.async_call(
+        DOMAIN,
+        "request",
+        {"config_entry_id": entry.entry_id, "request_type": "GetSceneList"},
+        blocking=True,
+        return_response=True,
+    )
+    assert response["scenes"] == [{"sceneIndex": 0, "sceneName": "Scene"}]
+
+    fake_obs.fail_request("GetStats", 500, "Boom")
+    batches = fake_obs.batches
+    results = await connection.async_request_batch(
+        [
+            {"requestType": "GetVersion"},
+            {"requestType": "Sleep", "requestData": {"sleepMillis": 10}},
+            {"requestType": "GetStats"},
+            {"requestType": "GetVersion"},
+        ],
+        0,
+        halt_on_failure=True,
+    )
+    assert [result["requestStatus"]["code"] for result in results] == [100, 100, 500]
+    assert results[2]["requestStatus"]["comment"] == "Boom"
+    assert fake_obs.batches == batches + 1
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_set_scene_item_emits_event(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test toggling a scene item is confirmed by the OBS event."""
+    entry = await _setup_integration(hass, fake_obs)
+    connection = entry.runtime_data.connection
+
+    await connection.async_request(
+        "SetSceneItemEnabled",
+        {"sceneName": "Scene", "sceneItemId": 2, "sceneItemEnabled": True},
+    )
+    assert fake_obs.state.scenes["Scene"][1]["sceneItemEnabled"] is True
+    await _wait_for(
+        hass,
+        lambda: connection.telemetry.events.get("SceneItemEnableStateChanged") == 1,
+    )
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_event_burst(hass: HomeAssistant, fake_obs: FakeOBSServer) -> None:
+    """Test a burst of events at a fixed rate is delivered in full."""
+    entry = await _setup_integration(hass, fake_obs)
+    telemetry = entry.runtime_data.connection.telemetry
+
+    await fake_obs.emit_many(
+        "InputMuteStateChanged",
+        lambda index: {"inputName": "Mic", "inputMuted": bool(index % 2)},
+        count=50,
+        rate=500,
+    )
+    await _wait_for(
+        hass, lambda: telemetry.events.get("InputMuteStateChanged") == 50
+    )
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_options_applied_live(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test changed options reach the open session without reconnecting."""
+    entry = await _setup_integration(hass, fake_obs)
+    connection = entry.runtime_data.connection
+    coordinator = entry.runtime_data.coordinator
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        {
+            "idle_interval": 30,
+            "active_interval": 5,
+            "request_timeout": 2.5,
+            "event_subscriptions": ["general", "input_volume_meters"],
+            "state_throttle": 1.0,
+            "forward_events": ["CurrentProgramSceneChanged"],
+            "event_coalesce_interval": 0,
+        },
+    )
+    await hass.async_block_till_done()
+
+    assert fake_obs.connects == 2
+    assert connection._req_client.base_client.ws.gettimeout() == 2.5
+    assert coordinator.update_interval == timedelta(seconds=30)
+    assert coordinator.state_throttle == 1.0
+    # The categories the integration needs stay subscribed, and Filters
+    # and Vendors are dropped
+    await _wait_for(
+        hass,
+        lambda: any(
+            session.subscriptions == 0b1_0000_0101_1101_1111
+            for session in fake_obs.sessions
+        ),
+    )
+
+    # Outputs stay subscribed, so the stream start still arrives as an
+    # event and switches to the active interval without waiting for a poll
+    await fake_obs.set_stream_active(True)
+    await _wait_for(
+        hass, lambda: coordinator.update_interval == timedelta(seconds=5)
+    )
+    assert "StreamStateChanged" in connection.telemetry.events
+    # The Reidentified reply is not mistaken for an event
+    assert None not in connection.telemetry.events
+
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_active_outputs_fetched_in_one_batch(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test only active outputs are polled, all in one batch per refresh."""
+    fake_obs.state.outputs = {
+        "Twitch": {"outputActive": True, "outputBytes": 0, "outputDuration": 1000},
+        "YouTube": {"outputActive": False},
+    }
+    entry = await _setup_integration(hass, fake_obs)
+    connection = entry.runtime_data.connection
+    coordinator = entry.runtime_data.coordinator
+
+    assert set(connection.outputs) == {"simple_stream", "Twitch", "YouTube"}
+    assert fake_obs.requests.count("GetOutputList") == 1
+    assert fake_obs.requests.count("GetOutputStatus") == 1
+    assert coordinator.data["outputs"]["Twitch"]["outputActive"] is True
+
+    ent_reg = er.async_get(hass)
+    twitch = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_output_Twitch_status"
+    )
+    youtube = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_output_YouTube_status"
+    )
+    assert hass.states.get(twitch).state == "active"
+    assert hass.states.get(youtube).state == "inactive"
+
+    fake_obs.state.outputs["Twitch"].update(outputBytes=250_000, outputDuration=2000)
+    batches = fake_obs.batches
+    await coordinator.async_refresh()
+    # The list is not fetched again without an output event
+    assert fake_obs.requests.count("GetOutputList") == 1
+    assert fake_obs.requests.count("GetOutputStatus") == 2
+    assert fake_obs.batches == batches + 1
+    assert coordinator.data["outputs"]["Twitch"]["outputBytes"] == 250_000
+
+    # Starting the stream lists the outputs again and polls both active ones
+    await fake_obs.set_stream_active(True)
+    await _wait_for(hass, lambda: fake_obs.requests.count("GetOutputList") == 2)
+    await _wait_for(hass, lambda: "simple_stream" in coordinator.data["outputs"])
+    assert set(coordinator.data["outputs"]) == {"simple_stream", "Twitch"}
+
+    # An output stopped without an event is skipped from the next poll on
+    fake_obs.state.outputs["Twitch"]["outputActive"] = False
+    await coordinator.async_refresh()
+    assert connection.outputs["Twitch"]["outputActive"] is False
+    await coordinator.async_refresh()
+    assert set(coordinator.data["outputs"]) == {"simple_stream"}
+
+    # A failed output list keeps the last outputs and the stream state
+    outputs = connection.outputs
+    fake_obs.fail_request("GetOutputList", 500, "Out of order")
+    await fake_obs.set_stream_active(False)
+    await _wait_for(hass, lambda: fake_obs.requests.count("GetOutputList") == 3)
+    await hass.async_block_till_done()
+    assert coordinator.last_update_success
+    assert not coordinator.data["stream_status"].output_active
+    assert connection.outputs is outputs
+    assert set(coordinator.data["outputs"]) == {"simple_stream"}
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_studio_mode_transition(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test studio mode entities follow events through a transition."""
+    fake_obs.state.scenes["Intermission"] = []
+    entry = await _setup_integration(hass, fake_obs)
+    ent_reg = er.async_get(hass)
+
+    def _entity_id(platform: str, key: str) -> str:
+        return ent_reg.async_get_entity_id(platform, DOMAIN, f"{entry.entry_id}_{key}")
+
+    studio_mode = _entity_id("switch", "studio_mode")
+    preview = _entity_id("select", "preview_scene")
+    transitioning = _entity_id("binary_sensor", "transitioning")
+    assert hass.states.get(studio_mode).state == "off"
+    assert hass.states.get(preview).state == "unavailable"
+    assert fake_obs.requests.count("GetSceneTransitionList") == 1
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": studio_mode}, blocking=True
+    )
+    await _wait_for(hass, lambda: hass.states.get(preview).state == "Scene")
+
+    await hass.services.async_call(
+        "select",
+        "select_option",
+        {"entity_id": preview, "option": "Intermission"},
+        blocking=True,
+    )
+    await _wait_for(hass, lambda: hass.states.get(preview).state == "Intermission")
+
+    fake_obs.state.transition_duration = 200
+    states: list[str] = []
+    entry.async_on_unload(
+        hass.bus.async_listen(
+            "state_changed",
+            lambda event: event.data["entity_id"] == transitioning
+            and states.append(event.data["new_state"].state),
+        )
+    )
+    await hass.services.async_call(
+        "button",
+        "press",
+        {"entity_id": _entity_id("button", "trigger_transition")},
+        blocking=True,
+    )
+    await _wait_for(hass, lambda: states == ["on", "off"])
+    assert fake_obs.state.program_scene == "Intermission"
+    assert hass.states.get(preview).state == "Scene"
+    # Everything after setup came from events
+    assert fake_obs.requests.count("GetSceneTransitionList") == 1
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_hotkeys_validated_from_cache(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test hotkey names are checked against a list fetched once per session."""
+    entry = await _setup_integration(hass, fake_obs)
+    connection = entry.runtime_data.connection
+    assert fake_obs.requests.count("GetHotkeyList") == 1
+
+    call = {"config_entry_id": entry.entry_id, "hotkey_name": "OBSBasic.Screenshot"}
+    for _ in range(2):
+        await hass.services.async_call(DOMAIN, "trigger_hotkey", call, blocking=True)
+    assert fake_obs.state.triggered_hotkeys == ["OBSBasic.Screenshot"] * 2
+
+    with pytest.raises(ServiceValidationError, match="hotkey_not_found"):
+        await hass.services.async_call(
+            DOMAIN,
+            "trigger_hotkey",
+            {"config_entry_id": entry.entry_id, "hotkey_name": "Unknown"},
+            blocking=True,
+        )
+    assert fake_obs.requests.count("GetHotkeyList") == 1
+    assert fake_obs.requests.count("TriggerHotkeyByName") == 2
+
+    # A new scene registers hotkeys, so the next lookup lists them again
+    fake_obs.state.hotkeys.append("OBSBasic.SelectScene")
+    await fake_obs.emit("SceneCreated", {"sceneName": "New", "isGroup": False})
+    await _wait_for(hass, lambda: entry.runtime_data.hotkeys._stale)
+    await hass.services.async_call(
+        DOMAIN,
+        "trigger_hotkey",
+        {"config_entry_id": entry.entry_id, "hotkey_name": "OBSBasic.SelectScene"},
+        blocking=True,
+    )
+    assert fake_obs.requests.count("GetHotkeyList") == 2
+
+    await hass.services.async_call(
+        DOMAIN,
+        "trigger_hotkey",
+        {
+            "config_entry_id": entry.entry_id,
+            "key_id": "OBS_KEY_F13",
+            "key_modifiers": ["shift"],
+        },
+        blocking=True,
+    )
+    assert fake_obs.state.triggered_hotkeys[-1] == {
+        "keyId": "OBS_KEY_F13",
+        "keyModifiers": {
+            "shift": True,
+            "control": False,
+            "alt": False,
+            "command": False,
+        },
+    }
+
+    # Each new session fetches the list again
+    await connection.async_disconnect()
+    await connection.async_connect()
+    await _wait_for(hass, lambda: fake_obs.requests.count("GetHotkeyList") == 3)
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_call_vendor_request(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test vendor requests return the plugin's response data."""
+    entry = await _setup_integration(hass, fake_obs)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "call_vendor_request",
+        {
+            "config_entry_id": entry.entry_id,
+            "vendor_name": "AdvancedSceneSwitcher",
+            "request_type": "AdvancedSceneSwitcherMessage",
+            "request_data": {"message": "scene_ready"},
+        },
+        blocking=True,
+        return_response=True,
+    )
+    assert response == {"received": {"message": "scene_ready"}}
+
+    with pytest.raises(HomeAssistantError, match="request_failed"):
+        await hass.services.async_call(
+            DOMAIN,
+            "call_vendor_request",
+            {
+                "config_entry_id": entry.entry_id,
+                "vendor_name": "Missing",
+                "request_type": "Ping",
+            },
+            blocking=True,
+            return_response=True,
+        )
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_recording_files_follow_events(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test the recording file sensors follow events through a split."""
+    entry = await _setup_integration(hass, fake_obs)
+    ent_reg = er.async_get(hass)
+    record_file = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_record_file"
+    )
+    last_file = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_last_record_file"
+    )
+    assert hass.states.get(record_file).state == "unknown"
+    assert hass.states.get(last_file).state == "unknown"
+    call = {"config_entry_id": entry.entry_id}
+
+    await fake_obs.set_record_active(True)
+    await _wait_for(
+        hass, lambda: hass.states.get(record_file).state == "/recordings/1.mp4"
+    )
+
+    await hass.services.async_call(
+        DOMAIN,
+        "create_record_chapter",
+        {**call, "chapter_name": "Interview"},
+        blocking=True,
+    )
+    await hass.services.async_call(
+        DOMAIN, "create_record_chapter", call, blocking=True
+    )
+    assert fake_obs.state.record_chapters == ["Interview", None]
+
+    await hass.services.async_call(DOMAIN, "split_record_file", call, blocking=True)
+    await _wait_for(
+        hass, lambda: hass.states.get(record_file).state == "/recordings/2.mp4"
+    )
+    state = hass.states.get(last_file)
+    assert state.state == "/recordings/1.mp4"
+    assert state.attributes["split"] is True
+
+    await fake_obs.set_record_active(False)
+    await _wait_for(
+        hass, lambda: hass.states.get(last_file).state == "/recordings/2.mp4"
+    )
+    assert hass.states.get(last_file).attributes["split"] is False
+    assert hass.states.get(record_file).state == "unknown"
+    # Nothing about recording files is polled
+    assert "GetRecordStatus" not in fake_obs.requests
+
+    with pytest.raises(HomeAssistantError, match="request_failed"):
+        await hass.services.async_call(
+            DOMAIN, "split_record_file", call, blocking=True
+        )
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_batch_sleep_and_timeout(
+    hass: HomeAssistant, fake_obs: FakeOBSServer
+) -> None:
+    """Test batches wait for their sleeps, and a late response drops the session."""
+    entry = await _setup_integration(hass, fake_obs)
+    connection = entry.runtime_data.connection
+    await connection.async_set_timeout(0.2)
+
+    # The socket waits for the sleep on top of the request timeout
+    results = await connection.async_request_batch(
+        [
+            {"requestType": "Sleep", "requestData": {"sleepMillis": 400}},
+            {"requestType": "GetVersion"},
+        ],
+        0,
+    )
+    assert results[1]["responseData"]["obsVersion"] == "30.2.0"
+
+    fake_obs.latency = 0.4
+    with pytest.raises(HomeAssistantError):
+        await connection.async_request_batch([{"requestType": "GetStats"}], 0)
+    assert not connection.connected
+
+    # The late response is not read as the answer to the next request
+    fake_obs.latency = 0
+    await _wait_for(hass, lambda: connection.connected)
+    response = await connection.async_request("GetVersion")
+    assert response["obsVersion"] == "30.2.0"
+    await hass.config_entries.async_unload(entry.entry_id)
@@ -0,0 +1,120 @@
+"""Tests for forwarding OBS events onto the Home Assistant event bus."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import MagicMock, patch
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry, async_capture_events
+
+from custom_components.obs_websocket.const import DOMAIN, EVENT_OBS
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status, make_service_settings
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.get_stream_service_settings.return_value = make_service_settings()
+    client.disconnect.return_value = None
+    return client
+
+
+async def _setup_integration(
+    hass: HomeAssistant, options: dict | None = None
+) -> MockConfigEntry:
+    """Set up the integration with a mock client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        options=options or {},
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(_make_req_client())}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return entry
+
+
+async def _fire(hass: HomeAssistant, entry: MockConfigEntry, event_type: str, data: dict) -> None:
+    """Deliver an OBS event as the EventClient thread would."""
+    await hass.async_add_executor_job(
+        entry.runtime_data.connection._on_obs_event, event_type, data
+    )
+    await hass.async_block_till_done()
+
+
+async def test_default_allowlist_forwarded(hass: HomeAssistant) -> None:
+    """Test allowlisted events are fired on the bus."""
+    events = async_capture_events(hass, EVENT_OBS)
+    entry = await _setup_integration(hass)
+
+    await _fire(hass, entry, "CurrentProgramSceneChanged", {"sceneName": "Live"})
+
+    assert len(events) == 1
+    assert events[0].data == {
+        "entry_id": entry.entry_id,
+        "host": MOCK_HOST,
+        "event_type": "CurrentProgramSceneChanged",
+        "event_data": {"sceneName": "Live"},
+    }
+
+
+async def test_other_events_not_forwarded(hass: HomeAssistant) -> None:
+    """Test events outside the allowlist never reach the bus or the loop."""
+    events = async_capture_events(hass, EVENT_OBS)
+    entry = await _setup_integration(hass, {"forward_events": ["RecordStateChanged"]})
+
+    await _fire(hass, entry, "CurrentProgramSceneChanged", {"sceneName": "Live"})
+    await _fire(hass, entry, "VendorEvent", {"vendorName": "AdvSS"})
+
+    assert events == []
+    assert "VendorEvent" not in entry.runtime_data.connection._listeners
+
+
+async def test_noisy_events_coalesced(hass: HomeAssistant) -> None:
+    """Test noisy events fire once per interval per subject with the latest data."""
+    events = async_capture_events(hass, EVENT_OBS)
+    entry = await _setup_integration(
+        hass,
+        {"forward_events": ["InputVolumeChanged"], "event_coalesce_interval": 0.05},
+    )
+
+    for volume in (-10, -11, -12):
+        await _fire(hass, entry, "InputVolumeChanged", {"inputName": "Mic", "inputVolumeDb": volume})
+    await _fire(hass, entry, "InputVolumeChanged", {"inputName": "Music", "inputVolumeDb": -20})
+
+    assert [e.data["event_data"]["inputVolumeDb"] for e in events] == [-10, -20]
+
+    await asyncio.sleep(0.1)
+    await hass.async_block_till_done()
+
+    assert [e.data["event_data"]["inputVolumeDb"] for e in events] == [-10, -20, -12]
+    assert entry.runtime_data.forwarder.coalesced == 1
+
+
+async def test_forwarding_stops_on_unload(hass: HomeAssistant) -> None:
+    """Test unloading removes the forwarding listeners."""
+    entry = await _setup_integration(hass)
+    connection = entry.runtime_data.connection
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert "StreamStateChanged" not in connection._listeners
@@ -0,0 +1,128 @@
+"""Tests for OBS WebSocket stream health scoring."""
+
+from __future__ import annotations
+
+from custom_components.obs_websocket.health import HEALTH_WINDOW, OBSStreamHealth
+
+from .conftest import make_stream_status
+
+
+def _health() -> OBSStreamHealth:
+    return OBSStreamHealth(
+        congestion=0.3, skipped_ratio=0.02, bitrate_drop=0.5, hysteresis=0.2
+    )
+
+
+def _sample(
+    index: int,
+    *,
+    congestion: float = 0.0,
+    skipped: int = 0,
+    kbps: int = 6000,
+    reconnecting: bool = False,
+):
+    """Return the status after ``index`` seconds of a 60 fps stream."""
+    return make_stream_status(
+        active=True,
+        reconnecting=reconnecting,
+        output_bytes=index * kbps * 1000 // 8,
+        output_duration=index * 1000,
+        output_skipped_frames=skipped,
+        output_total_frames=index * 60,
+        output_congestion=congestion,
+    )
+
+
+def test_congestion_hysteresis() -> None:
+    """Test congestion must fall well below the threshold to recover."""
+    health = _health()
+    health.add(_sample(0))
+    assert not health.degraded
+
+    index = 1
+    while not health.degraded:
+        health.add(_sample(index, congestion=0.5))
+        index += 1
+    assert health.score >= 1
+
+    # Just below the threshold is not enough to recover
+    for _ in range(20):
+        health.add(_sample(index, congestion=0.27))
+        index += 1
+    assert health.degraded
+    assert 0.8 <= health.score < 1
+
+    while health.degraded:
+        health.add(_sample(index, congestion=0.1))
+        index += 1
+    assert health.score < 0.8
+
+
+def test_skipped_frames_over_window() -> None:
+    """Test the skipped frame ratio only counts the latest samples."""
+    health = _health()
+    for index in range(HEALTH_WINDOW):
+        health.add(_sample(index))
+    # 30 of the 60 frames of the last second were skipped
+    health.add(_sample(HEALTH_WINDOW, skipped=30))
+    assert health.skipped_ratio == 30 / (HEALTH_WINDOW * 60)
+    assert health.degraded
+
+    for index in range(HEALTH_WINDOW + 1, 3 * HEALTH_WINDOW):
+        health.add(_sample(index, skipped=30))
+    assert health.skipped_ratio == 0
+    assert not health.degraded
+
+
+def test_reconnects_counted_once_per_reconnect() -> None:
+    """Test a reconnect spanning samples counts once and leaves the window."""
+    health = _health()
+    health.add(_sample(0))
+    health.add(_sample(1, reconnecting=True))
+    health.add(_sample(2, reconnecting=True))
+    assert health.reconnects == 1
+    assert health.degraded
+
+    for index in range(3, 3 + HEALTH_WINDOW):
+        health.add(_sample(index))
+    assert health.reconnects == 0
+    assert not health.degraded
+
+
+def test_bitrate_drop_against_baseline() -> None:
+    """Test a bitrate drop degrades the stream without moving the baseline."""
+    health = _health()
+    for index in range(10):
+        health.add(_sample(index))
+    assert health.baseline == 6000
+    assert health.bitrate_drop == 0
+
+    output_bytes = 9 * 6000 * 1000 // 8
+    for index in range(10, 20):
+        output_bytes += 1000 * 1000 // 8
+        status = _sample(index)
+        status.output_bytes = output_bytes
+        health.add(status)
+    assert health.degraded
+    assert health.baseline > 5000
+    assert health.as_dict()["bitrate_drop"] > 0.5
+
+
+def test_reset_when_stream_stops() -> None:
+    """Test an idle sample clears the state of the previous stream."""
+    health = _health()
+    health.add(_sample(0, congestion=1.0))
+    health.add(_sample(1, congestion=1.0))
+    assert health.degraded
+
+    health.add(make_stream_status())
+    assert not health.degraded
+    assert health.as_dict() == {
+        "score": 0.0,
+        "congestion": 0.0,
+        "skipped_ratio": 0.0,
+        "reconnects": 0,
+        "bitrate_kbps": None,
+        "baseline_kbps": None,
+        "bitrate_drop": 0.0,
+    }
@@ -2,16 +2,22 @@
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.importlib import async_import_module
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 
 from custom_components.obs_websocket import OBSRuntimeData
 from custom_components.obs_websocket.const import DOMAIN
+from custom_components.obs_websocket.session import (
+    async_take_session,
+    async_validate_session,
+)
 
-from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status, make_service_settings
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PASSWORD, MOCK_PORT, make_stream_status, make_service_settings
 
 
 def _make_mock_obs(req_client: MagicMock) -> MagicMock:
@@ -62,6 +68,34 @@ async def test_setup_entry(hass: HomeAssistant) -> None:
     assert entry.runtime_data.coordinator is not None
 
 
+async def test_setup_entry_adopts_validated_session(hass: HomeAssistant) -> None:
+    """Test setup reuses the session validated by the config flow."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    req_client = _make_req_client()
+    req_client.get_version.return_value = SimpleNamespace(obs_version="31.0.0")
+    mock_obs = _make_mock_obs(req_client)
+
+    with patch.dict("sys.modules", {"obsws_python": mock_obs}):
+        await async_validate_session(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD)
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    mock_obs.ReqClient.assert_called_once()
+    req_client.disconnect.assert_not_called()
+    req_client.base_client.ws.settimeout.assert_called_once_with(10)
+    assert entry.runtime_data.connection.capabilities == {"obs_version": "31.0.0"}
+    req_client.get_version.assert_called_once()
+    assert async_take_session(hass, MOCK_HOST, MOCK_PORT, MOCK_PASSWORD) is None
+
+
 async def test_setup_entry_connection_failure(hass: HomeAssistant) -> None:
     """Test setup fails when OBS is unreachable."""
     entry = MockConfigEntry(
@@ -302,3 +336,68 @@ async def test_coordinator_reconnects_after_disconnect(
         await hass.async_block_till_done()
 
         assert connection.connected
+
+
+async def test_setup_loads_enabled_features_only(hass: HomeAssistant) -> None:
+    """Test only the platforms of enabled features load, and changes reload."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        options={"features": []},
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    req_client = _make_req_client()
+    mock_obs = _make_mock_obs(req_client)
+    imported: list[str] = []
+
+    async def _import(hass: HomeAssistant, name: str):
+        imported.append(name)
+        return await async_import_module(hass, name)
+
+    with (
+        patch.dict("sys.modules", {"obsws_python": mock_obs}),
+        patch("custom_components.obs_websocket.async_import_module", _import),
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+        assert entry.state is ConfigEntryState.LOADED
+        assert entry.runtime_data.platforms == ["binary_sensor", "sensor"]
+        # No subsystem of a disabled feature is imported
+        assert imported == ["obsws_python"]
+        assert entry.runtime_data.studio is None
+        assert entry.runtime_data.hotkeys is None
+        assert entry.runtime_data.stats is None
+        assert entry.runtime_data.forwarder is None
+        assert not any(
+            call.args[0] == "GetHotkeyList" for call in req_client.send.call_args_list
+        )
+        # Without the recorder, the statistics are not even imported
+        assert entry.runtime_data.coordinator.statistics is None
+        assert {state.domain for state in hass.states.async_all()} == {
+            "binary_sensor",
+            "sensor",
+        }
+
+        hass.config_entries.async_update_entry(
+            entry, options={"features": ["studio_mode"]}
+        )
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.platforms == [
+        "binary_sensor",
+        "sensor",
+        "button",
+        "number",
+        "select",
+        "switch",
+    ]
+    assert entry.runtime_data.studio is not None
+    assert "custom_components.obs_websocket.studio" in imported
+    assert "custom_components.obs_websocket.hotkeys" not in imported
+    assert hass.states.async_entity_ids("camera") == []
+    assert hass.states.async_entity_ids("button")
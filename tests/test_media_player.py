@@ -0,0 +1,384 @@
+"""Tests for OBS WebSocket media input players."""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from homeassistant.components.media_player import (
+    ATTR_MEDIA_DURATION,
+    ATTR_MEDIA_POSITION,
+    ATTR_MEDIA_POSITION_UPDATED_AT,
+    ATTR_MEDIA_SEEK_POSITION,
+)
+from homeassistant.const import ATTR_ENTITY_ID
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.obs_websocket.const import DOMAIN
+
+from .conftest import (
+    MOCK_CONFIG,
+    MOCK_HOST,
+    MOCK_PORT,
+    make_service_settings,
+    make_stream_status,
+)
+
+INPUTS: list[dict[str, Any]] = [
+    {
+        "inputName": "Intro",
+        "inputUuid": "uuid-intro",
+        "inputKind": "ffmpeg_source",
+        "unversionedInputKind": "ffmpeg_source",
+    },
+    {
+        "inputName": "Music",
+        "inputUuid": "uuid-music",
+        "inputKind": "vlc_source",
+        "unversionedInputKind": "vlc_source",
+    },
+    {
+        "inputName": "Camera",
+        "inputUuid": "uuid-camera",
+        "inputKind": "v4l2_input",
+        "unversionedInputKind": "v4l2_input",
+    },
+]
+
+MEDIA_STATUS: dict[str, dict[str, Any]] = {
+    "Intro": {
+        "mediaState": "OBS_MEDIA_STATE_PLAYING",
+        "mediaDuration": 30000,
+        "mediaCursor": 12500,
+    },
+    "Music": {
+        "mediaState": "OBS_MEDIA_STATE_STOPPED",
+        "mediaDuration": None,
+        "mediaCursor": None,
+    },
+}
+
+INTRO = "media_player.intro"
+MUSIC = "media_player.music"
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient answering input requests and status batches."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.get_stream_service_settings.return_value = make_service_settings()
+    client.disconnect.return_value = None
+
+    def _send(request_type: str, data: dict | None = None, raw: bool = False) -> Any:
+        if request_type == "GetInputList":
+            return {"inputs": INPUTS}
+        return None
+
+    client.send.side_effect = _send
+
+    batches: list[dict[str, Any]] = []
+    ws = client.base_client.ws
+    ws.send.side_effect = lambda payload: batches.append(json.loads(payload)["d"])
+
+    def _recv() -> str:
+        batch = batches[-1]
+        return json.dumps(
+            {
+                "op": 9,
+                "d": {
+                    "requestId": batch["requestId"],
+                    "results": [
+                        {
+                            "requestType": request["requestType"],
+                            "requestStatus": {"result": True, "code": 100},
+                            "responseData": MEDIA_STATUS[
+                                request["requestData"]["inputName"]
+                            ],
+                        }
+                        if request["requestType"] == "GetMediaInputStatus"
+                        else {
+                            "requestType": request["requestType"],
+                            "requestStatus": {"result": False, "code": 204},
+                        }
+                        for request in batch["requests"]
+                    ],
+                },
+            }
+        )
+
+    ws.recv.side_effect = _recv
+    client.batches = batches
+    return client
+
+
+def _status_batches(client: MagicMock) -> list[dict[str, Any]]:
+    """Return the batches fetching media input status."""
+    return [
+        batch
+        for batch in client.batches
+        if batch["requests"][0]["requestType"] == "GetMediaInputStatus"
+    ]
+
+
+async def _setup_integration(
+    hass: HomeAssistant, req_client: MagicMock
+) -> MockConfigEntry:
+    """Set up the integration with a mock client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    ent_reg = er.async_get(hass)
+    for data in INPUTS[:2]:
+        ent_reg.async_get_or_create(
+            "media_player",
+            DOMAIN,
+            f"{entry.entry_id}_media_input_{data['inputUuid']}",
+            config_entry=entry,
+            suggested_object_id=data["inputName"].lower(),
+        )
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(req_client)}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return entry
+
+
+async def _fire(
+    hass: HomeAssistant, entry: MockConfigEntry, event_type: str, data: dict
+) -> None:
+    """Deliver an OBS event as the EventClient thread would."""
+    await hass.async_add_executor_job(
+        entry.runtime_data.connection._on_obs_event, event_type, data
+    )
+    # Some events are handled by background tasks that send requests
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_media_inputs_anchored_once(hass: HomeAssistant) -> None:
+    """Test media inputs get players anchored on one batched status request."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+
+    state = hass.states.get(INTRO)
+    assert state.state == "playing"
+    assert state.attributes[ATTR_MEDIA_DURATION] == 30
+    assert state.attributes[ATTR_MEDIA_POSITION] == 12.5
+    assert ATTR_MEDIA_POSITION_UPDATED_AT in state.attributes
+    assert state.attributes["input_name"] == "Intro"
+    assert hass.states.get(MUSIC).state == "idle"
+
+    # Only the two media inputs, and both statuses in a single batch
+    players = [
+        reg_entry.unique_id
+        for reg_entry in er.async_entries_for_config_entry(
+            er.async_get(hass), entry.entry_id
+        )
+        if reg_entry.domain == "media_player"
+    ]
+    assert len(players) == 2
+    assert len(_status_batches(req_client)) == 1
+    assert [r["requestData"] for r in _status_batches(req_client)[0]["requests"]] == [
+        {"inputName": "Intro"},
+        {"inputName": "Music"},
+    ]
+
+
+async def test_playback_follows_events(hass: HomeAssistant) -> None:
+    """Test playback state and position follow events without requests."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    req_client.send.reset_mock()
+
+    await _fire(
+        hass,
+        entry,
+        "MediaInputActionTriggered",
+        {
+            "inputName": "Intro",
+            "inputUuid": "uuid-intro",
+            "mediaAction": "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_PAUSE",
+        },
+    )
+    state = hass.states.get(INTRO)
+    assert state.state == "paused"
+    assert 12.5 <= state.attributes[ATTR_MEDIA_POSITION] < 13.5
+
+    await _fire(
+        hass,
+        entry,
+        "MediaInputPlaybackEnded",
+        {"inputName": "Intro", "inputUuid": "uuid-intro"},
+    )
+    state = hass.states.get(INTRO)
+    assert state.state == "idle"
+    assert state.attributes.get(ATTR_MEDIA_POSITION) is None
+
+    await _fire(
+        hass,
+        entry,
+        "MediaInputPlaybackStarted",
+        {"inputName": "Intro", "inputUuid": "uuid-intro"},
+    )
+    state = hass.states.get(INTRO)
+    assert state.state == "playing"
+    assert state.attributes[ATTR_MEDIA_POSITION] == 0
+    # The duration is kept, so a looping input needs no status request
+    assert state.attributes[ATTR_MEDIA_DURATION] == 30
+
+    req_client.send.assert_not_called()
+    assert len(_status_batches(req_client)) == 1
+
+
+async def test_controls_send_requests(hass: HomeAssistant) -> None:
+    """Test player controls send media input requests."""
+    req_client = _make_req_client()
+    await _setup_integration(hass, req_client)
+
+    await hass.services.async_call(
+        "media_player", "media_pause", {ATTR_ENTITY_ID: INTRO}, blocking=True
+    )
+    req_client.send.assert_any_call(
+        "TriggerMediaInputAction",
+        {"inputName": "Intro", "mediaAction": "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_PAUSE"},
+        raw=True,
+    )
+
+    await hass.services.async_call(
+        DOMAIN, "restart_media", {ATTR_ENTITY_ID: INTRO}, blocking=True
+    )
+    req_client.send.assert_any_call(
+        "TriggerMediaInputAction",
+        {
+            "inputName": "Intro",
+            "mediaAction": "OBS_WEBSOCKET_MEDIA_INPUT_ACTION_RESTART",
+        },
+        raw=True,
+    )
+
+    await hass.services.async_call(
+        "media_player",
+        "media_seek",
+        {ATTR_ENTITY_ID: INTRO, ATTR_MEDIA_SEEK_POSITION: 20},
+        blocking=True,
+    )
+    req_client.send.assert_any_call(
+        "SetMediaInputCursor", {"inputName": "Intro", "mediaCursor": 20000}, raw=True
+    )
+    # Seeks have no event, so the new position is anchored right away
+    assert hass.states.get(INTRO).attributes[ATTR_MEDIA_POSITION] == 20
+
+
+async def test_inputs_created_renamed_and_removed(hass: HomeAssistant) -> None:
+    """Test input events add, rename and remove players without reloading."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    ent_reg = er.async_get(hass)
+
+    MEDIA_STATUS["Outro"] = {
+        "mediaState": "OBS_MEDIA_STATE_ENDED",
+        "mediaDuration": 10000,
+        "mediaCursor": 10000,
+    }
+    try:
+        await _fire(
+            hass,
+            entry,
+            "InputCreated",
+            {
+                "inputName": "Outro",
+                "inputUuid": "uuid-outro",
+                "inputKind": "ffmpeg_source",
+                "unversionedInputKind": "ffmpeg_source",
+            },
+        )
+    finally:
+        del MEDIA_STATUS["Outro"]
+    unique_id = f"{entry.entry_id}_media_input_uuid-outro"
+    entity_id = ent_reg.async_get_entity_id("media_player", DOMAIN, unique_id)
+    assert entity_id is not None
+    assert hass.states.get(entity_id).attributes[ATTR_MEDIA_DURATION] == 10
+
+    await _fire(
+        hass,
+        entry,
+        "InputNameChanged",
+        {"inputUuid": "uuid-outro", "oldInputName": "Outro", "inputName": "Credits"},
+    )
+    state = hass.states.get(entity_id)
+    assert state.attributes["input_name"] == "Credits"
+    assert state.attributes["friendly_name"].endswith("Credits")
+
+    await _fire(
+        hass,
+        entry,
+        "InputRemoved",
+        {"inputName": "Credits", "inputUuid": "uuid-outro"},
+    )
+    assert ent_reg.async_get_entity_id("media_player", DOMAIN, unique_id) is None
+
+
+async def test_input_without_uuid_renamed(hass: HomeAssistant) -> None:
+    """Test a player keyed by input name follows a rename."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    ent_reg = er.async_get(hass)
+    prefix = f"{entry.entry_id}_media_input_"
+
+    MEDIA_STATUS["Loop"] = {
+        "mediaState": "OBS_MEDIA_STATE_PLAYING",
+        "mediaDuration": 5000,
+        "mediaCursor": 0,
+    }
+    try:
+        await _fire(
+            hass,
+            entry,
+            "InputCreated",
+            {
+                "inputName": "Loop",
+                "inputKind": "ffmpeg_source",
+                "unversionedInputKind": "ffmpeg_source",
+            },
+        )
+    finally:
+        del MEDIA_STATUS["Loop"]
+    entity_id = ent_reg.async_get_entity_id("media_player", DOMAIN, f"{prefix}Loop")
+    assert hass.states.get(entity_id).state == "playing"
+
+    await _fire(
+        hass,
+        entry,
+        "InputNameChanged",
+        {"oldInputName": "Loop", "inputName": "Ident"},
+    )
+    assert ent_reg.async_get_entity_id("media_player", DOMAIN, f"{prefix}Loop") is None
+    assert (
+        ent_reg.async_get_entity_id("media_player", DOMAIN, f"{prefix}Ident")
+        == entity_id
+    )
+    state = hass.states.get(entity_id)
+    assert state.attributes["input_name"] == "Ident"
+    assert state.attributes["friendly_name"].endswith("Ident")
+
+    # Events of the renamed input still reach its player
+    await _fire(hass, entry, "MediaInputPlaybackEnded", {"inputName": "Ident"})
+    assert hass.states.get(entity_id).state == "idle"
@@ -0,0 +1,145 @@
+"""Tests for the OBS WebSocket profiler."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.obs_websocket.const import DOMAIN
+from custom_components.obs_websocket.profiler import OBSProfiler, async_get_profiler
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_service_settings, make_stream_status
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.get_stream_service_settings.return_value = make_service_settings()
+    client.disconnect.return_value = None
+    return client
+
+
+async def _setup_integration(
+    hass: HomeAssistant, req_client: MagicMock
+) -> MockConfigEntry:
+    """Set up the integration with a mock client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(req_client)}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return entry
+
+
+def test_inactive_span_records_nothing() -> None:
+    """Test spans are shared no-ops while the profiler is off."""
+    profiler = OBSProfiler()
+    assert profiler.span("a") is profiler.span("b")
+    with profiler.span("a"):
+        pass
+
+    profiler.async_start()
+    with profiler.span("a"):
+        pass
+    with profiler.span("a"):
+        pass
+    spans = profiler.async_stop()
+    assert spans["a"]["count"] == 2
+
+    with profiler.span("a"):
+        pass
+    profiler.async_start()
+    assert profiler.async_stop() == {}
+
+
+async def test_profile_service(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test the profile service times hot paths and writes its files."""
+    hass.config.config_dir = str(tmp_path)
+    entry = await _setup_integration(hass, _make_req_client())
+    connection = entry.runtime_data.connection
+
+    task = hass.async_create_task(
+        hass.services.async_call(
+            DOMAIN,
+            "profile",
+            {"duration": 0.2, "cprofile": True},
+            blocking=True,
+            return_response=True,
+        )
+    )
+    await asyncio.sleep(0.05)
+    assert async_get_profiler(hass).active
+
+    with pytest.raises(ServiceValidationError, match="profile_running"):
+        await hass.services.async_call(
+            DOMAIN, "profile", {"duration": 1}, blocking=True
+        )
+
+    await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_add_executor_job(
+        connection._on_obs_event,
+        "CurrentProgramSceneChanged",
+        {"sceneName": "Live"},
+    )
+    response = await task
+
+    assert not async_get_profiler(hass).active
+    for span in (
+        "coordinator.update",
+        "connection.fetch",
+        "connection.event",
+        "connection.dispatch",
+        "sensor.update",
+    ):
+        assert response["spans"][span]["count"] >= 1, span
+
+    summary = json.loads(Path(response["summary"]).read_text())
+    assert summary["spans"] == response["spans"]
+    assert any(
+        function["function"].startswith("__init__.py")
+        for function in summary["functions"]
+    )
+    assert Path(response["profile"]).stat().st_size > 0
+    assert Path(response["summary"]).parent == tmp_path / "obs_websocket_profiles"
+
+
+async def test_profile_duration_capped(hass: HomeAssistant) -> None:
+    """Test the profile service refuses to run for more than a minute."""
+    await _setup_integration(hass, _make_req_client())
+
+    with pytest.raises(vol.Invalid):
+        await hass.services.async_call(
+            DOMAIN,
+            "profile",
+            {"duration": 120, "cprofile": True},
+            blocking=True,
+            return_response=True,
+        )
+    assert not async_get_profiler(hass).active
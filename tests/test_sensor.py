@@ -2,15 +2,26 @@
 
 from __future__ import annotations
 
+from datetime import timedelta
 from unittest.mock import MagicMock, patch
 
-from homeassistant.const import EntityCategory, STATE_UNAVAILABLE
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_STATE_CHANGED, EntityCategory, STATE_UNAVAILABLE
+from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers import entity_registry as er
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+    async_fire_time_changed,
+    mock_restore_cache_with_extra_data,
+)
 
 from custom_components.obs_websocket.const import DOMAIN
-from custom_components.obs_websocket.sensor import OBSStreamStatusSensor, OBSStreamServiceSensor
+from custom_components.obs_websocket.sensor import (
+    OBSRoundTripTimeSensor,
+    OBSStreamServiceSensor,
+    OBSStreamStatusSensor,
+)
 
 from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status, make_service_settings
 
@@ -110,8 +121,9 @@ async def test_stream_status_streaming(hass: HomeAssistant) -> None:
     assert state is not None
     assert state.state == "streaming"
     assert state.attributes["output_bytes"] == 1024000
-    assert state.attributes["output_duration"] == 60000
-    assert state.attributes["output_timecode"] == "00:01:00.000"
+    # Interpolated from the poll until the state was written
+    assert 60000 <= state.attributes["output_duration"] < 61000
+    assert state.attributes["output_timecode"].startswith("00:01:00.")
     assert state.attributes["output_skipped_frames"] == 5
     assert state.attributes["output_total_frames"] == 3600
     assert state.attributes["output_congestion"] == 0.1
@@ -235,3 +247,132 @@ async def test_service_sensor_entity_category(hass: HomeAssistant) -> None:
     entity = ent_reg.async_get(SERVICE_ENTITY_ID)
     assert entity is not None
     assert entity.entity_category == EntityCategory.DIAGNOSTIC
+
+
+async def test_round_trip_time_sensor(hass: HomeAssistant) -> None:
+    """Test round trip time sensor reports the latest request latency."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+
+    ent_reg = er.async_get(hass)
+    entity_id = ent_reg.async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_round_trip_time"
+    )
+    entity = ent_reg.async_get(entity_id)
+    assert entity.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+    assert entity.entity_category == EntityCategory.DIAGNOSTIC
+
+    coordinator = entry.runtime_data.coordinator
+    sensor = OBSRoundTripTimeSensor(coordinator, entry)
+    assert sensor.native_value is not None
+
+    entry.runtime_data.connection.telemetry.record_request("GetVersion", 0.0125)
+    assert sensor.native_value == 12.5
+
+
+async def test_state_throttle(hass: HomeAssistant) -> None:
+    """Test coordinator updates within the throttle interval write once."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    coordinator = entry.runtime_data.coordinator
+    coordinator.state_throttle = 5.0
+    changes = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    idle = coordinator.data
+    streaming = dict(idle, stream_status=make_stream_status(active=True))
+    reconnecting = dict(
+        idle, stream_status=make_stream_status(active=True, reconnecting=True)
+    )
+    coordinator.async_set_updated_data(streaming)
+    coordinator.async_set_updated_data(reconnecting)
+    coordinator.async_set_updated_data(idle)
+    await hass.async_block_till_done()
+    # The first update is written, the later ones wait for the interval
+    assert hass.states.get(STATUS_ENTITY_ID).state == "streaming"
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=6))
+    await hass.async_block_till_done()
+
+    assert hass.states.get(STATUS_ENTITY_ID).state == "idle"
+    status_changes = [
+        event for event in changes if event.data["entity_id"] == STATUS_ENTITY_ID
+    ]
+    assert len(status_changes) == 2
+
+
+async def test_stream_started_sensor(hass: HomeAssistant) -> None:
+    """Test the stream start timestamp follows the local stream clock."""
+    req_client = _make_req_client(active=True, output_duration=60000)
+    entry = await _setup_integration(hass, req_client)
+    coordinator = entry.runtime_data.coordinator
+
+    entity_id = er.async_get(hass).async_get_entity_id(
+        "sensor", DOMAIN, f"{entry.entry_id}_stream_started"
+    )
+    state = hass.states.get(entity_id)
+    assert state.attributes["device_class"] == "timestamp"
+    # The state is truncated to whole seconds, so it is up to a second
+    # before the exact start, which itself is up to a poll before now
+    started = dt_util.parse_datetime(state.state)
+    expected = (dt_util.utcnow() - timedelta(minutes=1)).replace(microsecond=0)
+    assert timedelta(0) <= expected - started <= timedelta(seconds=2)
+
+    # A later poll within the tolerance keeps the timestamp
+    req_client.get_stream_status.return_value = make_stream_status(
+        active=True, output_duration=60300
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == state.state
+
+    req_client.get_stream_status.return_value = make_stream_status()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "unknown"
+
+
+async def test_last_record_file_restored(hass: HomeAssistant) -> None:
+    """Test the last recording file survives a restart and follows events."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+    entity_id = er.async_get(hass).async_get_or_create(
+        "sensor",
+        DOMAIN,
+        f"{entry.entry_id}_last_record_file",
+        config_entry=entry,
+        suggested_object_id="last_recording_file",
+    ).entity_id
+    mock_restore_cache_with_extra_data(
+        hass,
+        (
+            (
+                State(entity_id, "/recordings/old.mkv"),
+                {"native_value": "/recordings/old.mkv", "native_unit_of_measurement": None},
+            ),
+        ),
+    )
+    with patch.dict(
+        "sys.modules", {"obsws_python": _make_mock_obs(_make_req_client())}
+    ):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    assert hass.states.get(entity_id).state == "/recordings/old.mkv"
+
+    await hass.async_add_executor_job(
+        entry.runtime_data.connection._on_obs_event,
+        "RecordStateChanged",
+        {
+            "outputActive": False,
+            "outputState": "OBS_WEBSOCKET_OUTPUT_STOPPED",
+            "outputPath": "/recordings/new.mkv",
+        },
+    )
+    await hass.async_block_till_done()
+    state = hass.states.get(entity_id)
+    assert state.state == "/recordings/new.mkv"
+    assert state.attributes["split"] is False
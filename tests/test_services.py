@@ -0,0 +1,318 @@
+"""Tests for OBS WebSocket services."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError, ServiceValidationError
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.obs_websocket.const import DOMAIN
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status, make_service_settings
+
+
+class FakeSocket:
+    """Records batches sent on the ReqClient socket and answers them."""
+
+    def __init__(self) -> None:
+        self.sent: list[dict] = []
+        self.timeouts: list[float] = []
+
+    def settimeout(self, timeout: float) -> None:
+        self.timeouts.append(timeout)
+
+    def send(self, payload: str) -> None:
+        self.sent.append(json.loads(payload))
+
+    def recv(self) -> str:
+        batch = self.sent[-1]["d"]
+        results = [
+            {
+                "requestType": request["requestType"],
+                "requestStatus": {"result": request["requestType"] != "Fail", "code": 100},
+                "responseData": {"echo": request.get("requestData", {})},
+            }
+            for request in batch["requests"]
+        ]
+        return json.dumps(
+            {"op": 9, "d": {"requestId": batch["requestId"], "results": results}}
+        )
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient with a fake socket."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.get_stream_service_settings.return_value = make_service_settings()
+    client.disconnect.return_value = None
+    client.base_client.ws = FakeSocket()
+    return client
+
+
+async def _setup_integration(
+    hass: HomeAssistant, req_client: MagicMock
+) -> MockConfigEntry:
+    """Set up the integration with a mock client."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(req_client)}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+    # Forget the batches fetching the studio mode state during setup
+    req_client.base_client.ws.sent.clear()
+
+    return entry
+
+
+async def test_run_batch(hass: HomeAssistant) -> None:
+    """Test run_batch sends one RequestBatch and returns per-request results."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "run_batch",
+        {
+            "config_entry_id": entry.entry_id,
+            "execution_type": "serial_frame",
+            "halt_on_failure": True,
+            "requests": [
+                {"request_type": "SetCurrentProgramScene", "request_data": {"sceneName": "Live"}},
+                {"request_type": "Sleep", "request_data": {"sleepFrames": 2}},
+                {"request_type": "StartStream"},
+            ],
+        },
+        blocking=True,
+        return_response=True,
+    )
+
+    sent = req_client.base_client.ws.sent
+    assert len(sent) == 1
+    assert sent[0]["op"] == 8
+    assert sent[0]["d"]["executionType"] == 1
+    assert sent[0]["d"]["haltOnFailure"] is True
+    assert sent[0]["d"]["requests"] == [
+        {"requestType": "SetCurrentProgramScene", "requestData": {"sceneName": "Live"}},
+        {"requestType": "Sleep", "requestData": {"sleepFrames": 2}},
+        {"requestType": "StartStream"},
+    ]
+    assert [r["request_type"] for r in response["results"]] == [
+        "SetCurrentProgramScene",
+        "Sleep",
+        "StartStream",
+    ]
+    assert response["results"][0]["result"] is True
+    assert response["results"][0]["data"] == {"echo": {"sceneName": "Live"}}
+    # The response was awaited for the sleep too, then the timeout restored
+    timeout = entry.runtime_data.connection.timeout
+    assert req_client.base_client.ws.timeouts == [timeout + 0.2, timeout]
+
+
+async def test_run_batch_reports_failures(hass: HomeAssistant) -> None:
+    """Test failed requests are reported in the response, not raised."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "run_batch",
+        {"config_entry_id": entry.entry_id, "requests": [{"request_type": "Fail"}]},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response["results"][0]["result"] is False
+    assert response["results"][0]["code"] == 100
+
+
+@pytest.mark.parametrize(
+    ("execution_type", "sleep"),
+    [
+        ("serial_realtime", {"sleepFrames": 1}),
+        ("serial_frame", {"sleepMillis": 100}),
+        ("parallel", {"sleepMillis": 100}),
+    ],
+)
+async def test_run_batch_invalid_sleep(
+    hass: HomeAssistant, execution_type: str, sleep: dict
+) -> None:
+    """Test Sleep must match the execution type."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "run_batch",
+            {
+                "config_entry_id": entry.entry_id,
+                "execution_type": execution_type,
+                "requests": [{"request_type": "Sleep", "request_data": sleep}],
+            },
+            blocking=True,
+        )
+    assert req_client.base_client.ws.sent == []
+
+
+async def test_run_batch_unknown_entry(hass: HomeAssistant) -> None:
+    """Test run_batch rejects unknown config entries."""
+    req_client = _make_req_client()
+    await _setup_integration(hass, req_client)
+
+    with pytest.raises(ServiceValidationError):
+        await hass.services.async_call(
+            DOMAIN,
+            "run_batch",
+            {"config_entry_id": "missing", "requests": [{"request_type": "StartStream"}]},
+            blocking=True,
+        )
+
+
+async def test_run_batch_connection_error(hass: HomeAssistant) -> None:
+    """Test socket errors surface as HomeAssistantError."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    req_client.base_client.ws.recv = MagicMock(side_effect=ConnectionError("Lost"))
+
+    with pytest.raises(HomeAssistantError):
+        await hass.services.async_call(
+            DOMAIN,
+            "run_batch",
+            {"config_entry_id": entry.entry_id, "requests": [{"request_type": "StartStream"}]},
+            blocking=True,
+        )
+    # The session is not reused, as its responses may be out of step
+    req_client.disconnect.assert_called_once()
+
+
+async def test_request(hass: HomeAssistant) -> None:
+    """Test request returns the response data."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    req_client.send.reset_mock()
+    req_client.send.return_value = {"obsVersion": "30.0.0"}
+
+    response = await hass.services.async_call(
+        DOMAIN,
+        "request",
+        {"config_entry_id": entry.entry_id, "request_type": "GetVersion"},
+        blocking=True,
+        return_response=True,
+    )
+
+    assert response == {"obsVersion": "30.0.0"}
+    req_client.send.assert_called_once_with("GetVersion", None, raw=True)
+
+
+async def test_request_not_supported(hass: HomeAssistant) -> None:
+    """Test requests missing from the cached capabilities are rejected."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    entry.runtime_data.connection.capabilities = {
+        "available_requests": ["GetVersion", "GetSceneList"]
+    }
+    req_client.send.reset_mock()
+
+    with pytest.raises(ServiceValidationError, match="request_not_supported"):
+        await hass.services.async_call(
+            DOMAIN,
+            "request",
+            {"config_entry_id": entry.entry_id, "request_type": "SplitRecordFile"},
+            blocking=True,
+        )
+    with pytest.raises(ServiceValidationError, match="request_not_supported"):
+        await hass.services.async_call(
+            DOMAIN,
+            "run_batch",
+            {
+                "config_entry_id": entry.entry_id,
+                "requests": [
+                    {"request_type": "GetSceneList"},
+                    {"request_type": "SplitRecordFile"},
+                ],
+            },
+            blocking=True,
+        )
+    req_client.send.assert_not_called()
+
+
+async def test_request_cache_invalidated_by_event(hass: HomeAssistant) -> None:
+    """Test cached Get requests are served locally until an event invalidates them."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    req_client.send.reset_mock()
+    req_client.send.return_value = {"scenes": [{"sceneName": "Live"}]}
+    call = {"config_entry_id": entry.entry_id, "request_type": "GetSceneList", "cache": True}
+
+    for _ in range(3):
+        response = await hass.services.async_call(
+            DOMAIN, "request", call, blocking=True, return_response=True
+        )
+    assert response == {"scenes": [{"sceneName": "Live"}]}
+    assert req_client.send.call_count == 1
+
+    await hass.async_add_executor_job(
+        entry.runtime_data.connection._on_obs_event, "SceneCreated", {"sceneName": "New"}
+    )
+    await hass.async_block_till_done()
+
+    await hass.services.async_call(
+        DOMAIN, "request", call, blocking=True, return_response=True
+    )
+    assert req_client.send.call_count == 2
+
+
+async def test_request_cache_ignored_for_volatile_requests(hass: HomeAssistant) -> None:
+    """Test requests without invalidating events are never cached."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    req_client.send.reset_mock()
+    req_client.send.return_value = {"outputActive": True}
+    call = {"config_entry_id": entry.entry_id, "request_type": "GetStreamStatus", "cache": True}
+
+    await hass.services.async_call(DOMAIN, "request", call, blocking=True, return_response=True)
+    await hass.services.async_call(DOMAIN, "request", call, blocking=True, return_response=True)
+
+    assert req_client.send.call_count == 2
+
+
+async def test_trigger_hotkey_schema(hass: HomeAssistant) -> None:
+    """Test trigger_hotkey needs either a hotkey name or an OBS key ID."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+
+    for data in (
+        {},
+        {"hotkey_name": "OBSBasic.Screenshot", "key_id": "OBS_KEY_F13"},
+        {"key_id": "F13"},
+        {"key_id": "OBS_KEY_F13", "key_modifiers": ["hyper"]},
+    ):
+        with pytest.raises(vol.Invalid):
+            await hass.services.async_call(
+                DOMAIN,
+                "trigger_hotkey",
+                {"config_entry_id": entry.entry_id, **data},
+                blocking=True,
+            )
@@ -0,0 +1,142 @@
+"""Tests for OBS WebSocket long-term statistics."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from homeassistant import loader
+from homeassistant.components.recorder import Recorder, get_instance
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.obs_websocket.const import DOMAIN
+from custom_components.obs_websocket.statistics import OBSStreamStatistics
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status
+
+HOUR = datetime(2026, 3, 1, 20, tzinfo=UTC)
+BITRATE = "obs_websocket:192_168_1_100_4455_bitrate"
+DROPPED = "obs_websocket:192_168_1_100_4455_dropped_frames"
+STREAMED = "obs_websocket:192_168_1_100_4455_streamed_time"
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Enable custom integrations, with the recorder database set up first."""
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+
+
+def _status(seconds: int, kbps: int, skipped: int = 0):
+    """Return the status after ``seconds`` of a stream at ``kbps``."""
+    return make_stream_status(
+        active=True,
+        output_bytes=seconds * kbps * 1000 // 8,
+        output_duration=seconds * 1000,
+        output_skipped_frames=skipped,
+    )
+
+
+def _statistics(hass: HomeAssistant) -> OBSStreamStatistics:
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+    return OBSStreamStatistics(hass, entry)
+
+
+async def _rows(hass: HomeAssistant) -> dict:
+    await hass.async_block_till_done(wait_background_tasks=True)
+    await async_wait_recording_done(hass)
+    return await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        HOUR - timedelta(hours=1),
+        None,
+        {BITRATE, DROPPED, STREAMED},
+        "hour",
+        None,
+        {"mean", "min", "max", "state", "sum"},
+    )
+
+
+async def test_hours_imported_when_finished(hass: HomeAssistant) -> None:
+    """Test polls are aggregated per hour and imported when the hour ends."""
+    statistics = _statistics(hass)
+
+    statistics.add(_status(0, 6000), HOUR + timedelta(minutes=10))
+    statistics.add(_status(60, 6000, skipped=5), HOUR + timedelta(minutes=11))
+    statistics.add(
+        make_stream_status(
+            active=True,
+            output_bytes=_status(60, 6000).output_bytes + 90 * 2000 * 1000 // 8,
+            output_duration=150_000,
+            output_skipped_frames=20,
+        ),
+        HOUR + timedelta(minutes=12, seconds=30),
+    )
+    # Nothing is imported before the hour is over
+    assert await _rows(hass) == {}
+
+    statistics.add(make_stream_status(), HOUR + timedelta(hours=1, minutes=1))
+    rows = await _rows(hass)
+    bitrate = rows[BITRATE][0]
+    assert bitrate["start"] == HOUR.timestamp()
+    assert bitrate["min"] == pytest.approx(2000)
+    assert bitrate["max"] == pytest.approx(6000)
+    # Weighted by time: 60 s at 6000 and 90 s at 2000
+    assert bitrate["mean"] == pytest.approx(3600)
+    assert rows[DROPPED][0]["sum"] == 20
+    assert rows[STREAMED][0]["sum"] == 150
+
+    # The sums go on from the previous hour
+    statistics.add(_status(0, 6000), HOUR + timedelta(hours=2))
+    statistics.add(_status(30, 6000, skipped=2), HOUR + timedelta(hours=2, seconds=30))
+    statistics.add(make_stream_status(), HOUR + timedelta(hours=3))
+    rows = await _rows(hass)
+    assert [row["sum"] for row in rows[STREAMED]] == [150, 180]
+    assert [row["state"] for row in rows[DROPPED]] == [20, 2]
+    assert [row["sum"] for row in rows[DROPPED]] == [20, 22]
+
+
+async def test_partial_hour_flushed_and_continued(hass: HomeAssistant) -> None:
+    """Test a flushed partial hour is merged with the rest after a restart."""
+    statistics = _statistics(hass)
+    statistics.add(_status(0, 6000), HOUR)
+    statistics.add(_status(60, 6000, skipped=3), HOUR + timedelta(minutes=1))
+    await statistics.async_flush()
+    assert (await _rows(hass))[STREAMED][0]["sum"] == 60
+
+    # A new instance, as after a restart, continues from the recorder
+    restarted = OBSStreamStatistics(hass, statistics._entry)
+    restarted.add(_status(0, 3000), HOUR + timedelta(minutes=30))
+    restarted.add(_status(40, 3000, skipped=4), HOUR + timedelta(minutes=31))
+    restarted.add(make_stream_status(), HOUR + timedelta(hours=1))
+    rows = await _rows(hass)
+    assert len(rows[STREAMED]) == 1
+    assert rows[STREAMED][0]["state"] == 100
+    assert rows[STREAMED][0]["sum"] == 100
+    assert rows[DROPPED][0]["state"] == 7
+    assert rows[DROPPED][0]["sum"] == 7
+    bitrate = rows[BITRATE][0]
+    # 60 s at 6000 before the restart and 40 s at 3000 after it
+    assert bitrate["mean"] == pytest.approx(4800)
+    assert bitrate["min"] == pytest.approx(3000)
+    assert bitrate["max"] == pytest.approx(6000)
+
+    # The next hour goes on from the merged hour
+    restarted.add(_status(0, 6000), HOUR + timedelta(hours=2))
+    restarted.add(_status(20, 6000), HOUR + timedelta(hours=2, seconds=20))
+    restarted.add(make_stream_status(), HOUR + timedelta(hours=3))
+    rows = await _rows(hass)
+    assert [row["sum"] for row in rows[STREAMED]] == [100, 120]
@@ -0,0 +1,329 @@
+"""Tests for OBS WebSocket scene item switches."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from homeassistant.const import STATE_OFF, STATE_ON
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.obs_websocket.const import DOMAIN
+
+from .conftest import MOCK_CONFIG, MOCK_HOST, MOCK_PORT, make_stream_status, make_service_settings
+
+SCENE_ITEMS: dict[str, list[dict[str, Any]]] = {
+    "Live": [
+        {"sceneItemId": 1, "sourceName": "Camera", "sceneItemEnabled": True},
+        {"sceneItemId": 2, "sourceName": "Overlay", "sceneItemEnabled": False},
+    ],
+    "Break": [
+        {"sceneItemId": 7, "sourceName": "Slate", "sceneItemEnabled": True},
+    ],
+}
+
+
+def _make_mock_obs(req_client: MagicMock) -> MagicMock:
+    """Create a mock obsws_python module."""
+    mock_obs = MagicMock()
+    mock_obs.ReqClient.return_value = req_client
+    mock_obs.EventClient = type(
+        "EventClient", (), {"__init__": lambda self, **kw: None}
+    )
+    return mock_obs
+
+
+def _make_req_client() -> MagicMock:
+    """Create a mock ReqClient that answers scene item requests."""
+    client = MagicMock()
+    client.get_stream_status.return_value = make_stream_status()
+    client.get_stream_service_settings.return_value = make_service_settings()
+    client.disconnect.return_value = None
+
+    def _send(request_type: str, data: dict | None = None, raw: bool = False) -> Any:
+        if request_type == "GetCurrentProgramScene":
+            return {"currentProgramSceneName": "Live"}
+        if request_type == "GetSceneItemList":
+            return {"sceneItems": SCENE_ITEMS[data["sceneName"]]}
+        if request_type == "GetSceneItemEnabled":
+            return {"sceneItemEnabled": True}
+        return None
+
+    client.send.side_effect = _send
+    return client
+
+
+async def _setup_integration(
+    hass: HomeAssistant, req_client: MagicMock, *, enable: bool = True
+) -> MockConfigEntry:
+    """Set up the integration, optionally enabling the scene item switches."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=MOCK_HOST,
+        data=MOCK_CONFIG.copy(),
+        unique_id=f"{MOCK_HOST}:{MOCK_PORT}",
+    )
+    entry.add_to_hass(hass)
+
+    if enable:
+        ent_reg = er.async_get(hass)
+        for scene, items in SCENE_ITEMS.items():
+            for item in items:
+                ent_reg.async_get_or_create(
+                    "switch",
+                    DOMAIN,
+                    f"{entry.entry_id}_scene_item_{scene}_{item['sceneItemId']}",
+                    config_entry=entry,
+                    suggested_object_id=f"{scene}_{item['sourceName']}".lower(),
+                )
+
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(req_client)}):
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+
+    return entry
+
+
+async def _fire(hass: HomeAssistant, entry: MockConfigEntry, event_type: str, data: dict) -> None:
+    """Deliver an OBS event as the EventClient thread would."""
+    await hass.async_add_executor_job(
+        entry.runtime_data.connection._on_obs_event, event_type, data
+    )
+    # Some events are handled by background tasks that send requests
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+
+async def test_switches_disabled_by_default(hass: HomeAssistant) -> None:
+    """Test scene item switches are registered disabled and only for the program scene."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client, enable=False)
+
+    ent_reg = er.async_get(hass)
+    entity_id = ent_reg.async_get_entity_id(
+        "switch", DOMAIN, f"{entry.entry_id}_scene_item_Live_1"
+    )
+    assert entity_id is not None
+    assert ent_reg.async_get(entity_id).disabled_by is er.RegistryEntryDisabler.INTEGRATION
+    assert hass.states.get(entity_id) is None
+
+    # The Break scene was never requested
+    loaded = [c.args[1] for c in req_client.send.call_args_list if c.args[0] == "GetSceneItemList"]
+    assert loaded == [{"sceneName": "Live"}]
+
+
+async def test_enabled_switch_states(hass: HomeAssistant) -> None:
+    """Test enabled switches load their scenes and report state."""
+    req_client = _make_req_client()
+    await _setup_integration(hass, req_client)
+
+    assert hass.states.get("switch.live_camera").state == STATE_ON
+    assert hass.states.get("switch.live_overlay").state == STATE_OFF
+    assert hass.states.get("switch.break_slate").state == STATE_ON
+
+
+async def test_enable_state_event_updates_switch(hass: HomeAssistant) -> None:
+    """Test SceneItemEnableStateChanged updates the switch without a request."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    req_client.send.reset_mock()
+
+    await _fire(
+        hass,
+        entry,
+        "SceneItemEnableStateChanged",
+        {"sceneName": "Live", "sceneItemId": 2, "sceneItemEnabled": True},
+    )
+
+    assert hass.states.get("switch.live_overlay").state == STATE_ON
+    req_client.send.assert_not_called()
+
+
+async def test_turn_on_sends_request(hass: HomeAssistant) -> None:
+    """Test turning a switch on sends SetSceneItemEnabled."""
+    req_client = _make_req_client()
+    await _setup_integration(hass, req_client)
+
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": "switch.live_overlay"}, blocking=True
+    )
+
+    req_client.send.assert_any_call(
+        "SetSceneItemEnabled",
+        {"sceneName": "Live", "sceneItemId": 2, "sceneItemEnabled": True},
+        raw=True,
+    )
+
+
+async def test_item_created_and_removed(hass: HomeAssistant) -> None:
+    """Test scene item events add and remove registry entries incrementally."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    ent_reg = er.async_get(hass)
+    unique_id = f"{entry.entry_id}_scene_item_Live_9"
+
+    await _fire(
+        hass,
+        entry,
+        "SceneItemCreated",
+        {"sceneName": "Live", "sourceName": "Logo", "sceneItemId": 9, "sceneItemIndex": 2},
+    )
+    assert ent_reg.async_get_entity_id("switch", DOMAIN, unique_id) is not None
+
+    await _fire(
+        hass,
+        entry,
+        "SceneItemRemoved",
+        {"sceneName": "Live", "sourceName": "Logo", "sceneItemId": 9},
+    )
+    assert ent_reg.async_get_entity_id("switch", DOMAIN, unique_id) is None
+
+
+async def test_item_created_in_unloaded_scene_ignored(hass: HomeAssistant) -> None:
+    """Test events for scenes that were never loaded cost nothing."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client, enable=False)
+    req_client.send.reset_mock()
+
+    await _fire(
+        hass,
+        entry,
+        "SceneItemCreated",
+        {"sceneName": "Break", "sourceName": "Logo", "sceneItemId": 9, "sceneItemIndex": 2},
+    )
+
+    req_client.send.assert_not_called()
+
+
+async def test_scene_renamed(hass: HomeAssistant) -> None:
+    """Test renaming a scene keeps its switches under migrated unique IDs."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    ent_reg = er.async_get(hass)
+    prefix = f"{entry.entry_id}_scene_item_"
+
+    await _fire(
+        hass,
+        entry,
+        "SceneNameChanged",
+        {"oldSceneName": "Live", "sceneName": "Show", "sceneUuid": "uuid-live"},
+    )
+
+    assert ent_reg.async_get_entity_id("switch", DOMAIN, f"{prefix}Live_1") is None
+    assert (
+        ent_reg.async_get_entity_id("switch", DOMAIN, f"{prefix}Show_1")
+        == "switch.live_camera"
+    )
+    state = hass.states.get("switch.live_camera")
+    assert state.state == STATE_ON
+    assert state.attributes["scene_name"] == "Show"
+
+    # Events and requests now use the new name, and no duplicates appear
+    await _fire(
+        hass,
+        entry,
+        "SceneItemEnableStateChanged",
+        {"sceneName": "Show", "sceneItemId": 1, "sceneItemEnabled": False},
+    )
+    assert hass.states.get("switch.live_camera").state == STATE_OFF
+    await hass.services.async_call(
+        "switch", "turn_on", {"entity_id": "switch.live_camera"}, blocking=True
+    )
+    req_client.send.assert_any_call(
+        "SetSceneItemEnabled",
+        {"sceneName": "Show", "sceneItemId": 1, "sceneItemEnabled": True},
+        raw=True,
+    )
+    switches = [
+        reg_entry.unique_id
+        for reg_entry in er.async_entries_for_config_entry(ent_reg, entry.entry_id)
+        if reg_entry.domain == "switch" and reg_entry.unique_id.startswith(prefix)
+    ]
+    assert len(switches) == 3
+
+
+async def test_scene_removed(hass: HomeAssistant) -> None:
+    """Test removing a scene removes its switches and stops loading it."""
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    ent_reg = er.async_get(hass)
+    prefix = f"{entry.entry_id}_scene_item_"
+    # A switch of the scene that is disabled, so never loaded
+    ent_reg.async_get_or_create(
+        "switch",
+        DOMAIN,
+        f"{prefix}Break_8",
+        config_entry=entry,
+        disabled_by=er.RegistryEntryDisabler.USER,
+    )
+
+    await _fire(hass, entry, "SceneRemoved", {"sceneName": "Break", "isGroup": False})
+
+    assert ent_reg.async_get_entity_id("switch", DOMAIN, f"{prefix}Break_7") is None
+    assert ent_reg.async_get_entity_id("switch", DOMAIN, f"{prefix}Break_8") is None
+    assert hass.states.get("switch.break_slate") is None
+    assert ent_reg.async_get_entity_id("switch", DOMAIN, f"{prefix}Live_1")
+
+    # Reconnecting does not ask OBS for the removed scene
+    req_client.send.reset_mock()
+    with patch.dict("sys.modules", {"obsws_python": _make_mock_obs(req_client)}):
+        await entry.runtime_data.connection.async_connect()
+    await hass.async_block_till_done(wait_background_tasks=True)
+    loaded = [c.args[1] for c in req_client.send.call_args_list if c.args[0] == "GetSceneItemList"]
+    assert loaded == [{"sceneName": "Live"}]
+
+
+async def test_replay_leaves_switches_alone(hass: HomeAssistant, tmp_path: Path) -> None:
+    """Test a replayed capture neither removes switches nor sends requests."""
+    hass.config.config_dir = str(tmp_path)
+    req_client = _make_req_client()
+    entry = await _setup_integration(hass, req_client)
+    ent_reg = er.async_get(hass)
+    prefix = f"{entry.entry_id}_scene_item_"
+    req_client.send.reset_mock()
+
+    capture_dir = tmp_path / "obs_websocket_captures"
+    capture_dir.mkdir()
+    records = [
+        {
+            "t": 0,
+            "kind": "event",
+            "type": "SceneItemRemoved",
+            "data": {"sceneName": "Live", "sourceName": "Camera", "sceneItemId": 1},
+        },
+        {
+            "t": 0,
+            "kind": "event",
+            "type": "SceneNameChanged",
+            "data": {"oldSceneName": "Break", "sceneName": "Pause"},
+        },
+        {
+            "t": 0,
+            "kind": "event",
+            "type": "SceneItemCreated",
+            "data": {
+                "sceneName": "Live",
+                "sourceName": "Logo",
+                "sceneItemId": 9,
+                "sceneItemIndex": 2,
+            },
+        },
+    ]
+    (capture_dir / "session.jsonl").write_text(
+        "".join(json.dumps(record) + "\n" for record in records)
+    )
+    await hass.services.async_call(
+        DOMAIN,
+        "replay_capture",
+        {"config_entry_id": entry.entry_id, "file": "session.jsonl", "speed": 0},
+        blocking=True,
+    )
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    assert ent_reg.async_get_entity_id("switch", DOMAIN, f"{prefix}Live_1")
+    assert ent_reg.async_get_entity_id("switch", DOMAIN, f"{prefix}Break_7")
+    assert hass.states.get("switch.live_camera").state == STATE_ON
+    req_client.send.assert_not_called()
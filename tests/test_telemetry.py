@@ -0,0 +1,54 @@
+"""Tests for OBS WebSocket connection telemetry."""
+
+from __future__ import annotations
+
+from custom_components.obs_websocket.telemetry import LatencyHistogram, OBSTelemetry
+
+
+def test_histogram_buckets() -> None:
+    """Test samples are counted in the smallest bucket that fits them."""
+    histogram = LatencyHistogram()
+    for ms in (0.4, 1.0, 3.0, 7000.0):
+        histogram.add(ms)
+
+    result = histogram.as_dict()
+    assert result["count"] == 4
+    assert result["max_ms"] == 7000.0
+    assert result["mean_ms"] == round(7004.4 / 4, 2)
+    assert result["buckets"] == {"<=1ms": 2, "<=5ms": 1, ">5000ms": 1}
+
+
+def test_histogram_empty() -> None:
+    """Test an empty histogram has no mean."""
+    assert LatencyHistogram().as_dict() == {
+        "count": 0,
+        "mean_ms": None,
+        "total_ms": 0.0,
+        "max_ms": 0.0,
+        "buckets": {},
+    }
+
+
+def test_telemetry_records() -> None:
+    """Test telemetry counters and last values."""
+    telemetry = OBSTelemetry()
+    assert telemetry.reconnects == 0
+
+    telemetry.record_connect(0.05)
+    telemetry.record_connect(0.02)
+    telemetry.record_request("GetVersion", 0.003)
+    telemetry.record_request("GetVersion", 0.004)
+    telemetry.record_event("StreamStateChanged")
+    telemetry.record_event("StreamStateChanged")
+    telemetry.record_refresh(0.01)
+    telemetry.record_error("request", ConnectionError("Lost"))
+
+    result = telemetry.as_dict()
+    assert result["connects"] == 2
+    assert result["reconnects"] == 1
+    assert result["handshake_ms"] == 20.0
+    assert result["last_rtt_ms"] == 4.0
+    assert result["requests"]["GetVersion"]["count"] == 2
+    assert result["events"] == {"StreamStateChanged": 2}
+    assert result["refreshes"]["count"] == 1
+    assert result["last_errors"]["request"]["error"] == "ConnectionError: Lost"
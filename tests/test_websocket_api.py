@@ -0,0 +1,176 @@
+"""Tests for the OBS WebSocket websocket API."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from homeassistant.core import HomeAssistant
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.typing import WebSocketGenerator
+
+from custom_components.obs_websocket.const import DOMAIN
+
+from .conftest import MOCK_PASSWORD
+from .fake_obs import FakeOBSServer
+
+
+async def _setup_integration(
+    hass: HomeAssistant, server: FakeOBSServer, options: dict | None = None
+) -> MockConfigEntry:
+    """Set up the integration against the fake server."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        title=server.host,
+        data={"host": server.host, "port": server.port, "password": MOCK_PASSWORD},
+        options=options or {},
+        unique_id=f"{server.host}:{server.port}",
+    )
+    entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return entry
+
+
+async def _receive(client: Any, count: int) -> list[dict[str, Any]]:
+    """Receive ``count`` stats events of a subscription."""
+    async with asyncio.timeout(5):
+        return [(await client.receive_json())["event"] for _ in range(count)]
+
+
+async def _unsubscribe(client: Any) -> None:
+    """End the stats subscription, skipping events still in flight."""
+    await client.send_json_auto_id({"type": "unsubscribe_events", "subscription": 1})
+    async with asyncio.timeout(5):
+        while (response := await client.receive_json())["type"] != "result":
+            pass
+    assert response["success"]
+
+
+async def test_subscribers_share_one_sampler(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, fake_obs: FakeOBSServer
+) -> None:
+    """Test subscribers at different rates are served by one sampling loop."""
+    fake_obs.state.stream_active = True
+    fake_obs.state.stream_bytes = 1_000_000
+    fake_obs.state.stream_duration = 10_000
+    entry = await _setup_integration(hass, fake_obs)
+    sampler = entry.runtime_data.stats
+    fast = await hass_ws_client(hass)
+    slow = await hass_ws_client(hass)
+
+    await fast.send_json_auto_id(
+        {
+            "type": "obs_websocket/subscribe_stats",
+            "config_entry_id": entry.entry_id,
+            "interval": 0.25,
+        }
+    )
+    assert (await fast.receive_json())["success"]
+    await slow.send_json_auto_id(
+        {"type": "obs_websocket/subscribe_stats", "config_entry_id": entry.entry_id}
+    )
+    assert (await slow.receive_json())["success"]
+    assert sampler.subscribers == 2
+    assert sampler.interval == 0.25
+
+    sample = (await _receive(slow, 1))[0]
+    assert sample["stream"]["output_active"] is True
+    assert sample["stats"]["active_fps"] == 60.0
+    assert set(sample["health"]) >= {"score", "congestion"}
+
+    samples = sampler.samples
+    fake_obs.state.stream_bytes += 250_000
+    fast_samples = await _receive(fast, 5)
+    # The fast subscriber is sent every sample of the shared loop
+    assert sampler.samples >= samples + 4
+    assert any(s["bitrate_kbps"] for s in fast_samples)
+    slow_sample = (await _receive(slow, 1))[0]
+    assert slow_sample["time"] > sample["time"]
+
+    await _unsubscribe(fast)
+    assert sampler.subscribers == 1
+    assert sampler.interval == 1.0
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    assert sampler.subscribers == 0
+
+
+async def test_sampling_stops_without_subscribers(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, fake_obs: FakeOBSServer
+) -> None:
+    """Test no stats are sampled once the last subscriber is gone."""
+    entry = await _setup_integration(hass, fake_obs)
+    sampler = entry.runtime_data.stats
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {
+            "type": "obs_websocket/subscribe_stats",
+            "config_entry_id": entry.entry_id,
+            "interval": 0.25,
+        }
+    )
+    assert (await client.receive_json())["success"]
+    await _receive(client, 2)
+    await _unsubscribe(client)
+
+    requests = fake_obs.requests.count("GetStats")
+    await asyncio.sleep(0.6)
+    assert fake_obs.requests.count("GetStats") == requests
+    assert sampler.subscribers == 0
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_subscribe_unknown_entry(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, fake_obs: FakeOBSServer
+) -> None:
+    """Test subscribing to an unknown entry is an error."""
+    await _setup_integration(hass, fake_obs)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "obs_websocket/subscribe_stats", "config_entry_id": "missing"}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
+async def test_subscribe_without_live_stats(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, fake_obs: FakeOBSServer
+) -> None:
+    """Test subscribing is refused while the live stats feature is off."""
+    entry = await _setup_integration(hass, fake_obs, {"features": []})
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "obs_websocket/subscribe_stats", "config_entry_id": entry.entry_id}
+    )
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_supported"
+    assert "GetStats" not in fake_obs.requests
+    await hass.config_entries.async_unload(entry.entry_id)
+
+
+async def test_unload_ends_subscriptions(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, fake_obs: FakeOBSServer
+) -> None:
+    """Test unloading the entry tells subscribers their subscription ended."""
+    entry = await _setup_integration(hass, fake_obs)
+    client = await hass_ws_client(hass)
+
+    await client.send_json_auto_id(
+        {"type": "obs_websocket/subscribe_stats", "config_entry_id": entry.entry_id}
+    )
+    assert (await client.receive_json())["success"]
+    await _receive(client, 1)
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    async with asyncio.timeout(5):
+        while (response := await client.receive_json())["type"] != "result":
+            pass
+    assert response["id"] == 1
+    assert not response["success"]
+    assert response["error"]["code"] == "not_allowed"